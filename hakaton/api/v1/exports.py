@@ -0,0 +1,134 @@
+"""
+Потоковая выгрузка списков в форматах CSV и NDJSON.
+
+Объекты читаются из БД серверным курсором (.iterator(chunk_size)),
+сериализуются пачками по EXPORT_CHUNK_SIZE и сразу отдаются клиенту,
+поэтому потребление памяти не зависит от количества строк.
+"""
+import csv
+import json
+from itertools import chain, islice
+from typing import Iterator
+
+from django.db.models import QuerySet
+from django.http import HttpRequest, QueryDict
+from rest_framework.request import Request
+from rest_framework.serializers import Serializer
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.viewsets import GenericViewSet
+
+from hakaton.app_data import EXPORT_CHUNK_SIZE
+
+# INFO: метка порядка байтов нужна, чтобы Excel распознал UTF-8.
+CSV_BOM: str = '\ufeff'
+CSV_LIST_SEPARATOR: str = '; '
+CSV_VALUE_SEPARATOR: str = ' - '
+
+
+class _Echo:
+    """Псевдо-файл для csv.writer: возвращает записанную строку."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def build_export_view(
+        viewset_class: type[GenericViewSet],
+        user,
+        query: dict[str, str],
+        ) -> GenericViewSet:
+    """
+    Создает вью-сет с GET запросом от имени пользователя с указанными
+    query параметрами. Используется для выгрузок вне HTTP запроса
+    (задачи Celery), чтобы фильтрация совпадала с выдачей API.
+    """
+    http_request: HttpRequest = HttpRequest()
+    http_request.method = 'GET'
+    http_request.GET = QueryDict(mutable=True)
+    http_request.GET.update(query)
+    request: Request = Request(http_request)
+    request.user = user
+    return viewset_class(
+        action='export',
+        args=(),
+        format_kwarg=None,
+        kwargs={},
+        request=request,
+    )
+
+
+def get_export_fields(
+        serializer_class: type[Serializer], request) -> tuple[str]:
+    """
+    Возвращает поля выгрузки для сериализаторов с SparseFieldsetMixin
+    с учетом ?fields и ?view. Для остальных сериализаторов
+    возвращает None: поля определяются по первой строке.
+    """
+    if not hasattr(serializer_class, 'get_requested_fields'):
+        return None
+    return serializer_class.get_requested_fields(request=request)
+
+
+def iter_serialized(
+        queryset: QuerySet,
+        serializer_class: type[Serializer],
+        context: dict[str, any],
+        ) -> Iterator[dict[str, any]]:
+    """
+    Возвращает генератор сериализованных объектов queryset.
+    Объекты читаются и сериализуются пачками по EXPORT_CHUNK_SIZE.
+    """
+    objects: Iterator = queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    while True:
+        chunk: list = list(islice(objects, EXPORT_CHUNK_SIZE))
+        if not chunk:
+            return
+        yield from serializer_class(
+            instance=chunk, many=True, context=context,
+        ).data
+
+
+def _to_csv_value(value: any) -> any:
+    """
+    Приводит вложенные значения к одной ячейке CSV:
+    словари - к значениям без id через ' - ', списки - через '; '.
+    """
+    if isinstance(value, dict):
+        return CSV_VALUE_SEPARATOR.join(
+            str(item) for key, item in value.items()
+            if key != 'id' and item is not None
+        )
+    if isinstance(value, list):
+        return CSV_LIST_SEPARATOR.join(
+            str(_to_csv_value(value=item)) for item in value
+        )
+    return value
+
+
+def stream_csv(
+        rows: Iterator[dict[str, any]],
+        fields: tuple[str] = None,
+        ) -> Iterator[str]:
+    """
+    Возвращает генератор строк CSV с заголовком из fields.
+    Если fields не переданы, используются ключи первой строки.
+    """
+    writer = csv.writer(_Echo())
+    rows: Iterator[dict[str, any]] = iter(rows)
+    if fields is None:
+        first_row: dict[str, any] = next(rows, None)
+        if first_row is None:
+            return
+        fields: tuple[str] = tuple(first_row)
+        rows = chain((first_row,), rows)
+    yield CSV_BOM + writer.writerow(fields)
+    for row in rows:
+        yield writer.writerow(
+            _to_csv_value(value=row.get(field)) for field in fields
+        )
+
+
+def stream_ndjson(rows: Iterator[dict[str, any]]) -> Iterator[str]:
+    """Возвращает генератор строк NDJSON: один объект JSON в строке."""
+    for row in rows:
+        yield json.dumps(row, cls=JSONEncoder, ensure_ascii=False) + '\n'
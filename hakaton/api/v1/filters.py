@@ -1,7 +1,7 @@
 from django.db.models import QuerySet
 from rest_framework.filters import BaseFilterBackend
 
-from api.v1.validatiors import validate_date
+from api.v1.validatiors import validate_boolean, validate_date
 
 
 class TaskMonthFilter(BaseFilterBackend):
@@ -38,3 +38,28 @@ class TaskMonthFilter(BaseFilterBackend):
             'date__day', flat=True
         ).distinct()
         return days_with_tasks
+
+
+class VacancyStatusFilter(BaseFilterBackend):
+    """
+    Фильтр query параметров "archived" и "template" для VacancyViewSet:
+    возвращает вакансии с соответствующими значениями is_archived
+    и is_template. Возвращает ValidationError, если значение
+    не логическое.
+    """
+    # INFO: фильтрация по hr и is_archived с сортировкой по id
+    #       использует индекс vacancy_hr_archived_idx.
+    query_fields: dict[str, str] = {
+        'archived': 'is_archived',
+        'template': 'is_template',
+    }
+
+    def filter_queryset(self, request, queryset, view):
+        for param, field in self.query_fields.items():
+            value: str = request.query_params.get(param)
+            if value is None:
+                continue
+            queryset: QuerySet = queryset.filter(
+                **{field: validate_boolean(value=value)}
+            )
+        return queryset
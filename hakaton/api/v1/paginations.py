@@ -0,0 +1,228 @@
+from bisect import bisect_left, bisect_right
+import json
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Model, Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination
+from rest_framework.serializers import ValidationError
+
+from hakaton.app_data import (
+    STUDENT_PAGE_SIZE, STUDENT_PAGE_SIZE_MAX, VACANCY_ORDERINGS,
+    VACANCY_PAGE_SIZE, VACANCY_PAGE_SIZE_MAX,
+)
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Постраничный вывод по курсору с позицией по всем полям сортировки.
+
+    CursorPagination строит курсор по первому полю сортировки,
+    а объекты с одинаковым значением пропускает смещением (offset),
+    которое ограничено offset_cutoff: при большом количестве одинаковых
+    значений (например, оценок соответствия) страницы начинают
+    повторяться, а каждая следующая страница дороже предыдущей.
+    Здесь курсор хранит значения всех полей сортировки крайнего объекта
+    страницы, и следующая страница выбирается условием
+    (a < A) OR (a = A AND id < ID) без смещения. Последним полем
+    сортировки должно быть уникальное поле (id), значения полей
+    не должны быть NULL.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        reverse: bool = self.cursor is not None and self.cursor.reverse
+        ordering: tuple[str] = self.ordering
+        if reverse:
+            ordering: tuple[str] = tuple(
+                order[1:] if order.startswith('-') else f'-{order}'
+                for order in ordering
+            )
+        queryset: QuerySet = queryset.order_by(*ordering)
+        results: list[Model] = self._get_results(
+            queryset=queryset,
+            ordering=ordering,
+        )
+        self.page: list[Model] = results[:self.page_size]
+        has_more: bool = len(results) > self.page_size
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.cursor is not None
+        if self.page:
+            self.previous_position: str = self._get_position_from_instance(
+                instance=self.page[0], ordering=self.ordering,
+            )
+            self.next_position: str = self._get_position_from_instance(
+                instance=self.page[-1], ordering=self.ordering,
+            )
+        else:
+            self.previous_position = self.next_position = (
+                self.cursor.position if self.cursor is not None else None
+            )
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def get_next_link(self) -> str:
+        if not self.has_next:
+            return None
+        return self.encode_cursor(
+            Cursor(offset=0, reverse=False, position=self.next_position)
+        )
+
+    def get_previous_link(self) -> str:
+        if not self.has_previous:
+            return None
+        return self.encode_cursor(
+            Cursor(offset=0, reverse=True, position=self.previous_position)
+        )
+
+    def _get_results(
+            self, queryset: QuerySet, ordering: tuple[str]) -> list[Model]:
+        """
+        Возвращает page_size + 1 объектов, следующих за позицией курсора
+        в порядке ordering: лишний объект означает, что страница
+        не последняя.
+        """
+        if self.cursor is not None:
+            queryset: QuerySet = self._filter_by_position(
+                queryset=queryset,
+                ordering=ordering,
+            )
+        return list(queryset[:self.page_size + 1])
+
+    def _filter_by_position(
+            self, queryset: QuerySet, ordering: tuple[str]) -> QuerySet:
+        """
+        Оставляет объекты, следующие за позицией курсора в порядке
+        ordering: (a > A) OR (a = A AND b > B) OR ... (для полей
+        с убыванием - '<').
+        """
+        try:
+            position: list = json.loads(self.cursor.position)
+            if (not isinstance(position, list)
+                    or len(position) != len(ordering)):
+                raise ValueError
+            condition: Q = Q()
+            equal: Q = Q()
+            for order, value in zip(ordering, position):
+                field: str = order.lstrip('-')
+                lookup: str = 'lt' if order.startswith('-') else 'gt'
+                condition |= equal & Q(**{f'{field}__{lookup}': value})
+                equal &= Q(**{field: value})
+            return queryset.filter(condition)
+        except (DjangoValidationError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _get_position_from_instance(
+            self, instance: Model, ordering: tuple[str]) -> str:
+        """
+        Возвращает значения всех полей сортировки объекта в JSON.
+        Дата и время сохраняются строкой без потери микросекунд.
+        """
+        return json.dumps(
+            [
+                instance[order.lstrip('-')] if isinstance(instance, dict)
+                else getattr(instance, order.lstrip('-'))
+                for order in ordering
+            ],
+            default=str,
+        )
+
+
+class StudentCursorPagination(KeysetCursorPagination):
+    """
+    Постраничный вывод списка студентов по курсору.
+    Следующая страница выбирается условием по значениям сортировки
+    последнего студента страницы (WHERE id < N), поэтому ее стоимость
+    не зависит от номера страницы, а общее количество (COUNT)
+    не вычисляется.
+
+    По умолчанию студенты сортируются по убыванию id. Если queryset
+    уже отсортирован (ранжирование по вакансии - по score и id,
+    полнотекстовый поиск - по rank и id), курсор строится по этой
+    сортировке.
+    """
+    ordering = '-id'
+    page_size = STUDENT_PAGE_SIZE
+    page_size_query_param = 'limit'
+    max_page_size = STUDENT_PAGE_SIZE_MAX
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.matched_ids: list[int] = getattr(view, 'matched_ids', None)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_ordering(self, request, queryset, view) -> tuple[str]:
+        if queryset.query.order_by:
+            return tuple(queryset.query.order_by)
+        return super().get_ordering(request, queryset, view)
+
+    def _get_results(
+            self, queryset: QuerySet, ordering: tuple[str]) -> list[Model]:
+        """
+        Если вью передала отсортированный по возрастанию список ID
+        кандидатов (matched_ids), ID страницы выбираются из него
+        двоичным поиском позиции курсора, и в БД передается только
+        page_size + 1 ID, а не весь список.
+        """
+        if self.matched_ids is None:
+            return super()._get_results(queryset=queryset, ordering=ordering)
+        ids: list[int] = self.matched_ids
+        size: int = self.page_size + 1
+        if self.cursor is None:
+            page_ids: list[int] = ids[-size:]
+        else:
+            try:
+                position: list = json.loads(self.cursor.position)
+                if (not isinstance(position, list) or len(position) != 1
+                        or not isinstance(position[0], int)):
+                    raise ValueError
+            except (TypeError, ValueError):
+                raise NotFound(self.invalid_cursor_message)
+            if ordering == ('-id',):
+                end: int = bisect_left(ids, position[0])
+                page_ids: list[int] = ids[max(end - size, 0):end]
+            else:
+                start: int = bisect_right(ids, position[0])
+                page_ids: list[int] = ids[start:start + size]
+        if not page_ids:
+            return []
+        return list(queryset.filter(id__in=page_ids).order_by(*ordering))
+
+
+class VacancyCursorPagination(KeysetCursorPagination):
+    """
+    Постраничный вывод списка вакансий по курсору.
+    По умолчанию вакансии сортируются по убыванию id, query параметр
+    'ordering' позволяет сортировать по дате публикации
+    (pub_datetime или -pub_datetime).
+    """
+    ordering = '-id'
+    page_size = VACANCY_PAGE_SIZE
+    page_size_query_param = 'limit'
+    max_page_size = VACANCY_PAGE_SIZE_MAX
+
+    def get_ordering(self, request, queryset, view) -> tuple[str]:
+        ordering: str = request.query_params.get('ordering')
+        if ordering is None:
+            return super().get_ordering(request, queryset, view)
+        if ordering not in VACANCY_ORDERINGS:
+            raise ValidationError(
+                {"Bad Request.": (
+                    'Сортировка должна быть одной из: '
+                    f'{", ".join(VACANCY_ORDERINGS)}.'
+                )}
+            )
+        if ordering == self.ordering:
+            return (ordering,)
+        # INFO: id добавляется для однозначного порядка вакансий
+        #       с одинаковой датой публикации.
+        return (ordering, ordering.replace('pub_datetime', 'id'))
@@ -0,0 +1,107 @@
+"""
+Заранее сериализованные ответы API для редко изменяемых данных.
+
+Ответ сериализуется в JSON один раз на версию данных и хранится в кеше
+вместе с ETag (хешем содержимого) и копией, сжатой gzip. Версия
+увеличивается сигналами при изменении моделей (см. hakaton.cache_versions),
+поэтому повторный запрос клиента с заголовком If-None-Match стоит одного
+обращения к кешу и возвращает 304 Not Modified, а клиенты с заголовком
+Accept-Encoding: gzip получают заранее сжатый ответ.
+"""
+import gzip
+from hashlib import sha1
+from typing import Callable
+
+from django.core.cache import cache
+from django.http import HttpResponse, HttpResponseNotModified
+from django.middleware.gzip import re_accepts_gzip
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+from rest_framework.renderers import JSONRenderer
+
+from api.v1.serializers import SkillCategorySerializer
+from hakaton.app_data import PAYLOAD_CACHE_TIMEOUT, PAYLOAD_GZIP_MIN_LEN
+from hakaton.cache_versions import bump_version, get_version
+from vacancy.models import SkillCategory
+
+DICTIONARIES_VERSION_KEY: str = 'dictionaries_version'
+SKILL_CATEGORIES_VERSION_KEY: str = 'skill_categories_version'
+
+
+def build_skill_categories() -> list[dict[str, any]]:
+    """Сериализует навыки, сгруппированные по категориям."""
+    return SkillCategorySerializer(
+        SkillCategory.objects.prefetch_related('skill'), many=True
+    ).data
+
+
+def get_payload(
+        version_key: str,
+        build: Callable[[], any],
+        ) -> tuple[str, bytes, bytes]:
+    """
+    Возвращает ETag, JSON ответа и JSON, сжатый gzip (или None, если
+    ответ слишком короткий), для текущей версии данных.
+    Если ответа для этой версии нет в кеше, формирует его функцией build.
+    """
+    version: int = get_version(key=version_key)
+    cache_key: str = f'{version_key}:{version}:payload'
+    payload: tuple[str, bytes, bytes] = cache.get(cache_key)
+    if payload is None:
+        content: bytes = JSONRenderer().render(build())
+        etag: str = sha1(content).hexdigest()
+        gzip_content: bytes = None
+        if len(content) >= PAYLOAD_GZIP_MIN_LEN:
+            # INFO: mtime=0, чтобы сжатый ответ не зависел от времени.
+            gzip_content: bytes = gzip.compress(content, mtime=0)
+        payload: tuple[str, bytes, bytes] = (etag, content, gzip_content)
+        cache.set(cache_key, payload, timeout=PAYLOAD_CACHE_TIMEOUT)
+    return payload
+
+
+def get_payload_response(
+        request, version_key: str, build: Callable[[], any]) -> HttpResponse:
+    """
+    Возвращает ответ с заранее сериализованным JSON и заголовком ETag.
+    Если клиент принимает gzip, возвращает заранее сжатый JSON.
+    Если ETag совпадает с заголовком запроса If-None-Match,
+    возвращает 304 без тела ответа.
+    """
+    etag, content, gzip_content = get_payload(
+        version_key=version_key, build=build,
+    )
+    use_gzip: bool = gzip_content is not None and bool(
+        re_accepts_gzip.search(request.headers.get('Accept-Encoding', ''))
+    )
+    # INFO: у сжатого и несжатого ответа разные ETag, но при проверке
+    #       If-None-Match подходит любой из них.
+    etags: tuple[str] = (f'"{etag}"', f'"{etag}-gzip"')
+    if_none_match: list[str] = parse_etags(
+        request.headers.get('If-None-Match', '')
+    )
+    if '*' in if_none_match or set(etags) & set(if_none_match):
+        response: HttpResponse = HttpResponseNotModified()
+    elif use_gzip:
+        response: HttpResponse = HttpResponse(
+            gzip_content, content_type='application/json',
+        )
+        response['Content-Encoding'] = 'gzip'
+    else:
+        response: HttpResponse = HttpResponse(
+            content, content_type='application/json',
+        )
+    response['ETag'] = etags[1] if use_gzip else etags[0]
+    patch_vary_headers(response, ('Accept-Encoding',))
+    # INFO: клиент может хранить ответ, но должен проверять его актуальность.
+    response['Cache-Control'] = 'no-cache'
+    return response
+
+
+def rebuild_payload(version_key: str, build: Callable[[], any]) -> None:
+    """
+    Сбрасывает сохраненный ответ во всех процессах и сразу формирует
+    новый, чтобы первый запрос после изменения данных не ждал его.
+    """
+    bump_version(key=version_key)
+    get_payload(version_key=version_key, build=build)
+    return
@@ -0,0 +1,107 @@
+"""
+Планировщик подгрузки связанных объектов для сериализаторов.
+
+По запрошенным полям сериализатора определяет, какие связи нужно
+подгрузить заранее, чтобы количество SQL запросов не зависело
+от количества объектов в ответе:
+    - вложенный сериализатор со связью ForeignKey/OneToOne -
+      select_related (вместе со связями вложенного сериализатора);
+    - вложенный сериализатор с many=True по обратной связи
+      или ManyToMany - Prefetch с queryset, подготовленным
+      по полям вложенного сериализатора;
+    - связи, которые сериализатор читает сам (SerializerMethodField,
+      to_representation), объявляются в Meta:
+        - select_related_fields: {поле: (связи для select_related)}
+        - prefetch_related_fields: {поле: (связи для prefetch_related)}
+
+Связанные справочники (города, навыки, языки и т.д.) обычно берутся
+из кеша справочников (vacancy.reference_cache) и подгрузки не требуют.
+"""
+from typing import Union
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, Prefetch, QuerySet
+from rest_framework.serializers import BaseSerializer, ListSerializer
+
+
+def _get_relation(model: type[Model], source: str):
+    """Возвращает поле связи модели по source или None."""
+    if '.' in source or source == '*':
+        return None
+    try:
+        field = model._meta.get_field(source)
+    except FieldDoesNotExist:
+        return None
+    return field if field.is_relation else None
+
+
+def plan_related(
+        serializer: BaseSerializer,
+        fields: tuple[str] = None,
+        ) -> tuple[list[str], list[Union[str, Prefetch]]]:
+    """
+    Возвращает связи для select_related и prefetch_related,
+    необходимые для вывода полей fields (по умолчанию - всех полей)
+    сериализатора serializer.
+    """
+    meta = serializer.Meta
+    model: type[Model] = meta.model
+    if fields is None:
+        fields: tuple[str] = tuple(serializer.fields)
+    select_related: list[str] = []
+    prefetch_related: list[Union[str, Prefetch]] = []
+    for field_name in fields:
+        select_related.extend(
+            getattr(meta, 'select_related_fields', {}).get(field_name, ())
+        )
+        prefetch_related.extend(
+            getattr(meta, 'prefetch_related_fields', {}).get(field_name, ())
+        )
+        field = serializer.fields.get(field_name)
+        if not isinstance(field, BaseSerializer):
+            continue
+        relation = _get_relation(model=model, source=field.source)
+        if relation is None:
+            continue
+        if isinstance(field, ListSerializer):
+            child: BaseSerializer = field.child
+            prefetch_related.append(
+                Prefetch(
+                    field.source,
+                    queryset=apply_related(
+                        queryset=child.Meta.model.objects.all(),
+                        serializer=child,
+                    ),
+                )
+            )
+            continue
+        child_select, child_prefetch = plan_related(serializer=field)
+        select_related.append(field.source)
+        select_related.extend(
+            f'{field.source}__{lookup}' for lookup in child_select
+        )
+        prefetch_related.extend(
+            Prefetch(
+                f'{field.source}__{lookup.prefetch_through}',
+                queryset=lookup.queryset,
+            ) if isinstance(lookup, Prefetch)
+            else f'{field.source}__{lookup}'
+            for lookup in child_prefetch
+        )
+    return select_related, prefetch_related
+
+
+def apply_related(
+        queryset: QuerySet,
+        serializer: BaseSerializer,
+        fields: tuple[str] = None,
+        ) -> QuerySet:
+    """Подгружает в queryset связи, необходимые для полей сериализатора."""
+    select_related, prefetch_related = plan_related(
+        serializer=serializer, fields=fields,
+    )
+    if select_related:
+        queryset: QuerySet = queryset.select_related(*select_related)
+    if prefetch_related:
+        queryset: QuerySet = queryset.prefetch_related(*prefetch_related)
+    return queryset
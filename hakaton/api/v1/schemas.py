@@ -1,9 +1,18 @@
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema, OpenApiParameter
-from rest_framework.serializers import CharField, ListField, ModelSerializer
+from rest_framework.serializers import (
+    CharField, IntegerField, ListField, ModelSerializer, Serializer,
+)
 
 from api.v1.serializers import (
+    CitySerializer, CurrencySerializer, EmploymentSerializer,
+    ExperienceSerializer, LanguageSerializer, LanguageLevelSerializer,
+    ScheduleSerializer, SkillSerializer, SkillCategorySerializer,
     UserRegisterSerializer, UserUpdateSerializer, VacancySerializer,
 )
+from hakaton.app_data import (
+    EXPORT_FORMATS, VACANCY_BULK_MAX_LEN, VACANCY_ORDERINGS,
+)
 from vacancy.models import Employment, Schedule, Skill, VacancyLanguage
 
 
@@ -70,6 +79,64 @@ class VacancyResponseSchemaSerializer(VacancySerializer):
     skills = ListField(child=VacancySkillSerializer())
 
 
+class VacancyMatchesSchemaSerializer(Serializer):
+    """
+    Сериализатор используется для описания в drf_spectacular
+    ответа эндпоинта подходящих кандидатов для нескольких вакансий.
+    """
+    vacancy = IntegerField()
+    count = IntegerField()
+    students = ListField(child=IntegerField())
+
+
+class DictionariesSchemaSerializer(Serializer):
+    """
+    Сериализатор используется для описания в drf_spectacular
+    ответа эндпоинта всех справочников.
+    """
+    cities = CitySerializer(many=True)
+    currencies = CurrencySerializer(many=True)
+    employments = EmploymentSerializer(many=True)
+    experiences = ExperienceSerializer(many=True)
+    languages = LanguageSerializer(many=True)
+    language_levels = LanguageLevelSerializer(many=True)
+    schedules = ScheduleSerializer(many=True)
+    skills = SkillSerializer(many=True)
+    skill_categories = SkillCategorySerializer(many=True)
+
+
+class FacetSchemaSerializer(Serializer):
+    """
+    Вспомогательный сериализатор для StudentFacetsSchemaSerializer.
+    Показывает структуру количества кандидатов для одного значения фильтра.
+    """
+    id = IntegerField()
+    count = IntegerField()
+
+
+class LanguageFacetSchemaSerializer(Serializer):
+    """
+    Вспомогательный сериализатор для StudentFacetsSchemaSerializer.
+    Показывает структуру количества кандидатов для языка и уровня владения.
+    """
+    language = IntegerField()
+    level = IntegerField()
+    count = IntegerField()
+
+
+class StudentFacetsSchemaSerializer(Serializer):
+    """
+    Сериализатор используется для описания в drf_spectacular
+    ответа эндпоинта количества кандидатов по значениям фильтров.
+    """
+    cities = ListField(child=FacetSchemaSerializer())
+    employments = ListField(child=FacetSchemaSerializer())
+    experiences = ListField(child=FacetSchemaSerializer())
+    languages = ListField(child=LanguageFacetSchemaSerializer())
+    schedules = ListField(child=FacetSchemaSerializer())
+    skills = ListField(child=FacetSchemaSerializer())
+
+
 class LanguageLevelSerializer(ModelSerializer):
     """
     Вспомогательный сериализатор для VacancyRequestSchemaSerializer.
@@ -90,18 +157,42 @@ class VacancyRequestSchemaSerializer(VacancySerializer):
     languages = ListField(child=LanguageLevelSerializer())
 
 
+SPARSE_FIELDSET_PARAMETERS: list[OpenApiParameter] = [
+        OpenApiParameter(
+            name='fields',
+            location=OpenApiParameter.QUERY,
+            description=(
+                'перечень полей ответа в формате id,name,...; '
+                'остальные поля не выбираются из БД'
+            ),
+            required=False,
+            type=str,
+        ),
+        OpenApiParameter(
+            name='view',
+            location=OpenApiParameter.QUERY,
+            description=(
+                'при значении compact возвращает сокращенный набор полей'
+            ),
+            required=False,
+            type=str,
+        ),
+]
+
 CITY_VIEW_SCHEMA: dict[str, str] = {
     'description': (
         'Возвращает список городов.  '
         'При передачи необязательного query параметра search возвращает '
-        'список городов, которые начинаются с указанных букв.'
+        'до 20 городов, название которых начинается с указанных букв, '
+        'содержит их или отличается от них одной опечаткой (без учета '
+        'регистра). Сначала выводятся наиболее популярные.'
     ),
     'summary': 'Получить список городов.',
     'parameters': [
         OpenApiParameter(
             name='search',
             location=OpenApiParameter.QUERY,
-            description='Название навыка.',
+            description='Название города.',
             required=False,
             type=str,
         ),
@@ -113,6 +204,21 @@ CURRENCY_VIEW_SCHEMA: dict[str, str] = {
     'summary': 'Получить список валюты.',
 }
 
+DICTIONARIES_VIEW_SCHEMA: dict[str, str] = {
+    'description': (
+        'Возвращает все справочники (города, валюты, форматы работы, '
+        'опыт работы, языки, уровни владения языками, графики работы, '
+        'навыки и навыки по категориям) одним ответом. Ответ содержит '
+        'заголовок ETag; при передаче его в заголовке If-None-Match '
+        'возвращается 304, если справочники не изменились.'
+    ),
+    'summary': 'Получить все справочники.',
+    'responses': {
+        200: DictionariesSchemaSerializer,
+        304: None,
+    },
+}
+
 EMPLOYMENT_VIEW_SCHEMA: dict[str, str] = {
     'description': 'Возвращает список форматов работы.',
     'summary': 'Получить список форматов работы.',
@@ -123,6 +229,39 @@ EXPERIENCE_VIEW_SCHEMA: dict[str, str] = {
     'summary': 'Получить список сроков опыта работы.',
 }
 
+EXPORT_JOB_VIEW_SCHEMA: dict[str, str] = {
+    'create': extend_schema(
+        description=(
+            'Создает фоновую выгрузку кандидатов (kind=students), '
+            'вакансий (kind=vacancies) или задач календаря (kind=tasks) '
+            'пользователя в файл CSV, сжатый gzip. В поле query передаются '
+            'query параметры соответствующего списка API, например '
+            '{"from_vacancy": "1", "fields": "id,first_name"}. '
+            'Статус и ссылку на файл можно получить по id выгрузки.'
+        ),
+        summary='Создать фоновую выгрузку.',
+    ),
+    'download': extend_schema(
+        description=(
+            'Возвращает файл выгрузки (CSV, сжатый gzip). Доступно только '
+            'автору выгрузки и только после ее завершения (status=done).'
+        ),
+        responses={(200, 'application/gzip'): OpenApiTypes.BINARY},
+        summary='Скачать файл выгрузки.',
+    ),
+    'list': extend_schema(
+        description='Возвращает список выгрузок пользователя.',
+        summary='Получить список выгрузок пользователя.',
+    ),
+    'retrieve': extend_schema(
+        description=(
+            'Возвращает статус выгрузки (pending, running, done, failed) '
+            'и ссылку на файл, когда он сформирован.'
+        ),
+        summary='Получить статус выгрузки.',
+    ),
+}
+
 LANGUAGE_VIEW_SCHEMA: dict[str, str] = {
     'description': 'Возвращает список разговорных языков.',
     'summary': 'Получить список разговорных языков.',
@@ -140,6 +279,107 @@ SCHEDULE_VIEW_SCHEMA: dict[str, str] = {
     'summary': 'Получить список графиков работы.',
 }
 
+STUDENT_FILTER_PARAMETERS: list[OpenApiParameter] = [
+        OpenApiParameter(
+            name='city',
+            location=OpenApiParameter.QUERY,
+            description='id города вакансии',
+            required=False,
+            type=int,
+        ),
+        OpenApiParameter(
+            name='employment',
+            location=OpenApiParameter.QUERY,
+            description='типа занятости',
+            required=False,
+            type=int,
+        ),
+        OpenApiParameter(
+            name='experience',
+            location=OpenApiParameter.QUERY,
+            description='id опыта работы',
+            required=False,
+            type=int,
+        ),
+        OpenApiParameter(
+            name='languages',
+            location=OpenApiParameter.QUERY,
+            description=(
+                'перечень id языков и id уровня владения ими '
+                'в формате 1-2,2-3,...'
+            ),
+            required=False,
+            type=int,
+        ),
+        OpenApiParameter(
+            name='schedule',
+            location=OpenApiParameter.QUERY,
+            description='id графика работы',
+            required=False,
+            type=int,
+        ),
+        OpenApiParameter(
+            name='search',
+            location=OpenApiParameter.QUERY,
+            description=(
+                'полнотекстовый поиск по специализации и разделам '
+                '"Обо мне", "Об опыте", "Об образовании"'
+            ),
+            required=False,
+            type=str,
+        ),
+        OpenApiParameter(
+            name='skills',
+            location=OpenApiParameter.QUERY,
+            description='перечень id навыков в формате 1,2,...',
+            required=False,
+            type=int,
+        ),
+]
+
+STUDENT_LIST_PARAMETERS: list[OpenApiParameter] = [
+        *STUDENT_FILTER_PARAMETERS,
+        OpenApiParameter(
+            name='from_vacancy',
+            location=OpenApiParameter.QUERY,
+            description='id вакансии, выдает релевантных ей кандидатов',
+            required=False,
+            type=int,
+        ),
+        OpenApiParameter(
+            name='mode',
+            location=OpenApiParameter.QUERY,
+            description=(
+                'при значении ranked вместе с from_vacancy возвращает '
+                'кандидатов с наибольшей оценкой соответствия вакансии '
+                '(поле score), в том числе частично подходящих'
+            ),
+            required=False,
+            type=str,
+        ),
+        OpenApiParameter(
+            name='unwatched',
+            location=OpenApiParameter.QUERY,
+            description=(
+                'при значении 1 возвращает только непросмотренных '
+                'кандидатов (при from_vacancy - в рамках вакансии)'
+            ),
+            required=False,
+            type=int,
+        ),
+        OpenApiParameter(
+            name='watched',
+            location=OpenApiParameter.QUERY,
+            description=(
+                'при значении 1 возвращает только просмотренных '
+                'кандидатов (при from_vacancy - в рамках вакансии)'
+            ),
+            required=False,
+            type=int,
+        ),
+        *SPARSE_FIELDSET_PARAMETERS,
+]
+
 STUDENT_VIEW_SCHEMA: dict[str, str] = {
     'list': extend_schema(
         description=(
@@ -150,84 +390,86 @@ STUDENT_VIEW_SCHEMA: dict[str, str] = {
             'При передачи необязательных query параметров требований вакансии '
             'возвращает список кандидатов, полностью им удовлетворяющих.'
             'При передачи и ?from_vacancy и параметров вакансии ?from_vacancy '
-            'будет в приоритете.'
+            'будет в приоритете. '
+            'Список выводится постранично: количество кандидатов на странице '
+            'задается параметром ?limit (по умолчанию 50, не более 200), '
+            'следующая страница доступна по ссылке next.'
         ),
         summary='Получить список кандидатов с кратким перечнем полей.',
-        parameters=[
-            OpenApiParameter(
-                name='city',
-                location=OpenApiParameter.QUERY,
-                description='id города вакансии',
-                required=False,
-                type=int,
-            ),
-            OpenApiParameter(
-                name='employment',
-                location=OpenApiParameter.QUERY,
-                description='типа занятости',
-                required=False,
-                type=int,
-            ),
-            OpenApiParameter(
-                name='from_vacancy',
-                location=OpenApiParameter.QUERY,
-                description='id вакансии, выдает релевантных ей кандидатов',
-                required=False,
-                type=int,
-            ),
-            OpenApiParameter(
-                name='experience',
-                location=OpenApiParameter.QUERY,
-                description='id опыта работы',
-                required=False,
-                type=int,
-            ),
-            OpenApiParameter(
-                name='language',
-                location=OpenApiParameter.QUERY,
-                description=(
-                    'перечень id языков и id уровня владения ими '
-                    'в формате 1-2,2-3,...'
-                ),
-                required=False,
-                type=int,
-            ),
-            OpenApiParameter(
-                name='schedule',
-                location=OpenApiParameter.QUERY,
-                description='id графика работы',
-                required=False,
-                type=int,
-            ),
-            OpenApiParameter(
-                name='skill',
-                location=OpenApiParameter.QUERY,
-                description='перечень id навыков',
-                required=False,
-                type=int,
-            ),
-        ],
+        parameters=STUDENT_LIST_PARAMETERS,
     ),
     'retrieve': extend_schema(
         description=(
             'Возвращает кандидата с указанным идентификатором.'
         ),
         summary='Получить кандидата.',
+        parameters=SPARSE_FIELDSET_PARAMETERS,
     ),
 }
 
+STUDENT_EXPORT_SCHEMA: dict[str, str] = {
+    'description': (
+        'Выгружает всех кандидатов, подходящих под query параметры '
+        '(как в списке кандидатов, без постраничного вывода), '
+        'в формате CSV или NDJSON. Ответ передается потоком.'
+    ),
+    'summary': 'Выгрузить список кандидатов.',
+    'parameters': [
+        *STUDENT_LIST_PARAMETERS,
+        OpenApiParameter(
+            name='export_format',
+            location=OpenApiParameter.QUERY,
+            description='формат выгрузки: csv (по умолчанию) или ndjson',
+            required=False,
+            type=str,
+            enum=EXPORT_FORMATS,
+        ),
+    ],
+    'responses': {
+        (200, 'text/csv'): OpenApiTypes.STR,
+        (200, 'application/x-ndjson'): OpenApiTypes.STR,
+    },
+}
+
+STUDENT_FACETS_SCHEMA: dict[str, str] = {
+    'description': (
+        'Возвращает количество кандидатов, подходящих под необязательные '
+        'query параметры требований вакансии, в разрезе городов, сроков '
+        'опыта работы, типов занятости, графиков работы, навыков '
+        'и уровней владения языками.'
+    ),
+    'summary': 'Получить количество кандидатов по значениям фильтров.',
+    'parameters': STUDENT_FILTER_PARAMETERS,
+    'responses': StudentFacetsSchemaSerializer,
+}
+
 STUDENT_MARK_WATCHED_SCHEMA: dict[str, str] = {
-    'description': 'Отметить кандидата как "просмотрено".',
+    'description': (
+        'Отметить кандидата как "просмотрено". '
+        'При передаче необязательного query параметра vacancy кандидат '
+        'отмечается просмотренным в рамках указанной вакансии.'
+    ),
     'summary': 'Отметить кандидата как "просмотрено".',
     'responses': None,
     'request': None,
+    'parameters': [
+        OpenApiParameter(
+            name='vacancy',
+            location=OpenApiParameter.QUERY,
+            description='id вакансии пользователя',
+            required=False,
+            type=int,
+        ),
+    ],
 }
 
 SKILL_SEARCH_VIEW_SCHEMA: dict[str, str] = {
     'description': (
         'Возвращает список навыков. '
         'При передачи необязательного query параметра search возвращает '
-        'список навыков, которые начинаются с указанных букв.'
+        'до 20 навыков, название которых начинается с указанных букв, '
+        'содержит их или отличается от них одной опечаткой (без учета '
+        'регистра). Сначала выводятся наиболее популярные.'
     ),
     'summary': 'Получить список навыков.',
     'parameters': [
@@ -242,8 +484,16 @@ SKILL_SEARCH_VIEW_SCHEMA: dict[str, str] = {
 }
 
 SKILL_CATEGORY_VIEW_SCHEMA: dict[str, str] = {
-    'description': 'Возвращает список категорий навыков с перечнем навыков.',
+    'description': (
+        'Возвращает список категорий навыков с перечнем навыков. '
+        'Ответ содержит заголовок ETag; при передаче его в заголовке '
+        'If-None-Match возвращается 304, если навыки не изменились.'
+    ),
     'summary': 'Получить категории навыков с перечнем навыков.',
+    'responses': {
+        200: SkillCategorySerializer(many=True),
+        304: None,
+    },
 }
 
 TASK_VIEW_SCHEMA: dict[str, str] = {
@@ -326,6 +576,67 @@ USER_ME_SCHEMA: dict[str, str] = {
     'summary': 'Получить авторизированного пользователя.',
 }
 
+VACANCY_BULK_SCHEMA: dict[str, str] = {
+    'description': (
+        'Создает сразу несколько вакансий пользователя '
+        f'(не более {VACANCY_BULK_MAX_LEN}) в одной транзакции. '
+        'Если хотя бы одна вакансия некорректна, не создается ни одна, '
+        'а ошибки возвращаются списком по порядку вакансий '
+        '(пустой объект - для корректных).'
+    ),
+    'summary': 'Создать несколько вакансий пользователя.',
+    'request': VacancyRequestSchemaSerializer(many=True),
+    'responses': VacancyResponseSchemaSerializer(many=True),
+}
+
+VACANCY_MATCHES_SCHEMA: dict[str, str] = {
+    'description': (
+        'Возвращает для нескольких вакансий пользователя количество и '
+        'перечень id полностью подходящих кандидатов. '
+        'При передаче необязательного query параметра ids возвращает '
+        'данные для указанных вакансий, иначе - для всех неархивных.'
+    ),
+    'summary': 'Получить подходящих кандидатов для нескольких вакансий.',
+    'parameters': [
+        OpenApiParameter(
+            name='ids',
+            location=OpenApiParameter.QUERY,
+            description='перечень id вакансий в формате 1,2,...',
+            required=False,
+            type=str,
+        ),
+    ],
+    'responses': VacancyMatchesSchemaSerializer(many=True),
+}
+
+VACANCY_LIST_PARAMETERS: list[OpenApiParameter] = [
+    *SPARSE_FIELDSET_PARAMETERS,
+    OpenApiParameter(
+        name='archived',
+        location=OpenApiParameter.QUERY,
+        description='true - только архивные вакансии, false - только активные',
+        required=False,
+        type=bool,
+    ),
+    OpenApiParameter(
+        name='ordering',
+        location=OpenApiParameter.QUERY,
+        description=(
+            'сортировка: -id (по умолчанию), pub_datetime или -pub_datetime'
+        ),
+        required=False,
+        type=str,
+        enum=VACANCY_ORDERINGS,
+    ),
+    OpenApiParameter(
+        name='template',
+        location=OpenApiParameter.QUERY,
+        description='true - только шаблоны вакансий, false - без шаблонов',
+        required=False,
+        type=bool,
+    ),
+]
+
 VACANCY_VIEW_SCHEMA: dict[str, str] = {
     'create': extend_schema(
         description='Создает новую вакансию пользователя.',
@@ -334,9 +645,13 @@ VACANCY_VIEW_SCHEMA: dict[str, str] = {
         request=VacancyRequestSchemaSerializer,
     ),
     'list': extend_schema(
-        description='Возвращает список вакансий пользователя.',
+        description=(
+            'Возвращает список вакансий пользователя постранично '
+            '(по курсору, query параметры cursor и limit).'
+        ),
         summary='Получить список вакансий пользователя.',
         responses=VacancyResponseSchemaSerializer,
+        parameters=VACANCY_LIST_PARAMETERS,
     ),
     'retrieve': extend_schema(
         description=(
@@ -345,6 +660,7 @@ VACANCY_VIEW_SCHEMA: dict[str, str] = {
         summary='Получить вакансию пользователя.',
         responses=VacancyResponseSchemaSerializer,
         request=VacancyRequestSchemaSerializer,
+        parameters=SPARSE_FIELDSET_PARAMETERS,
     ),
     'partial_update': extend_schema(
         description=(
@@ -1,21 +1,127 @@
-from django.db import transaction
+from typing import Optional
+
+from django.db import IntegrityError, transaction
 from django.db.models import Model, QuerySet
 from djoser.serializers import UserCreateSerializer
 from drf_spectacular.utils import extend_schema_field
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.reverse import reverse
 from rest_framework.serializers import (
-    DictField, IntegerField, ListField,
-    ModelSerializer, SerializerMethodField,
+    CharField, DictField, IntegerField, ListField, ListSerializer,
+    ModelSerializer, PrimaryKeyRelatedField, SerializerMethodField,
     ValidationError,
 )
 
+from api.v1.prefetch import apply_related
 from student.models import (
     Student, StudentEmployment, StudentLanguage, StudentSkill,
 )
-from user.models import HrTask, User
+from hakaton.app_data import VACANCY_UNIQUE_CONSTRAINT
+from user.models import ExportJob, HrTask, User
 from vacancy.models import (
     City, Currency, Employment, Experience, Language, LanguageLevel,
-    Skill, SkillCategory, Vacancy, VacancyLanguage, VacancySkill,
+    Schedule, Skill, SkillCategory, Vacancy, VacancyLanguage, VacancySkill,
 )
+from vacancy.reference_cache import reference_caches
+from vacancy.validators import VACANCY_EXISTS_ERROR
+
+
+def is_vacancy_exists_error(error: IntegrityError) -> bool:
+    """
+    Проверяет, что ошибка вызвана уникальным индексом вакансии
+    по content_hash: PostgreSQL указывает в сообщении имя ограничения,
+    SQLite - таблицу и поле.
+    """
+    message: str = str(error)
+    return (
+        VACANCY_UNIQUE_CONSTRAINT in message
+        or f'{Vacancy._meta.db_table}.content_hash' in message
+    )
+
+
+class SparseFieldsetMixin:
+    """
+    Позволяет ограничить набор полей ответа query параметрами
+    ?fields=<поле>,<поле>,... или ?view=compact (поля Meta.compact_fields).
+
+    По тем же полям optimize_queryset выбирает из БД только нужные
+    колонки (.only()) и подгружает только нужные связанные объекты:
+    связи вложенных сериализаторов определяются автоматически, а связи,
+    которые сериализатор читает сам, объявляются в Meta
+    (см. api.v1.prefetch).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # INFO: вне HTTP запроса (фоновые выгрузки) поля передаются
+        #       в контексте сериализатора.
+        fields: tuple[str] = self.context.get('fields')
+        if fields is None:
+            request = self.context.get('request')
+            if request is None:
+                self.requested_fields: tuple[str] = None
+                return
+            fields: tuple[str] = self.get_requested_fields(request=request)
+        self.requested_fields: tuple[str] = fields
+        for field_name in set(self.fields) - set(fields):
+            self.fields.pop(field_name)
+
+    @classmethod
+    def get_extra_fields(cls, request) -> tuple[str]:
+        """
+        Возвращает поля ответа, которых нет в Meta.fields
+        (например, вычисляемые в queryset), доступные в данном запросе.
+        """
+        return ()
+
+    @classmethod
+    def get_requested_fields(cls, request) -> tuple[str]:
+        """
+        Возвращает запрошенные поля. Для небезопасных методов
+        (POST, PUT, PATCH) всегда возвращает все поля.
+        """
+        if request.method not in SAFE_METHODS:
+            return cls.Meta.fields
+        extra_fields: tuple[str] = cls.get_extra_fields(request=request)
+        fields_param: str = request.query_params.get('fields')
+        if fields_param:
+            fields: tuple[str] = tuple(
+                field.strip() for field in fields_param.split(',')
+                if field.strip()
+            )
+            unknown: set[str] = (
+                set(fields) - set(cls.Meta.fields) - set(extra_fields)
+            )
+            if unknown:
+                raise ValidationError(
+                    {"Bad Request.": (
+                        f'Неизвестные поля: {", ".join(sorted(unknown))}.'
+                    )}
+                )
+            return fields
+        if request.query_params.get('view') == 'compact':
+            return cls.Meta.compact_fields + extra_fields
+        return cls.Meta.fields + extra_fields
+
+    @classmethod
+    def optimize_queryset(cls, queryset: QuerySet, request) -> QuerySet:
+        """
+        Ограничивает queryset колонками и связанными объектами,
+        необходимыми для запрошенных полей (см. api.v1.prefetch).
+        """
+        fields: tuple[str] = cls.get_requested_fields(request=request)
+        queryset: QuerySet = apply_related(
+            queryset=queryset,
+            serializer=cls(context={'fields': fields}),
+        )
+        if request.method not in SAFE_METHODS:
+            return queryset
+        model_fields: set[str] = set(
+            field.name for field in cls.Meta.model._meta.concrete_fields
+        )
+        return queryset.only(
+            'id', *(field for field in fields if field in model_fields)
+        )
 
 
 class CitySerializer(ModelSerializer):
@@ -63,6 +169,47 @@ class ExperienceSerializer(ModelSerializer):
         )
 
 
+class ExportJobSerializer(ModelSerializer):
+    """Сериализатор представления фоновых выгрузок HR-специалиста."""
+
+    file = SerializerMethodField()
+    query = DictField(child=CharField(), required=False)
+
+    class Meta:
+        model = ExportJob
+        fields = (
+            'id',
+            'kind',
+            'query',
+            'status',
+            'file',
+            'error',
+            'created_datetime',
+            'finished_datetime',
+        )
+        read_only_fields = (
+            'id',
+            'status',
+            'error',
+            'created_datetime',
+            'finished_datetime',
+        )
+
+    def get_file(self, obj) -> Optional[str]:
+        """Возвращает ссылку на скачивание файла выгрузки владельцем."""
+        if not obj.file:
+            return None
+        return reverse(
+            'exports-download',
+            kwargs={'pk': obj.id},
+            request=self.context.get('request'),
+        )
+
+    def create(self, validated_data):
+        validated_data['hr'] = self.context['request'].user
+        return super().create(validated_data)
+
+
 class LanguageSerializer(ModelSerializer):
     """Сериализатор представления разговорных языков."""
 
@@ -85,6 +232,28 @@ class LanguageLevelSerializer(ModelSerializer):
         )
 
 
+class ReferenceRelatedField(PrimaryKeyRelatedField):
+    """
+    Поле связи по ID, которое для справочных моделей проверяет ID
+    по кешу справочников в памяти процесса, без запроса к БД.
+    """
+
+    def to_internal_value(self, data):
+        model: type[Model] = self.get_queryset().model
+        if model not in reference_caches:
+            return super().to_internal_value(data)
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            obj_id: int = int(data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        obj: Model = reference_caches[model].get(obj_id=obj_id)
+        if obj is None:
+            self.fail('does_not_exist', pk_value=data)
+        return obj
+
+
 class ScheduleSerializer(ModelSerializer):
     """Сериализатор представления графиков работы."""
 
@@ -136,10 +305,12 @@ class StudentEmploymentSerializer(ModelSerializer):
         fields = ('id', 'name',)
 
     def get_id(self, obj) -> int:
-        return obj.employment.id
+        return obj.employment_id
 
     def get_name(self, obj) -> str:
-        return obj.employment.name
+        return reference_caches[Employment].get(
+            obj_id=obj.employment_id
+        ).name
 
 
 class StudentSkillsSerializer(ModelSerializer):
@@ -154,13 +325,16 @@ class StudentSkillsSerializer(ModelSerializer):
         fields = ('id', 'skill', 'category',)
 
     def get_category(self, obj) -> str:
-        return obj.skill.category.name
+        skill: Skill = reference_caches[Skill].get(obj_id=obj.skill_id)
+        return reference_caches[SkillCategory].get(
+            obj_id=skill.category_id
+        ).name
 
     def get_id(self, obj) -> int:
-        return obj.skill.id
+        return obj.skill_id
 
     def get_skill(self, obj) -> str:
-        return obj.skill.name
+        return reference_caches[Skill].get(obj_id=obj.skill_id).name
 
 
 class StudentLanguageSerializer(ModelSerializer):
@@ -175,16 +349,16 @@ class StudentLanguageSerializer(ModelSerializer):
         fields = ('id', 'language', 'level',)
 
     def get_id(self, obj) -> int:
-        return obj.language.id
+        return obj.language_id
 
     def get_language(self, obj) -> str:
-        return obj.language.name
+        return reference_caches[Language].get(obj_id=obj.language_id).name
 
     def get_level(self, obj) -> str:
-        return obj.level.name
+        return reference_caches[LanguageLevel].get(obj_id=obj.level_id).name
 
 
-class StudentSerializer(ModelSerializer):
+class StudentSerializer(SparseFieldsetMixin, ModelSerializer):
     """Сериализатор представления полного профиля студента."""
 
     city = CitySerializer()
@@ -218,6 +392,31 @@ class StudentSerializer(ModelSerializer):
             'about_exp',
             'about_education',
         )
+        compact_fields = (
+            'id',
+            'first_name',
+            'last_name',
+            'avatar',
+            'city',
+            'specialization',
+            'skills',
+        )
+
+    @classmethod
+    def get_extra_fields(cls, request) -> tuple[str]:
+        # INFO: оценка соответствия вакансии есть только при ранжированной
+        #       выдаче (?from_vacancy=<id>&mode=ranked).
+        if request.query_params.get('mode') == 'ranked':
+            return ('score',)
+        return ()
+
+    def to_representation(self, instance):
+        data: dict[str, any] = super().to_representation(instance)
+        if hasattr(instance, 'score') and (
+                self.requested_fields is None
+                or 'score' in self.requested_fields):
+            data['score'] = instance.score
+        return data
 
 
 class TaskSerializer(ModelSerializer):
@@ -273,9 +472,102 @@ class UserUpdateSerializer(ModelSerializer):
         )
 
 
-class VacancySerializer(ModelSerializer):
+class VacancyListSerializer(ListSerializer):
+    """
+    Сериализатор массового создания вакансий.
+
+    Все вакансии проверяются по одной загрузке справочников
+    (кеш справочников) и одним запросом на дубликаты по content_hash,
+    ошибки возвращаются списком по порядку вакансий
+    ({} - для корректных).
+    Вакансии, их языки и навыки создаются тремя bulk_create
+    в одной транзакции.
+    """
+
+    def to_internal_value(self, data):
+        if not isinstance(data, list) or not data or (
+            self.max_length is not None and len(data) > self.max_length
+        ):
+            # INFO: ошибки формата и длины списка формирует ListSerializer.
+            return super().to_internal_value(data)
+        errors: list[dict] = []
+        validated_data: list[dict] = []
+        for item in data:
+            try:
+                validated_data.append(self.child.run_validation(item))
+            except ValidationError as error:
+                errors.append(error.detail)
+                validated_data.append(None)
+            else:
+                errors.append({})
+        hashes: list[str] = [
+            Vacancy(
+                name=item.get('name'), description=item.get('description'),
+            ).get_content_hash() if item else None
+            for item in validated_data
+        ]
+        existing: set[str] = set(
+            Vacancy.objects.filter(
+                content_hash__in={obj_hash for obj_hash in hashes if obj_hash},
+            ).values_list('content_hash', flat=True)
+        )
+        for index, obj_hash in enumerate(hashes):
+            if obj_hash is None:
+                continue
+            if obj_hash in existing:
+                errors[index] = {"Bad Request.": VACANCY_EXISTS_ERROR}
+            existing.add(obj_hash)
+        if any(errors):
+            raise ValidationError(errors)
+        return validated_data
+
+    @transaction.atomic
+    def create(self, validated_data):
+        hr: User = self.context['request'].user
+        relations: list[tuple] = []
+        vacancies: list[Vacancy] = []
+        for data in validated_data:
+            relations.append(
+                (data.pop('languages', None), data.pop('skills'))
+            )
+            vacancy: Vacancy = Vacancy(hr=hr, **data)
+            vacancy.content_hash = vacancy.get_content_hash()
+            vacancies.append(vacancy)
+        # INFO: вакансия, созданная параллельным запросом после проверки
+        #       дубликатов, отклоняется уникальным индексом по content_hash.
+        try:
+            Vacancy.objects.bulk_create(vacancies)
+        except IntegrityError as error:
+            if not is_vacancy_exists_error(error=error):
+                raise
+            raise ValidationError({"Bad Request.": VACANCY_EXISTS_ERROR})
+        vacancy_languages: list[VacancyLanguage] = []
+        vacancy_skills: list[VacancySkill] = []
+        for vacancy, (lang_data, skills) in zip(vacancies, relations):
+            if lang_data:
+                languages, levels, lang_data = lang_data
+                vacancy_languages.extend(
+                    self.child._get_vacancy_languages(
+                        language_data=lang_data,
+                        vacancy=vacancy,
+                        languages=languages,
+                        levels=levels,
+                    )
+                )
+            vacancy_skills.extend(
+                self.child._get_vacancy_skills(vacancy=vacancy, skills=skills)
+            )
+        VacancyLanguage.objects.bulk_create(vacancy_languages)
+        VacancySkill.objects.bulk_create(vacancy_skills)
+        return vacancies
+
+
+class VacancySerializer(SparseFieldsetMixin, ModelSerializer):
     """Сериализатор представления вакансий."""
 
+    # INFO: город, валюта, опыт и т.д. проверяются по кешу справочников.
+    serializer_related_field = ReferenceRelatedField
+
     languages = ListField(
         child=DictField(child=IntegerField()),
         write_only=True,
@@ -285,6 +577,7 @@ class VacancySerializer(ModelSerializer):
 
     class Meta:
         model = Vacancy
+        list_serializer_class = VacancyListSerializer
         fields = (
             'id',
             'hr',
@@ -310,11 +603,29 @@ class VacancySerializer(ModelSerializer):
             'template_invite',
         )
         read_only_fields = ('id', 'hr',)
+        compact_fields = (
+            'id',
+            'name',
+            'city',
+            'salary_from',
+            'salary_to',
+            'currency',
+            'pub_datetime',
+            'is_archived',
+            'is_template',
+        )
+        # INFO: справочные значения (город, валюта, языки, навыки и т.д.)
+        #       берутся из кеша справочников, подгружаются только
+        #       связи, которые читает to_representation.
+        prefetch_related_fields = {
+            'languages': ('vacancy_language',),
+            'skills': ('vacancy_skill',),
+        }
 
     def validate_languages(self, value):
         """
         Производит валидацию поля "languages".
-        Возвращает Queryset моделей Language и LanguageLevel.
+        Возвращает словари ID -> объект моделей Language и LanguageLevel.
         """
         languages_ids: dict[int, True] = {}
         levels_ids: list[int] = []
@@ -325,12 +636,12 @@ class VacancySerializer(ModelSerializer):
             raise ValidationError(
                 {"Bad Request.": "Один и тот же язык указан дважды."}
             )
-        languages: QuerySet = self._validate_ids(
+        languages: dict[int, Language] = self._validate_ids(
             ids=list(languages_ids),
             model=Language,
             desc='разговорных языков'
         )
-        levels: QuerySet = self._validate_ids(
+        levels: dict[int, LanguageLevel] = self._validate_ids(
             ids=list(set(levels_ids)),
             model=LanguageLevel,
             desc='уровней владения языком'
@@ -338,99 +649,221 @@ class VacancySerializer(ModelSerializer):
         return languages, levels, value
 
     def validate_skills(self, value):
-        return self._validate_ids(
-            ids=value, model=Skill, desc='навыков'
+        return list(
+            self._validate_ids(ids=value, model=Skill, desc='навыков').values()
         )
 
-    def validate(self, attrs):
-        name: str = attrs.get('name')
-        description: str = attrs.get('description')
-        if Vacancy.objects.filter(name=name, description=description).exists():
-            raise ValidationError(
-                {"Bad Request.": "Такая вакансия уже существует."}
-            )
-        return super().validate(attrs)
-
     @transaction.atomic
     def create(self, validated_data):
         validated_data['hr'] = self.context['request'].user
         lang_data: None = None
         if 'languages' in validated_data:
-            language_qs, levels_qs, lang_data = validated_data.pop('languages')
-        skills: QuerySet = validated_data.pop('skills')
-        instance: Vacancy = super().create(validated_data)
-        instance.experience = validated_data.get('experience')
-        instance.save()
+            languages, levels, lang_data = validated_data.pop('languages')
+        skills: list[Skill] = validated_data.pop('skills')
+        # INFO: дубликаты не проверяются заранее: вставку отклоняет
+        #       уникальный индекс по content_hash, а транзакция
+        #       метода откатывается вместе с исключением.
+        try:
+            instance: Vacancy = super().create(validated_data)
+        except IntegrityError as error:
+            if not is_vacancy_exists_error(error=error):
+                raise
+            raise ValidationError({"Bad Request.": VACANCY_EXISTS_ERROR})
         if lang_data:
-            self._create_vacancy_languages(
+            VacancyLanguage.objects.bulk_create(
+                self._get_vacancy_languages(
                     language_data=lang_data,
                     vacancy=instance,
-                    language_qs=language_qs,
-                    levels_qs=levels_qs,
+                    languages=languages,
+                    levels=levels,
                 )
-        self._create_vacancy_skills(vacancy=instance, skills=skills)
+            )
+        VacancySkill.objects.bulk_create(
+            self._get_vacancy_skills(vacancy=instance, skills=skills)
+        )
+        return instance
+
+    @transaction.atomic
+    def update(self, instance, validated_data):
+        # INFO: сохранение вакансии, ее навыков и языков (сигналы
+        #       post_save) ставит в очередь пересчет строк VacancyMatch:
+        #       подходящие студенты вакансии становятся актуальными
+        #       только после обновления этих строк.
+        lang_data: tuple = validated_data.pop('languages', None)
+        skills: list[Skill] = validated_data.pop('skills', None)
+        try:
+            instance: Vacancy = super().update(instance, validated_data)
+        except IntegrityError as error:
+            if not is_vacancy_exists_error(error=error):
+                raise
+            raise ValidationError({"Bad Request.": VACANCY_EXISTS_ERROR})
+        if lang_data is not None:
+            languages, levels, lang_data = lang_data
+            self._update_vacancy_languages(
+                language_data=lang_data,
+                vacancy=instance,
+                languages=languages,
+                levels=levels,
+            )
+        if skills is not None:
+            self._update_vacancy_skills(vacancy=instance, skills=skills)
         return instance
 
     def to_representation(self, instance):
         data: dict[str, any] = super().to_representation(instance)
-        vacancy_languages: QuerySet = instance.vacancy_language.all()
-        data['languages'] = [
-            {'language': language.language.name, 'level': language.level.name}
-            for language in vacancy_languages
-        ]
-        vacancy_skills: QuerySet = instance.vacancy_skill.all()
-        data['skills'] = [
-            {'name': vacancy_skill.skill.name}
-            for vacancy_skill in vacancy_skills
-        ]
-        data['city'] = instance.city.name
-        data['currency'] = instance.currency.name
-        data['experience'] = instance.experience.name
-        data['employment'] = {"name": instance.employment.name}
-        data['schedule'] = {"name": instance.schedule.name}
+        # INFO: поля languages и skills доступны только для записи,
+        #       в ответ они добавляются, если не исключены ?fields.
+        # INFO: названия справочных значений берутся из кеша в памяти
+        #       процесса, а не из связанных объектов.
+        if 'languages' in self.fields:
+            vacancy_languages: QuerySet = instance.vacancy_language.all()
+            data['languages'] = [
+                {
+                    'language': reference_caches[Language].get(
+                        obj_id=language.language_id
+                    ).name,
+                    'level': reference_caches[LanguageLevel].get(
+                        obj_id=language.level_id
+                    ).name,
+                }
+                for language in vacancy_languages
+            ]
+        if 'skills' in self.fields:
+            vacancy_skills: QuerySet = instance.vacancy_skill.all()
+            data['skills'] = [
+                {
+                    'name': reference_caches[Skill].get(
+                        obj_id=vacancy_skill.skill_id
+                    ).name
+                }
+                for vacancy_skill in vacancy_skills
+            ]
+        for field, model in (
+            ('city', City), ('currency', Currency), ('experience', Experience),
+        ):
+            if data.get(field) is not None:
+                data[field] = reference_caches[model].get(
+                    obj_id=data[field]
+                ).name
+        for field, model in (
+            ('employment', Employment), ('schedule', Schedule),
+        ):
+            if data.get(field) is not None:
+                data[field] = {
+                    "name": reference_caches[model].get(
+                        obj_id=data[field]
+                    ).name
+                }
         return data
 
-    def _create_vacancy_languages(
+    def _get_vacancy_languages(
                 self,
                 language_data: list[dict],
                 vacancy: Vacancy,
-                language_qs: QuerySet,
-                levels_qs: QuerySet
-            ) -> None:
-        """Создает объекты модели VacancyLanguage."""
+                languages: dict[int, Language],
+                levels: dict[int, LanguageLevel]
+            ) -> list[VacancyLanguage]:
+        """Возвращает несохраненные объекты модели VacancyLanguage."""
         vacancy_languages: list[VacancyLanguage] = []
         for data in language_data:
             vacancy_languages.append(
                 VacancyLanguage(
                     vacancy=vacancy,
-                    language=language_qs.get(id=data.get('language')),
-                    level=levels_qs.get(id=data.get('level'))
+                    language=languages.get(data.get('language')),
+                    level=levels.get(data.get('level'))
                 )
             )
-        VacancyLanguage.objects.bulk_create(vacancy_languages)
-        return
+        return vacancy_languages
 
-    def _create_vacancy_skills(
-                self, skills: QuerySet, vacancy: Vacancy
-            ) -> None:
-        """Создает объекты модели VacancySkill."""
+    def _get_vacancy_skills(
+                self, skills: list[Skill], vacancy: Vacancy
+            ) -> list[VacancySkill]:
+        """Возвращает несохраненные объекты модели VacancySkill."""
         vacancy_skills: list[VacancySkill] = []
         for skill in skills:
             vacancy_skills.append(VacancySkill(vacancy=vacancy, skill=skill))
-        VacancySkill.objects.bulk_create(vacancy_skills)
+        return vacancy_skills
+
+    def _update_vacancy_languages(
+                self,
+                language_data: list[dict],
+                vacancy: Vacancy,
+                languages: dict[int, Language],
+                levels: dict[int, LanguageLevel]
+            ) -> None:
+        """
+        Приводит объекты модели VacancyLanguage вакансии к сообщенным:
+        удаляет лишние и создает недостающие пары язык - уровень,
+        не изменяя совпадающие.
+        """
+        current: dict[tuple[int, int], int] = {
+            (language_id, level_id): obj_id
+            for obj_id, language_id, level_id in (
+                VacancyLanguage.objects.filter(
+                    vacancy=vacancy,
+                ).values_list('id', 'language_id', 'level_id')
+            )
+        }
+        new_data: list[dict] = [
+            data for data in language_data
+            if (data.get('language'), data.get('level')) not in current
+        ]
+        submitted: set[tuple[int, int]] = {
+            (data.get('language'), data.get('level'))
+            for data in language_data
+        }
+        removed_ids: list[int] = [
+            obj_id for key, obj_id in current.items() if key not in submitted
+        ]
+        if removed_ids:
+            VacancyLanguage.objects.filter(id__in=removed_ids).delete()
+        if new_data:
+            VacancyLanguage.objects.bulk_create(
+                self._get_vacancy_languages(
+                    language_data=new_data,
+                    vacancy=vacancy,
+                    languages=languages,
+                    levels=levels,
+                )
+            )
+        return
+
+    def _update_vacancy_skills(
+                self, skills: list[Skill], vacancy: Vacancy
+            ) -> None:
+        """
+        Приводит объекты модели VacancySkill вакансии к сообщенным:
+        удаляет лишние и создает недостающие навыки.
+        """
+        current: set[int] = set(
+            VacancySkill.objects.filter(
+                vacancy=vacancy,
+            ).values_list('skill_id', flat=True)
+        )
+        submitted: set[int] = {skill.id for skill in skills}
+        if current - submitted:
+            VacancySkill.objects.filter(
+                vacancy=vacancy, skill_id__in=current - submitted,
+            ).delete()
+        VacancySkill.objects.bulk_create(
+            self._get_vacancy_skills(
+                vacancy=vacancy,
+                skills=[skill for skill in skills if skill.id not in current],
+            )
+        )
         return
 
     def _validate_ids(
                 self, ids: list[int], model: Model, desc: str
-            ) -> QuerySet:
+            ) -> dict[int, Model]:
         """
         Проверяет, что для сообщенных ID существуют объекты.
-        Возвращает Queryset объектов.
+        Возвращает словарь ID -> объект из кеша справочника.
         """
-        queryset: QuerySet = model.objects.filter(id__in=ids)
+        objects: dict[int, Model] = reference_caches[model].get_many(ids=ids)
         # TODO: можно вывести список невалидных ID при необходимости.
-        if queryset.count() != len(ids):
+        if len(objects) != len(ids):
             raise ValidationError(
                 {"Bad Request.": f"Некоторых указанных {desc} не существует."}
             )
-        return queryset
+        return objects
@@ -0,0 +1,94 @@
+"""
+Плагин pytest для проверки бюджетов SQL запросов эндпоинтов API.
+
+Фикстура query_budget возвращает функцию проверки эндпоинта,
+а количество SQL запросов каждого проверенного эндпоинта выводится
+в итогах тестов.
+"""
+from typing import Callable
+
+import pytest
+from django.core.cache import cache
+
+from api.v1.tests.query_budget import (
+    QUERY_BUDGET_CASES, QUERY_BUDGET_N, QUERY_BUDGET_STEP, QUERY_BUDGETS,
+    capture_queries,
+)
+
+QUERY_BUDGET_RESULTS: pytest.StashKey[dict[str, tuple[int, int]]] = (
+    pytest.StashKey()
+)
+
+
+def pytest_configure(config) -> None:
+    config.stash[QUERY_BUDGET_RESULTS] = {}
+    return
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config) -> None:
+    """Выводит количество SQL запросов проверенных эндпоинтов."""
+    results: dict[str, tuple[int, int]] = config.stash[QUERY_BUDGET_RESULTS]
+    if not results:
+        return
+    terminalreporter.section('SQL query budgets')
+    for url_name, (queries, budget) in sorted(results.items()):
+        terminalreporter.write_line(f'{url_name:<28}{queries:>4} / {budget}')
+    return
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> None:
+    """
+    Очищает кеш Django перед каждым тестом: ключи кеша содержат ID
+    объектов, которые в разных тестах могут совпадать.
+    """
+    cache.clear()
+    return
+
+
+@pytest.fixture
+def query_budget(request) -> Callable:
+    """
+    Возвращает функцию проверки бюджета SQL запросов эндпоинта:
+        - url_name: имя URL эндпоинта в QUERY_BUDGETS
+          или сценария в QUERY_BUDGET_CASES
+        - send: выполняет HTTP запрос к эндпоинту и возвращает ответ
+        - populate: создает указанное количество объектов (студентов,
+          вакансий и т.д.), от которых может зависеть ответ
+
+    Запрос выполняется при QUERY_BUDGET_N и при
+    QUERY_BUDGET_N + QUERY_BUDGET_STEP объектах. Перед каждым подсчетом
+    выполняется прогревочный запрос, чтобы не учитывать заполнение кешей.
+    Возвращает ответ последнего запроса.
+    """
+    results: dict[str, tuple[int, int]] = (
+        request.config.stash[QUERY_BUDGET_RESULTS]
+    )
+
+    def check(
+            url_name: str,
+            send: Callable[[], any],
+            populate: Callable[[int], None],
+            ):
+        budget: int = {**QUERY_BUDGETS, **QUERY_BUDGET_CASES}[url_name]
+        counts: list[list[str]] = []
+        for num in (QUERY_BUDGET_N, QUERY_BUDGET_STEP):
+            populate(num)
+            send()
+            queries, response = capture_queries(send=send)
+            counts.append(queries)
+        small, large = counts
+        results[url_name] = (len(large), budget)
+        assert len(large) == len(small), (
+            f'Количество SQL запросов {url_name} растет с количеством '
+            f'объектов: {len(small)} -> {len(large)}. '
+            'Убедитесь, что связанные объекты подгружаются заранее '
+            '(select_related/prefetch_related).\n' + '\n'.join(large)
+        )
+        assert len(large) <= budget, (
+            f'Количество SQL запросов {url_name} ({len(large)}) '
+            f'превышает бюджет ({budget}).\n' + '\n'.join(large)
+        )
+        return response
+
+    return check
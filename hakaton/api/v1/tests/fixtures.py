@@ -2,7 +2,15 @@ from rest_framework import status
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.test import APIClient
 
+from student.models import (
+    Student, StudentEmployment, StudentLanguage, StudentSchedule, StudentSkill,
+)
+from student.skill_index import skill_index
 from user.models import User
+from vacancy.models import (
+    City, Currency, Employment, Experience, Language, LanguageLevel,
+    Schedule, Skill, SkillCategory, Vacancy, VacancyLanguage, VacancySkill,
+)
 
 API_V1_URL: str = '/api/v1/'
 
@@ -15,9 +23,24 @@ API_TOKEN_URL: str = f'{API_V1_URL}auth/token/'
 API_TOKEN_CREATE_URL: str = f'{API_TOKEN_URL}create/'
 API_TOKEN_REFRESH_URL: str = f'{API_TOKEN_URL}refresh/'
 
+API_DICTIONARIES_URL: str = f'{API_V1_URL}dictionaries/'
+
+API_EXPORTS_URL: str = f'{API_V1_URL}exports/'
+
+API_SKILLS_URL: str = f'{API_V1_URL}skills/'
+API_SKILL_CATEGORIES_URL: str = f'{API_SKILLS_URL}by-categories/'
+
+API_STUDENTS_URL: str = f'{API_V1_URL}students/'
+API_STUDENTS_EXPORT_URL: str = f'{API_STUDENTS_URL}export/'
+API_STUDENTS_FACETS_URL: str = f'{API_STUDENTS_URL}facets/'
+
 API_USERS_URL: str = f'{API_V1_URL}users/'
 API_USERS_ME_URL: str = f'{API_USERS_URL}me/'
 
+API_VACANCIES_URL: str = f'{API_V1_URL}vacancies/'
+API_VACANCIES_BULK_URL: str = f'{API_VACANCIES_URL}bulk/'
+API_VACANCIES_MATCHES_URL: str = f'{API_VACANCIES_URL}matches/'
+
 CLIENT_METHODS = {
     'delete': lambda url: client_auth_admin().delete(url),
     'get': lambda url: client_auth_admin().get(url),
@@ -112,3 +135,154 @@ def client_auth_admin(num: int = 1, admin: User = None) -> APIClient:
     refresh: str = RefreshToken.for_user(admin)
     client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
     return client
+
+
+def create_reference_objs(num: int = 3) -> dict[str, list]:
+    """
+    Создает и возвращает объекты справочных моделей:
+    городов, валют, типов занятости, сроков опыта работы, графиков работы,
+    разговорных языков, уровней владения языками, категорий навыков и навыков.
+    Порядковые уровни владения языками (10, 20, ...) намеренно
+    не совпадают с их ID.
+    """
+    category: SkillCategory = SkillCategory.objects.create(name='Категория')
+    return {
+        'cities': [
+            City.objects.create(name=f'Город {i}') for i in range(num)
+        ],
+        'currencies': [
+            Currency.objects.create(name=f'Валюта {i}', symbol=str(i))
+            for i in range(num)
+        ],
+        'employments': [
+            Employment.objects.create(name=f'Занятость {i}')
+            for i in range(num)
+        ],
+        'experiences': [
+            Experience.objects.create(name=f'Опыт {i}') for i in range(num)
+        ],
+        'languages': [
+            Language.objects.create(name=f'Язык {i}') for i in range(num)
+        ],
+        'levels': [
+            LanguageLevel.objects.create(
+                name=f'Уровень {i}', level=(i + 1) * 10
+            ) for i in range(num)
+        ],
+        'schedules': [
+            Schedule.objects.create(name=f'График {i}') for i in range(num)
+        ],
+        'skills': [
+            Skill.objects.create(name=f'Навык {i}', category=category)
+            for i in range(num)
+        ],
+    }
+
+
+def create_student_obj(
+        num: int,
+        city: City,
+        experience: Experience,
+        employments: list[Employment] = (),
+        languages: list[tuple[Language, LanguageLevel]] = (),
+        schedules: list[Schedule] = (),
+        skills: list[Skill] = (),
+        relocation: bool = False,
+        ) -> Student:
+    """Создает и возвращает объект модели "Student" со связанными объектами."""
+    student: Student = Student.objects.create(
+        email=f'test_student_email_{num}@email.com',
+        first_name=f'Студент {num}',
+        last_name='Студентов',
+        phone=f'+7 911 222 33 {num:02}',
+        city=city,
+        relocation=relocation,
+        experience=experience,
+    )
+    StudentEmployment.objects.bulk_create(
+        StudentEmployment(student=student, employment=employment)
+        for employment in employments
+    )
+    StudentLanguage.objects.bulk_create(
+        StudentLanguage(student=student, language=language, level=level)
+        for language, level in languages
+    )
+    StudentSchedule.objects.bulk_create(
+        StudentSchedule(student=student, schedule=schedule)
+        for schedule in schedules
+    )
+    StudentSkill.objects.bulk_create(
+        StudentSkill(student=student, skill=skill) for skill in skills
+    )
+    # INFO: bulk_create не отправляет сигналы, обновляющие индекс навыков.
+    skill_index.invalidate()
+    return student
+
+
+def create_vacancy_obj(
+        num: int,
+        hr: User,
+        refs: dict[str, list],
+        languages: list[tuple[Language, LanguageLevel]] = (),
+        skills: list[Skill] = (),
+        ) -> Vacancy:
+    """
+    Создает и возвращает объект модели "Vacancy" со связанными объектами.
+    Город, валюта, опыт, тип занятости и график работы берутся первыми
+    из справочных объектов create_reference_objs.
+    """
+    vacancy: Vacancy = Vacancy.objects.create(
+        hr=hr,
+        name=f'Вакансия {num}',
+        city=refs['cities'][0],
+        description=f'Описание вакансии {num}',
+        responsibilities=f'Обязанности вакансии {num}',
+        requirements=f'Требования вакансии {num}',
+        conditions=f'Условия вакансии {num}',
+        salary_from=1000,
+        salary_to=2000,
+        currency=refs['currencies'][0],
+        experience=refs['experiences'][0],
+        employment=refs['employments'][0],
+        schedule=refs['schedules'][0],
+    )
+    VacancyLanguage.objects.bulk_create(
+        VacancyLanguage(vacancy=vacancy, language=language, level=level)
+        for language, level in languages
+    )
+    VacancySkill.objects.bulk_create(
+        VacancySkill(vacancy=vacancy, skill=skill) for skill in skills
+    )
+    return vacancy
+
+
+def get_vacancy_data(
+        num: int,
+        refs: dict[str, list],
+        languages: list[tuple[Language, LanguageLevel]] = (),
+        skills: list[Skill] = (),
+        ) -> dict[str, any]:
+    """
+    Возвращает данные POST запроса создания вакансии. Город, валюта,
+    опыт, тип занятости и график работы берутся первыми
+    из справочных объектов create_reference_objs.
+    """
+    return {
+        'name': f'Вакансия {num}',
+        'city': refs['cities'][0].id,
+        'description': f'Описание вакансии {num}',
+        'responsibilities': f'Обязанности вакансии {num}',
+        'requirements': f'Требования вакансии {num}',
+        'conditions': f'Условия вакансии {num}',
+        'salary_from': 1000,
+        'salary_to': 2000,
+        'currency': refs['currencies'][0].id,
+        'experience': refs['experiences'][0].id,
+        'employment': refs['employments'][0].id,
+        'schedule': refs['schedules'][0].id,
+        'languages': [
+            {'language': language.id, 'level': level.id}
+            for language, level in languages
+        ],
+        'skills': [skill.id for skill in skills],
+    }
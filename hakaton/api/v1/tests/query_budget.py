@@ -0,0 +1,72 @@
+"""
+Бюджеты SQL запросов эндпоинтов API.
+
+Для каждого эндпоинта из api/v1/urls.py (по имени URL) объявлено
+максимальное количество SQL запросов одного HTTP запроса. Запрос
+к эндпоинту выполняется при QUERY_BUDGET_N и при
+QUERY_BUDGET_N + QUERY_BUDGET_STEP студентах, вакансиях и т.д.:
+количество SQL запросов не должно расти с количеством объектов
+(иначе в коде есть N+1) и не должно превышать бюджет.
+
+Проверка выполняется фикстурой query_budget (см. conftest.py).
+"""
+from typing import Callable
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+QUERY_BUDGET_N: int = 2
+QUERY_BUDGET_STEP: int = 3
+
+# INFO: в бюджет входит запрос пользователя при JWT авторизации.
+QUERY_BUDGETS: dict[str, int] = {
+    'api-root': 1,
+    'city': 2,
+    'currencies': 2,
+    'dictionaries': 1,
+    'employment': 2,
+    'experiences': 2,
+    'exports-detail': 2,
+    'exports-download': 2,
+    'exports-list': 2,
+    'language-levels': 2,
+    'languages': 2,
+    'schedule': 2,
+    'schema': 1,
+    'skill-categories': 1,
+    'skills-search': 1,
+    'students-detail': 5,
+    'students-export': 5,
+    'students-facets': 7,
+    'students-list': 5,
+    'students-mark_watched': 4,
+    'swagger-ui': 1,
+    'tasks-detail': 2,
+    'tasks-list': 2,
+    'token_obtain_pair': 1,
+    'token_refresh': 0,
+    'users-detail': 5,
+    'users-list': 5,
+    'users-users-me': 1,
+    'vacancies-bulk': 10,
+    'vacancies-detail': 4,
+    'vacancies-list': 4,
+    'vacancies-matches': 3,
+}
+
+# INFO: бюджеты отдельных сценариев эндпоинтов (<имя URL>:<сценарий>).
+#       Подбор для архивных вакансий читает вакансии с требованиями
+#       и данные студентов один раз для всех вакансий.
+QUERY_BUDGET_CASES: dict[str, int] = {
+    'vacancies-matches:archived': 11,
+}
+
+
+def capture_queries(send: Callable[[], any]) -> tuple[list[str], any]:
+    """
+    Выполняет запрос send и возвращает выполненные при этом
+    SQL запросы и ответ.
+    """
+    with CaptureQueriesContext(connection) as context:
+        response = send()
+    return [query['sql'] for query in context.captured_queries], response
@@ -0,0 +1,403 @@
+import pytest
+from django.db.models import QuerySet
+
+from api.v1.tests.fixtures import (
+    create_reference_objs, create_student_obj, create_user_obj,
+    create_vacancy_obj,
+)
+from hakaton.cache_versions import get_version
+from student.matching import (
+    MATCHES_VERSION_KEY, filter_vacancies_by_student,
+    get_matched_student_ids, get_student_ids_by_vacancies,
+    get_student_ids_by_vacancy, get_vacancies, refresh_student_matches,
+)
+from student.models import Student, StudentLanguage, StudentSkill
+from student.skill_index import SkillIndex, skill_index
+from vacancy.models import Vacancy, VacancyMatch, VacancySkill
+from vacancy.tasks import (
+    refresh_students_matches_task, refresh_vacancies_matches_task,
+)
+
+
+@pytest.mark.django_db
+class TestStudentMatches():
+    """
+    Производит тест пересчета таблицы VacancyMatch
+    при изменении данных студента.
+    """
+
+    def _create_objs(self) -> tuple[dict[str, list], Student, list[Vacancy]]:
+        """
+        Создает справочные объекты, студента с навыком 0 и языком 0
+        на уровне 1 и вакансии:
+            - первая требует навык 0
+            - вторая требует навыки 0 и 1
+            - третья требует навык 0 и язык 0 на уровне 2
+        """
+        refs: dict[str, list] = create_reference_objs()
+        student: Student = create_student_obj(
+            num=1,
+            city=refs['cities'][0],
+            experience=refs['experiences'][0],
+            employments=refs['employments'][:1],
+            languages=((refs['languages'][0], refs['levels'][1]),),
+            schedules=refs['schedules'][:1],
+            skills=refs['skills'][:1],
+        )
+        hr = create_user_obj(num=1)
+        vacancies: list[Vacancy] = [
+            create_vacancy_obj(
+                num=1, hr=hr, refs=refs, skills=refs['skills'][:1],
+            ),
+            create_vacancy_obj(
+                num=2, hr=hr, refs=refs, skills=refs['skills'][:2],
+            ),
+            create_vacancy_obj(
+                num=3,
+                hr=hr,
+                refs=refs,
+                languages=((refs['languages'][0], refs['levels'][2]),),
+                skills=refs['skills'][:1],
+            ),
+        ]
+        return refs, student, vacancies
+
+    def _get_matched_vacancy_ids(self, student: Student) -> set[int]:
+        """Возвращает ID вакансий студента из таблицы VacancyMatch."""
+        return set(
+            VacancyMatch.objects.filter(
+                student=student,
+            ).values_list('vacancy_id', flat=True)
+        )
+
+    def test_filter_vacancies_by_student(self) -> None:
+        """
+        Проверяет, что вакансия не подходит студенту, если он не владеет
+        требуемым навыком или языком на требуемом уровне.
+        """
+        _, student, vacancies = self._create_objs()
+        matched: QuerySet = filter_vacancies_by_student(
+            vacancies=Vacancy.objects.all(),
+            student=student,
+        )
+        assert set(matched.values_list('id', flat=True)) == {
+            vacancies[0].id
+        }, (
+            'Убедитесь, что студенту подходят только вакансии, '
+            'все требования которых он выполняет.'
+        )
+        return
+
+    def test_student_ids_by_vacancies(self) -> None:
+        """
+        Проверяет, что подбор студентов сразу для нескольких вакансий
+        совпадает с подбором для каждой вакансии отдельно.
+        """
+        refs, student, vacancies = self._create_objs()
+        create_student_obj(
+            num=2,
+            city=refs['cities'][1],
+            experience=refs['experiences'][0],
+            employments=refs['employments'][:1],
+            languages=((refs['languages'][0], refs['levels'][2]),),
+            schedules=refs['schedules'][:1],
+            skills=refs['skills'][:2],
+        )
+        loaded: list[Vacancy] = list(
+            get_vacancies(vacancy_ids=[vacancy.id for vacancy in vacancies])
+        )
+        assert get_student_ids_by_vacancies(vacancies=loaded) == {
+            vacancy.id: get_student_ids_by_vacancy(vacancy=vacancy)
+            for vacancy in loaded
+        }, (
+            'Убедитесь, что подбор студентов для нескольких вакансий '
+            'за один проход совпадает с подбором для каждой вакансии.'
+        )
+        assert get_student_ids_by_vacancies(vacancies=loaded)[
+            vacancies[0].id
+        ] == {student.id}, (
+            'Убедитесь, что студент из другого города без готовности '
+            'к переезду не подходит под вакансию.'
+        )
+        return
+
+    def test_refresh_student_matches(self) -> None:
+        """
+        Проверяет, что пересчет подходящих вакансий студента создает
+        недостающие и удаляет лишние строки VacancyMatch.
+        """
+        _, student, vacancies = self._create_objs()
+        VacancyMatch.objects.create(vacancy=vacancies[1], student=student)
+        refresh_student_matches(student_id=student.id)
+        assert self._get_matched_vacancy_ids(student=student) == {
+            vacancies[0].id
+        }, (
+            'Убедитесь, что после пересчета в таблице VacancyMatch '
+            'остаются только подходящие вакансии.'
+        )
+        student.delete()
+        refresh_student_matches(student_id=student.id)
+        assert not VacancyMatch.objects.exists(), (
+            'Убедитесь, что строки удаленного студента удаляются.'
+        )
+        return
+
+    def test_student_skill_changed(
+            self, django_capture_on_commit_callbacks) -> None:
+        """
+        Проверяет, что после добавления и удаления навыка студента
+        строки VacancyMatch появляются и удаляются.
+        """
+        with django_capture_on_commit_callbacks(execute=True):
+            refs, student, vacancies = self._create_objs()
+        assert self._get_matched_vacancy_ids(student=student) == {
+            vacancies[0].id
+        }, (
+            'Убедитесь, что подходящие вакансии рассчитываются '
+            'после создания вакансий.'
+        )
+        with django_capture_on_commit_callbacks(execute=True):
+            StudentSkill.objects.create(
+                student=student, skill=refs['skills'][1],
+            )
+        assert self._get_matched_vacancy_ids(student=student) == {
+            vacancies[0].id, vacancies[1].id
+        }, (
+            'Убедитесь, что после добавления навыка студента '
+            'появляются новые подходящие вакансии.'
+        )
+        with django_capture_on_commit_callbacks(execute=True):
+            StudentSkill.objects.get(
+                student=student, skill=refs['skills'][0],
+            ).delete()
+        assert self._get_matched_vacancy_ids(student=student) == set(), (
+            'Убедитесь, что после удаления навыка студента '
+            'неподходящие вакансии удаляются.'
+        )
+        return
+
+    def test_student_language_changed(
+            self, django_capture_on_commit_callbacks) -> None:
+        """
+        Проверяет, что после изменения языков студента
+        строки VacancyMatch появляются и удаляются.
+        """
+        with django_capture_on_commit_callbacks(execute=True):
+            refs, student, vacancies = self._create_objs()
+        with django_capture_on_commit_callbacks(execute=True):
+            StudentLanguage.objects.filter(student=student).delete()
+            StudentLanguage.objects.create(
+                student=student,
+                language=refs['languages'][0],
+                level=refs['levels'][2],
+            )
+        assert self._get_matched_vacancy_ids(student=student) == {
+            vacancies[0].id, vacancies[2].id
+        }, (
+            'Убедитесь, что после повышения уровня языка студента '
+            'появляются новые подходящие вакансии.'
+        )
+        with django_capture_on_commit_callbacks(execute=True):
+            StudentLanguage.objects.filter(student=student).delete()
+        assert self._get_matched_vacancy_ids(student=student) == {
+            vacancies[0].id
+        }, (
+            'Убедитесь, что после удаления языка студента '
+            'вакансии с требованием к языку удаляются.'
+        )
+        return
+
+    def test_student_skill_updated(
+            self, django_capture_on_commit_callbacks) -> None:
+        """
+        Проверяет, что после замены навыка в строке StudentSkill
+        (например, через админку) индекс навыков не содержит
+        прежний навык студента.
+        """
+        refs, student, _ = self._create_objs()
+        assert skill_index.match(skill_ids=[refs['skills'][0].id]) == [
+            student.id
+        ], (
+            'Убедитесь, что индекс навыков содержит навык студента.'
+        )
+        student_skill: StudentSkill = StudentSkill.objects.get(
+            student=student,
+        )
+        student_skill.skill = refs['skills'][1]
+        with django_capture_on_commit_callbacks(execute=True):
+            student_skill.save()
+        assert (
+            skill_index.match(skill_ids=[refs['skills'][0].id]) == []
+            and skill_index.match(skill_ids=[refs['skills'][1].id]) == [
+                student.id
+            ]
+        ), (
+            'Убедитесь, что при изменении строки StudentSkill прежний '
+            'навык студента удаляется из индекса навыков.'
+        )
+        return
+
+    def test_skill_index_applies_changes(
+            self, django_capture_on_commit_callbacks, monkeypatch) -> None:
+        """
+        Проверяет, что индекс навыков другого процесса (например,
+        воркера Celery) догоняет изменения StudentSkill по журналу,
+        не перестраиваясь из БД целиком.
+        """
+        refs, student, _ = self._create_objs()
+        worker_index: SkillIndex = SkillIndex()
+        worker_index.build()
+        monkeypatch.setattr(
+            worker_index,
+            'build',
+            lambda: pytest.fail(
+                'Индекс навыков перестроен целиком вместо применения '
+                'изменений из журнала.'
+            ),
+        )
+        with django_capture_on_commit_callbacks(execute=True):
+            StudentSkill.objects.create(
+                student=student, skill=refs['skills'][1],
+            )
+        with django_capture_on_commit_callbacks(execute=True):
+            StudentSkill.objects.filter(
+                student=student, skill=refs['skills'][0],
+            ).delete()
+        assert (
+            worker_index.match(skill_ids=[refs['skills'][0].id]) == []
+            and worker_index.match(skill_ids=[refs['skills'][1].id]) == [
+                student.id
+            ]
+        ), (
+            'Убедитесь, что индекс навыков другого процесса применяет '
+            'изменения StudentSkill из журнала.'
+        )
+        return
+
+    def test_skill_log_before_matches_version(
+            self, django_capture_on_commit_callbacks, monkeypatch) -> None:
+        """
+        Проверяет порядок действий после коммита изменения навыка
+        студента: журнал индекса навыков записывается до постановки
+        пересчета в очередь, а версия кеша подходящих студентов
+        увеличивается только после пересчета строк VacancyMatch.
+        """
+        with django_capture_on_commit_callbacks(execute=True):
+            refs, student, vacancies = self._create_objs()
+        assert get_matched_student_ids(vacancy_id=vacancies[1].id) == [], (
+            'Убедитесь, что студент без навыка 1 не подходит под вакансию.'
+        )
+        worker_index: SkillIndex = SkillIndex()
+        worker_index.build()
+        version: int = get_version(key=MATCHES_VERSION_KEY)
+        delay = refresh_students_matches_task.delay
+
+        def check_and_delay(student_ids: list[int]) -> None:
+            assert worker_index.match(
+                skill_ids=[refs['skills'][1].id]
+            ) == [student.id], (
+                'Убедитесь, что журнал индекса навыков записывается '
+                'до постановки пересчета в очередь.'
+            )
+            assert get_version(key=MATCHES_VERSION_KEY) == version, (
+                'Убедитесь, что версия кеша подходящих студентов '
+                'не увеличивается до пересчета строк VacancyMatch.'
+            )
+            assert get_matched_student_ids(
+                vacancy_id=vacancies[1].id
+            ) == [], (
+                'Убедитесь, что до пересчета кеш соответствует строкам '
+                'VacancyMatch.'
+            )
+            delay(student_ids=student_ids)
+            return
+
+        monkeypatch.setattr(
+            refresh_students_matches_task, 'delay', check_and_delay,
+        )
+        with django_capture_on_commit_callbacks(execute=True):
+            StudentSkill.objects.create(
+                student=student, skill=refs['skills'][1],
+            )
+        assert get_version(key=MATCHES_VERSION_KEY) > version, (
+            'Убедитесь, что версия кеша подходящих студентов увеличивается '
+            'после пересчета строк VacancyMatch.'
+        )
+        assert get_matched_student_ids(vacancy_id=vacancies[1].id) == [
+            student.id
+        ], (
+            'Убедитесь, что после пересчета кеш подходящих студентов '
+            'соответствует новым строкам VacancyMatch.'
+        )
+        return
+
+    def test_refresh_queued_once(
+            self, django_capture_on_commit_callbacks, monkeypatch) -> None:
+        """
+        Проверяет, что изменение нескольких строк вакансии или студента
+        в одной транзакции ставит в очередь один пересчет.
+        """
+        with django_capture_on_commit_callbacks(execute=True):
+            refs, student, vacancies = self._create_objs()
+        queued: list[tuple[str, list[int]]] = []
+        monkeypatch.setattr(
+            refresh_vacancies_matches_task,
+            'delay',
+            lambda vacancy_ids: queued.append(('vacancies', vacancy_ids)),
+        )
+        monkeypatch.setattr(
+            refresh_students_matches_task,
+            'delay',
+            lambda student_ids: queued.append(('students', student_ids)),
+        )
+        with django_capture_on_commit_callbacks(execute=True):
+            for vacancy_skill in VacancySkill.objects.filter(
+                    vacancy=vacancies[1]):
+                vacancy_skill.delete()
+            vacancies[1].save()
+            StudentSkill.objects.create(
+                student=student, skill=refs['skills'][1],
+            )
+            StudentLanguage.objects.filter(student=student).delete()
+            student.save()
+        assert sorted(queued) == [
+            ('students', [student.id]),
+            ('vacancies', [vacancies[1].id]),
+        ], (
+            'Убедитесь, что пересчет каждой вакансии и каждого студента '
+            'ставится в очередь один раз за транзакцию.'
+        )
+        return
+
+    def test_student_relation_moved(
+            self, django_capture_on_commit_callbacks) -> None:
+        """
+        Проверяет, что после переноса строки StudentSkill к другому
+        студенту (например, через админку) строки VacancyMatch
+        пересчитываются у обоих студентов.
+        """
+        with django_capture_on_commit_callbacks(execute=True):
+            refs, student, vacancies = self._create_objs()
+            other: Student = create_student_obj(
+                num=2,
+                city=refs['cities'][0],
+                experience=refs['experiences'][0],
+                employments=refs['employments'][:1],
+                schedules=refs['schedules'][:1],
+            )
+        student_skill: StudentSkill = StudentSkill.objects.get(
+            student=student,
+        )
+        student_skill.student = other
+        with django_capture_on_commit_callbacks(execute=True):
+            student_skill.save()
+        assert (
+            self._get_matched_vacancy_ids(student=student) == set()
+            and self._get_matched_vacancy_ids(student=other) == {
+                vacancies[0].id
+            }
+        ), (
+            'Убедитесь, что после переноса строки к другому студенту '
+            'подходящие вакансии пересчитываются у обоих студентов.'
+        )
+        return
@@ -0,0 +1,47 @@
+from django.db.models import Prefetch
+
+from api.v1.prefetch import plan_related
+from api.v1.serializers import StudentSerializer, VacancySerializer
+
+
+class TestPrefetchPlan():
+    """Производит тест планировщика подгрузки связанных объектов."""
+
+    def test_nested_serializers(self) -> None:
+        """
+        Проверяет, что связи вложенных сериализаторов определяются
+        автоматически и только для запрошенных полей.
+        """
+        select_related, prefetch_related = plan_related(
+            serializer=StudentSerializer(
+                context={'fields': ('id', 'city', 'skills',)}
+            ),
+        )
+        assert select_related == ['city'], (
+            'Убедитесь, что для вложенного сериализатора со связью '
+            'ForeignKey используется select_related.'
+        )
+        assert [
+            lookup.prefetch_through for lookup in prefetch_related
+            if isinstance(lookup, Prefetch)
+        ] == ['student_skill'], (
+            'Убедитесь, что для вложенного сериализатора с many=True '
+            'используется Prefetch только для запрошенных полей.'
+        )
+        return
+
+    def test_declared_relations(self) -> None:
+        """
+        Проверяет, что учитываются связи, объявленные в Meta
+        сериализатора для полей, которые он заполняет сам.
+        """
+        _, prefetch_related = plan_related(
+            serializer=VacancySerializer(
+                context={'fields': ('id', 'skills',)}
+            ),
+        )
+        assert prefetch_related == ['vacancy_skill'], (
+            'Убедитесь, что связи из Meta.prefetch_related_fields '
+            'подгружаются для запрошенных полей.'
+        )
+        return
@@ -0,0 +1,316 @@
+from datetime import date, time
+from typing import Callable
+
+import pytest
+from django.core.files.base import ContentFile
+from django.http import HttpResponse
+from django.urls import URLPattern, URLResolver
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from api.v1 import urls
+from api.v1.tests.fixtures import (
+    client_anon, client_auth_admin, create_admin_user_obj,
+    create_reference_objs, create_student_obj, create_vacancy_obj,
+    get_vacancy_data,
+    API_DICTIONARIES_URL, API_EXPORTS_URL, API_SCHEMA_URL,
+    API_SKILL_CATEGORIES_URL, API_SKILLS_URL, API_STUDENTS_EXPORT_URL,
+    API_STUDENTS_FACETS_URL, API_STUDENTS_URL, API_SWAGGER_URL,
+    API_TASKS_URL, API_TOKEN_CREATE_URL, API_TOKEN_REFRESH_URL,
+    API_USERS_ME_URL, API_USERS_URL, API_V1_URL, API_VACANCIES_BULK_URL,
+    API_VACANCIES_MATCHES_URL, API_VACANCIES_URL,
+)
+from api.v1.tests.query_budget import QUERY_BUDGETS
+from hakaton.app_data import (
+    EXPORT_JOB_KIND_STUDENTS, EXPORT_JOB_STATUS_DONE,
+)
+from student.models import Student
+from user.models import ExportJob, HrTask, User
+from vacancy.models import Vacancy
+
+ADMIN_EMAIL: str = 'admin1@email.com'
+ADMIN_PASSWORD: str = 'admin'
+
+
+def get_url_names(patterns: list) -> set[str]:
+    """Возвращает имена всех URL из списка urlpatterns."""
+    names: set[str] = set()
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            names |= get_url_names(patterns=pattern.url_patterns)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            names.add(pattern.name)
+    return names
+
+
+class QueryBudgetData:
+    """
+    Объекты для проверки бюджетов SQL запросов: справочники,
+    администратор и его студенты, вакансии, задачи и выгрузки.
+    """
+
+    def __init__(self) -> None:
+        self.refs: dict[str, list] = create_reference_objs()
+        self.admin: User = create_admin_user_obj(
+            email=ADMIN_EMAIL, password=ADMIN_PASSWORD,
+        )
+        self.client: APIClient = client_auth_admin(admin=self.admin)
+        self.students: list[Student] = []
+        self.vacancies: list[Vacancy] = []
+        self.tasks: list[HrTask] = []
+        self.jobs: list[ExportJob] = []
+        self.download_job: ExportJob | None = None
+        self.users: int = 0
+        self.bulk_vacancies: int = 0
+
+    def populate(self, num: int) -> None:
+        """
+        Создает num студентов со всеми связанными объектами,
+        вакансий с навыками и языками, задач и выгрузок.
+        """
+        refs: dict[str, list] = self.refs
+        languages: tuple[tuple] = tuple(
+            zip(refs['languages'][:2], refs['levels'][1:])
+        )
+        for _ in range(num):
+            index: int = len(self.students) + 1
+            self.students.append(
+                create_student_obj(
+                    num=index,
+                    city=refs['cities'][0],
+                    experience=refs['experiences'][0],
+                    employments=refs['employments'][:2],
+                    languages=languages,
+                    schedules=refs['schedules'][:2],
+                    skills=refs['skills'],
+                )
+            )
+            self.vacancies.append(
+                create_vacancy_obj(
+                    num=index,
+                    hr=self.admin,
+                    refs=refs,
+                    languages=languages,
+                    skills=refs['skills'],
+                )
+            )
+            self.tasks.append(
+                HrTask.objects.create(
+                    hr=self.admin,
+                    description=f'Задача {index}',
+                    date=date(2023, 12, index),
+                    time=time(12, 0),
+                )
+            )
+            self.jobs.append(
+                ExportJob.objects.create(
+                    hr=self.admin, kind=EXPORT_JOB_KIND_STUDENTS, query={},
+                )
+            )
+        return
+
+    def create_vacancies(self) -> HttpResponse:
+        """
+        Создает массово столько новых вакансий с навыками и языками,
+        сколько вакансий создано populate.
+        """
+        refs: dict[str, list] = self.refs
+        data: list[dict] = []
+        for _ in self.vacancies:
+            self.bulk_vacancies += 1
+            data.append(
+                get_vacancy_data(
+                    num=f'bulk {self.bulk_vacancies}',
+                    refs=refs,
+                    languages=tuple(
+                        zip(refs['languages'][:2], refs['levels'][1:])
+                    ),
+                    skills=refs['skills'],
+                )
+            )
+        return self.client.post(
+            API_VACANCIES_BULK_URL, data=data, format='json',
+        )
+
+    def download_export(self) -> HttpResponse:
+        """
+        Скачивает файл завершенной выгрузки. Выгрузка с файлом
+        создается при первом (прогревочном) запросе.
+        """
+        if self.download_job is None:
+            self.download_job = ExportJob.objects.create(
+                hr=self.admin,
+                kind=EXPORT_JOB_KIND_STUDENTS,
+                query={},
+                status=EXPORT_JOB_STATUS_DONE,
+            )
+            self.download_job.file.save(
+                'budget.csv.gz', ContentFile(b''), save=True,
+            )
+        return self._read_streaming(
+            self.client.get(
+                f'{API_EXPORTS_URL}{self.download_job.id}/download/'
+            )
+        )
+
+    def delete_files(self) -> None:
+        """Удаляет файлы, созданные при проверке бюджетов."""
+        if self.download_job is not None:
+            self.download_job.file.delete()
+        return
+
+    def register_user(self) -> HttpResponse:
+        """Регистрирует нового пользователя."""
+        self.users += 1
+        return client_anon().post(
+            API_USERS_URL,
+            data={
+                'email': f'budget_user_{self.users}@email.com',
+                'first_name': 'Илона',
+                'last_name': 'Маск',
+                'password': 'MyPass!1',
+                'phone': f'+7 911 333 44 {self.users:02}',
+            },
+            format='json',
+        )
+
+    def get_requests(self) -> dict[str, Callable[[], HttpResponse]]:
+        """Возвращает HTTP запросы к эндпоинтам по именам URL."""
+        client: APIClient = self.client
+        return {
+            'api-root': lambda: client.get(API_V1_URL),
+            'city': lambda: client.get(f'{API_V1_URL}cities/'),
+            'currencies': lambda: client.get(f'{API_V1_URL}currencies/'),
+            'dictionaries': lambda: client.get(API_DICTIONARIES_URL),
+            'employment': lambda: client.get(f'{API_V1_URL}employments/'),
+            'experiences': lambda: client.get(f'{API_V1_URL}experiences/'),
+            'exports-detail': lambda: client.get(
+                f'{API_EXPORTS_URL}{self.jobs[0].id}/'
+            ),
+            'exports-download': self.download_export,
+            'exports-list': lambda: client.get(API_EXPORTS_URL),
+            'language-levels': lambda: client.get(
+                f'{API_V1_URL}language-levels/'
+            ),
+            'languages': lambda: client.get(f'{API_V1_URL}languages/'),
+            'schedule': lambda: client.get(f'{API_V1_URL}schedules/'),
+            'schema': lambda: client.get(API_SCHEMA_URL),
+            'skill-categories': lambda: client.get(API_SKILL_CATEGORIES_URL),
+            'skills-search': lambda: client.get(f'{API_SKILLS_URL}?search=На'),
+            'students-detail': lambda: client.get(
+                f'{API_STUDENTS_URL}{self.students[0].id}/'
+            ),
+            'students-export': lambda: self._read_streaming(
+                client.get(API_STUDENTS_EXPORT_URL)
+            ),
+            'students-facets': lambda: client.get(API_STUDENTS_FACETS_URL),
+            'students-list': lambda: client.get(API_STUDENTS_URL),
+            'students-mark_watched': lambda: client.post(
+                f'{API_STUDENTS_URL}{self.students[0].id}/mark_watched/'
+                f'?vacancy={self.vacancies[0].id}'
+            ),
+            'swagger-ui': lambda: client.get(API_SWAGGER_URL),
+            'tasks-detail': lambda: client.get(
+                f'{API_TASKS_URL}{self.tasks[0].id}/'
+            ),
+            'tasks-list': lambda: client.get(API_TASKS_URL),
+            'token_obtain_pair': lambda: client_anon().post(
+                API_TOKEN_CREATE_URL,
+                data={'email': ADMIN_EMAIL, 'password': ADMIN_PASSWORD},
+                format='json',
+            ),
+            'token_refresh': lambda: client_anon().post(
+                API_TOKEN_REFRESH_URL,
+                data={'refresh': str(RefreshToken.for_user(self.admin))},
+                format='json',
+            ),
+            'users-detail': lambda: client.put(
+                f'{API_USERS_URL}{self.admin.id}/',
+                data={
+                    'email': ADMIN_EMAIL,
+                    'first_name': 'Илона',
+                    'last_name': 'Маск',
+                    'phone': '+7 911 333 55 55',
+                },
+                format='json',
+            ),
+            'users-list': self.register_user,
+            'users-users-me': lambda: client.get(API_USERS_ME_URL),
+            'vacancies-bulk': self.create_vacancies,
+            'vacancies-detail': lambda: client.get(
+                f'{API_VACANCIES_URL}{self.vacancies[0].id}/'
+            ),
+            'vacancies-list': lambda: client.get(API_VACANCIES_URL),
+            'vacancies-matches': lambda: client.get(
+                API_VACANCIES_MATCHES_URL
+            ),
+        }
+
+    def _read_streaming(self, response: HttpResponse) -> HttpResponse:
+        """Читает потоковый ответ: SQL запросы выполняются при чтении."""
+        b''.join(response.streaming_content)
+        return response
+
+
+@pytest.mark.django_db
+class TestQueryBudgets():
+    """
+    Производит тест количества SQL запросов эндпоинтов в urlpatterns:
+    количество не должно расти с количеством объектов и превышать бюджет.
+    """
+
+    def test_budgets_declared(self) -> None:
+        """Производит тест наличия бюджета у каждого эндпоинта."""
+        url_names: set[str] = get_url_names(patterns=urls.urlpatterns)
+        assert url_names == set(QUERY_BUDGETS), (
+            'Убедитесь, что для каждого эндпоинта в api/v1/urls.py '
+            'объявлен бюджет SQL запросов в QUERY_BUDGETS.'
+        )
+        return
+
+    @pytest.mark.parametrize('url_name', sorted(QUERY_BUDGETS))
+    def test_query_budget(self, url_name, query_budget) -> None:
+        """Производит тест бюджета SQL запросов эндпоинта."""
+        data: QueryBudgetData = QueryBudgetData()
+        try:
+            response = query_budget(
+                url_name=url_name,
+                send=data.get_requests()[url_name],
+                populate=data.populate,
+            )
+        finally:
+            data.delete_files()
+        assert response.status_code < 400, (
+            f'Убедитесь, что эндпоинт {url_name} доступен.'
+        )
+        return
+
+    def test_query_budget_archived_matches(self, query_budget) -> None:
+        """
+        Производит тест бюджета SQL запросов подбора кандидатов
+        для нескольких архивных вакансий: количество запросов
+        не зависит от количества вакансий.
+        """
+        data: QueryBudgetData = QueryBudgetData()
+
+        def populate(num: int) -> None:
+            data.populate(num=num)
+            Vacancy.objects.filter(hr=data.admin).update(is_archived=True)
+            return
+
+        response = query_budget(
+            url_name='vacancies-matches:archived',
+            send=lambda: data.client.get(
+                f'{API_VACANCIES_MATCHES_URL}?ids=' + ','.join(
+                    str(vacancy.id) for vacancy in data.vacancies
+                )
+            ),
+            populate=populate,
+        )
+        assert len(response.data) == len(data.vacancies) and all(
+            item['count'] == len(data.students) for item in response.data
+        ), (
+            'Убедитесь, что для архивных вакансий возвращаются '
+            'подходящие кандидаты.'
+        )
+        return
@@ -0,0 +1,78 @@
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+
+from api.v1.tests.fixtures import create_reference_objs
+from hakaton.query_detector import (
+    NPlusOneQueryError, QueryDetectorMiddleware, normalize_sql,
+)
+from vacancy.models import Skill
+
+
+def get_skill_categories_view(request) -> HttpResponse:
+    """Представление с N+1: категория запрашивается для каждого навыка."""
+    names: list[str] = [skill.category.name for skill in Skill.objects.all()]
+    return HttpResponse(', '.join(names))
+
+
+@pytest.mark.django_db
+class TestQueryDetector():
+    """Производит тест обнаружения N+1 запросов к базе данных."""
+
+    def test_normalize_sql(self) -> None:
+        """Проверяет, что значения в SQL запросе не учитываются."""
+        assert normalize_sql(
+            sql="SELECT * FROM t WHERE id = 1 AND name = 'a' AND x IN (1, 2)"
+        ) == normalize_sql(
+            sql="SELECT * FROM t WHERE id = 2 AND name = 'b' AND x IN (3)"
+        ), (
+            'Убедитесь, что SQL запросы с разными значениями '
+            'приводятся к одному виду.'
+        )
+        return
+
+    @override_settings(QUERY_DETECTOR_THRESHOLD=2, QUERY_DETECTOR_RAISE=True)
+    def test_raise(self) -> None:
+        """Проверяет, что при превышении порога выбрасывается исключение."""
+        create_reference_objs(num=3)
+        middleware = QueryDetectorMiddleware(
+            get_response=get_skill_categories_view
+        )
+        with pytest.raises(NPlusOneQueryError) as error:
+            middleware(RequestFactory().get('/'))
+        assert '3 x SELECT' in str(error.value), (
+            'Убедитесь, что в сообщении указано количество повторов запроса.'
+        )
+        assert 'get_skill_categories_view' in str(error.value), (
+            'Убедитесь, что в сообщении есть стек вызовов кода проекта.'
+        )
+        return
+
+    @override_settings(QUERY_DETECTOR_THRESHOLD=2, QUERY_DETECTOR_RAISE=False)
+    def test_warning(self, caplog) -> None:
+        """
+        Проверяет, что при превышении порога пишется предупреждение,
+        а при повторах в пределах порога - нет.
+        """
+        create_reference_objs(num=2)
+        middleware = QueryDetectorMiddleware(
+            get_response=get_skill_categories_view
+        )
+        middleware(RequestFactory().get('/'))
+        assert not caplog.records, (
+            'Убедитесь, что повторы в пределах порога не считаются N+1.'
+        )
+        Skill.objects.create(
+            name='Новый навык', category=Skill.objects.first().category,
+        )
+        response = middleware(RequestFactory().get('/'))
+        assert response.status_code == 200, (
+            'Убедитесь, что без QUERY_DETECTOR_RAISE ответ не изменяется.'
+        )
+        assert any(
+            record.name == 'hakaton.query_detector'
+            for record in caplog.records
+        ), (
+            'Убедитесь, что N+1 запросы записываются в лог.'
+        )
+        return
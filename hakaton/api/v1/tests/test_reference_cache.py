@@ -0,0 +1,43 @@
+import pytest
+
+from vacancy.models import Skill, SkillCategory
+from vacancy.reference_cache import ReferenceCache
+
+
+@pytest.mark.django_db
+class TestReferenceCache():
+    """Производит тест кеша справочников в памяти процесса."""
+
+    def test_miss_checks_version(
+            self, django_capture_on_commit_callbacks) -> None:
+        """
+        Проверяет, что объект, созданный в другом процессе, доступен
+        сразу, не дожидаясь периодической проверки версии справочника.
+        """
+        # INFO: отдельный экземпляр кеша играет роль другого процесса:
+        #       сигналы модели сбрасывают только общий кеш процесса.
+        cache: ReferenceCache = ReferenceCache(model=Skill)
+        assert cache.all() == [], (
+            'Убедитесь, что кеш загружает справочник.'
+        )
+        with django_capture_on_commit_callbacks(execute=True):
+            skill: Skill = Skill.objects.create(
+                name='Новый навык',
+                category=SkillCategory.objects.create(name='Категория'),
+            )
+        assert (
+            cache.get(obj_id=skill.id) == skill
+            and cache.get_by_name(name=skill.name) == skill
+            and cache.get_many(ids=[skill.id]) == {skill.id: skill}
+        ), (
+            'Убедитесь, что при промахе кеш сразу проверяет версию '
+            'справочника и перечитывает его.'
+        )
+        assert (
+            cache.get(obj_id=skill.id + 1) is None
+            and cache.get(obj_id='abc') is None
+        ), (
+            'Убедитесь, что для несуществующих и некорректных ID '
+            'возвращается None.'
+        )
+        return
@@ -1,12 +1,40 @@
+import gzip
+import json
+
 import pytest
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import IntegrityError, connection
+from django.db.models import DecimalField, Value
+from django.db.models.functions import Cast
+from django.test.utils import CaptureQueriesContext
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
 
 from api.v1.tests.fixtures import (
     client_anon, client_auth_admin, create_user_obj, create_admin_user_obj,
-    API_TOKEN_CREATE_URL, API_TOKEN_REFRESH_URL,
-    API_TASKS_URL, API_USERS_URL, API_USERS_ME_URL,
+    create_reference_objs, create_student_obj, create_vacancy_obj,
+    get_vacancy_data,
+    API_DICTIONARIES_URL, API_EXPORTS_URL, API_SKILL_CATEGORIES_URL,
+    API_SKILLS_URL, API_STUDENTS_URL, API_STUDENTS_EXPORT_URL,
+    API_STUDENTS_FACETS_URL, API_TOKEN_CREATE_URL, API_TOKEN_REFRESH_URL,
+    API_TASKS_URL, API_USERS_URL, API_USERS_ME_URL, API_VACANCIES_BULK_URL,
+    API_VACANCIES_MATCHES_URL, API_VACANCIES_URL,
     TASK_DATA_HR_INVALID, USER_DATA_VALID,
 )
-from user.models import HrTask, User
+from api.v1.paginations import StudentCursorPagination
+from api.v1.serializers import StudentSerializer
+from hakaton.app_data import (
+    STUDENT_SEARCH_RANK_DECIMAL_PLACES, STUDENT_SEARCH_RANK_MAX_DIGITS,
+)
+from student.models import Student
+from student.search import is_search_vector_supported
+from user.models import ExportJob, HrTask, User
+from vacancy.autocomplete import skill_autocomplete
+from vacancy.models import (
+    City, Skill, Vacancy, VacancyMatch, VacancySkill,
+)
+from vacancy.tasks import update_autocomplete_popularity
 
 
 @pytest.mark.django_db
@@ -153,3 +181,1307 @@ class TestEndpoints():
         client_auth_admin().get(API_USERS_ME_URL)
         self._compare_user_data(user_data=user_data)
         return
+
+    def _create_students_for_matching(self) -> dict[str, list]:
+        """
+        Создает справочные объекты и трех студентов
+        с первыми типом занятости и графиком работы:
+            - первый владеет навыками 0, 1 и языком 0 на уровне 2
+            - второй владеет навыком 0 и языком 0 на уровне 1
+            - третий владеет навыками 0, 1, 2 и языком 1 на уровне 2
+        """
+        refs: dict[str, list] = create_reference_objs()
+        skills, languages, levels = (
+            refs['skills'], refs['languages'], refs['levels']
+        )
+        refs['students'] = [
+            create_student_obj(
+                num=1,
+                city=refs['cities'][0],
+                experience=refs['experiences'][0],
+                employments=refs['employments'][:1],
+                schedules=refs['schedules'][:1],
+                languages=((languages[0], levels[2]),),
+                skills=skills[:2],
+            ),
+            create_student_obj(
+                num=2,
+                city=refs['cities'][0],
+                experience=refs['experiences'][0],
+                employments=refs['employments'][:1],
+                schedules=refs['schedules'][:1],
+                languages=((languages[0], levels[1]),),
+                skills=skills[:1],
+            ),
+            create_student_obj(
+                num=3,
+                city=refs['cities'][0],
+                experience=refs['experiences'][0],
+                employments=refs['employments'][:1],
+                schedules=refs['schedules'][:1],
+                languages=((languages[1], levels[2]),),
+                skills=skills,
+            ),
+        ]
+        return refs
+
+    def test_students_filter_by_skills(self) -> None:
+        """
+        Тест GET запроса списка кандидатов, владеющих всеми
+        указанными навыками.
+        """
+        refs: dict[str, list] = self._create_students_for_matching()
+        skills_ids: str = ','.join(
+            str(skill.id) for skill in refs['skills'][:2]
+        )
+        client = client_auth_admin()
+        response = client.get(f'{API_STUDENTS_URL}?skills={skills_ids}')
+        received_ids: set[int] = set(
+            student['id'] for student in response.data['results']
+        )
+        expected_ids: set[int] = set(
+            (refs['students'][0].id, refs['students'][2].id)
+        )
+        assert received_ids == expected_ids, (
+            'Убедитесь, что фильтрация по навыкам возвращает только тех '
+            'кандидатов, которые владеют всеми указанными навыками.'
+        )
+        for url in (API_STUDENTS_URL, API_STUDENTS_FACETS_URL):
+            for skills in ('abc', ''):
+                response = client.get(f'{url}?skills={skills}')
+                assert response.status_code == 400, (
+                    f'Убедитесь, что при skills={skills} эндпоинт {url} '
+                    'возвращает 400.'
+                )
+        return
+
+    def test_students_filter_by_languages(self) -> None:
+        """
+        Тест GET запроса списка кандидатов, владеющих всеми
+        указанными языками на требуемом уровне.
+        """
+        refs: dict[str, list] = self._create_students_for_matching()
+        language, level = refs['languages'][0], refs['levels'][2]
+        client = client_auth_admin()
+        response = client.get(
+            f'{API_STUDENTS_URL}?languages={language.id}-{level.id}'
+        )
+        received_ids: list[int] = [
+            student['id'] for student in response.data['results']
+        ]
+        assert received_ids == [refs['students'][0].id], (
+            'Убедитесь, что фильтрация по языкам возвращает только тех '
+            'кандидатов, которые владеют языком на требуемом уровне.'
+        )
+        response = client.get(
+            f'{API_STUDENTS_URL}?languages={language.id}-'
+            f'{refs["levels"][1].id},{language.id}-{level.id}'
+        )
+        received_ids: list[int] = [
+            student['id'] for student in response.data['results']
+        ]
+        assert received_ids == [refs['students'][0].id], (
+            'Убедитесь, что несколько требований к одному языку '
+            'сводятся к наибольшему уровню.'
+        )
+        for languages in ('1', 'abc-1', '1-2-3', ''):
+            response = client.get(f'{API_STUDENTS_URL}?languages={languages}')
+            assert response.status_code == 400, (
+                f'Убедитесь, что при languages={languages} '
+                'возвращается 400.'
+            )
+        return
+
+    def test_students_from_vacancy(
+            self, django_capture_on_commit_callbacks) -> None:
+        """
+        Тест GET запроса списка кандидатов, подходящих под требования
+        вакансии по навыкам.
+        Таблица подходящих кандидатов пересчитывается после коммита.
+        """
+        with django_capture_on_commit_callbacks(execute=True):
+            refs: dict[str, list] = self._create_students_for_matching()
+            vacancy = create_vacancy_obj(
+                num=1,
+                hr=create_user_obj(num=1),
+                refs=refs,
+                skills=refs['skills'][:2],
+            )
+        client = client_auth_admin()
+        url: str = f'{API_STUDENTS_URL}?from_vacancy={vacancy.id}&limit=1'
+        pages: list[list[int]] = []
+        queries_num: list[int] = []
+        while url is not None and len(pages) < 3:
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get(url)
+            pages.append(
+                [student['id'] for student in response.data['results']]
+            )
+            queries_num.append(len(queries.captured_queries))
+            url = response.data['next']
+        expected_ids: list[int] = [
+            refs['students'][2].id, refs['students'][0].id
+        ]
+        assert sum(pages, []) == expected_ids, (
+            'Убедитесь, что при передаче from_vacancy возвращаются только '
+            'кандидаты, которые соответствуют требованиям вакансии.'
+        )
+        assert queries_num[1] < queries_num[0], (
+            'Убедитесь, что список кандидатов вакансии кешируется '
+            'и следующие страницы не подбирают кандидатов заново.'
+        )
+        response = client.get(response.data['previous'])
+        assert [
+            student['id'] for student in response.data['results']
+        ] == pages[0], (
+            'Убедитесь, что ссылка previous возвращает предыдущую страницу.'
+        )
+        return
+
+    def test_students_from_archived_vacancy(
+            self, django_capture_on_commit_callbacks) -> None:
+        """
+        Тест GET запроса списка кандидатов для архивной вакансии:
+        строки VacancyMatch удалены, кандидаты подбираются
+        по требованиям вакансии.
+        """
+        with django_capture_on_commit_callbacks(execute=True):
+            refs: dict[str, list] = self._create_students_for_matching()
+            vacancy = create_vacancy_obj(
+                num=1,
+                hr=create_user_obj(num=1),
+                refs=refs,
+                skills=refs['skills'][:2],
+            )
+        with django_capture_on_commit_callbacks(execute=True):
+            vacancy.is_archived = True
+            vacancy.save()
+        response = client_auth_admin().get(
+            f'{API_STUDENTS_URL}?from_vacancy={vacancy.id}'
+        )
+        received_ids: list[int] = [
+            student['id'] for student in response.data['results']
+        ]
+        assert received_ids == [
+            refs['students'][2].id, refs['students'][0].id
+        ], (
+            'Убедитесь, что для архивной вакансии возвращаются кандидаты, '
+            'которые соответствуют требованиям вакансии.'
+        )
+        return
+
+    def test_students_from_vacancy_ranked(self) -> None:
+        """
+        Тест GET запроса ранжированного списка кандидатов для вакансии:
+        частично подходящие кандидаты возвращаются с меньшей оценкой.
+        """
+        refs: dict[str, list] = self._create_students_for_matching()
+        vacancy = create_vacancy_obj(
+            num=1,
+            hr=create_user_obj(num=1),
+            refs=refs,
+            skills=refs['skills'][:2],
+        )
+        client = client_auth_admin()
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(
+                f'{API_STUDENTS_URL}?from_vacancy={vacancy.id}'
+                '&mode=ranked&limit=2'
+            )
+        received_ids: list[int] = [
+            student['id'] for student in response.data['results']
+        ]
+        expected_ids: list[int] = [
+            refs['students'][2].id, refs['students'][0].id
+        ]
+        assert received_ids == expected_ids, (
+            'Убедитесь, что ранжированная выдача возвращает limit кандидатов '
+            'с наибольшей оценкой соответствия вакансии.'
+        )
+        assert any(
+            'FROM "student_student"' in query['sql']
+            and 'ORDER BY' in query['sql']
+            and query['sql'].endswith('LIMIT 3')
+            for query in queries.captured_queries
+        ), (
+            'Убедитесь, что top-k кандидатов выбирается в БД '
+            '(ORDER BY score LIMIT k + 1) без OFFSET.'
+        )
+        assert response.data['results'][0]['score'] > 0, (
+            'Убедитесь, что ранжированная выдача содержит поле score.'
+        )
+        response = client.get(response.data['next'])
+        received_ids: list[int] = [
+            student['id'] for student in response.data['results']
+        ]
+        assert received_ids == [refs['students'][1].id], (
+            'Убедитесь, что следующая страница ранжированной выдачи '
+            'продолжает сортировку по оценке соответствия.'
+        )
+        return
+
+    def test_students_from_vacancy_ranked_fields(self) -> None:
+        """
+        Тест GET запроса ранжированного списка кандидатов для вакансии
+        с ограничением полей: поле score можно запросить в ?fields
+        только при ранжированной выдаче.
+        """
+        refs: dict[str, list] = self._create_students_for_matching()
+        vacancy = create_vacancy_obj(
+            num=1,
+            hr=create_user_obj(num=1),
+            refs=refs,
+            skills=refs['skills'][:2],
+        )
+        client = client_auth_admin()
+        response = client.get(
+            f'{API_STUDENTS_URL}?from_vacancy={vacancy.id}'
+            '&mode=ranked&fields=id,score'
+        )
+        assert response.status_code == 200, (
+            'Убедитесь, что при ранжированной выдаче поле score '
+            'можно запросить в ?fields.'
+        )
+        assert all(
+            set(student) == {'id', 'score'}
+            for student in response.data['results']
+        ), (
+            'Убедитесь, что ответ содержит только запрошенные поля.'
+        )
+        response = client.get(
+            f'{API_STUDENTS_URL}?from_vacancy={vacancy.id}'
+            '&mode=ranked&fields=id'
+        )
+        assert all(
+            set(student) == {'id'} for student in response.data['results']
+        ), (
+            'Убедитесь, что score не возвращается, если не запрошен в ?fields.'
+        )
+        response = client.get(
+            f'{API_STUDENTS_URL}?from_vacancy={vacancy.id}&fields=id,score'
+        )
+        assert response.status_code == 400, (
+            'Убедитесь, что вне ранжированной выдачи поле score неизвестно.'
+        )
+        return
+
+    def test_students_ranked_ties(self, monkeypatch) -> None:
+        """
+        Тест постраничного вывода ранжированного списка кандидатов
+        с одинаковой оценкой: курсор учитывает id, поэтому страницы
+        не повторяются и при количестве одинаковых оценок больше
+        offset_cutoff, а переход назад возвращает предыдущую страницу.
+        """
+        monkeypatch.setattr(StudentCursorPagination, 'offset_cutoff', 3)
+        refs: dict[str, list] = create_reference_objs()
+        students: list[Student] = [
+            create_student_obj(
+                num=num,
+                city=refs['cities'][0],
+                experience=refs['experiences'][0],
+                skills=refs['skills'][:1],
+            ) for num in range(10)
+        ]
+        vacancy: Vacancy = create_vacancy_obj(
+            num=1,
+            hr=create_user_obj(num=1),
+            refs=refs,
+            skills=refs['skills'][:1],
+        )
+        client = client_auth_admin()
+        url: str = (
+            f'{API_STUDENTS_URL}?from_vacancy={vacancy.id}'
+            '&mode=ranked&limit=2'
+        )
+        pages: list[list[int]] = []
+        # INFO: количество страниц ограничено, чтобы зацикленные ссылки
+        #       next не приводили к бесконечному тесту.
+        for _ in students:
+            response = client.get(url)
+            pages.append(
+                [student['id'] for student in response.data['results']]
+            )
+            url = response.data['next']
+            if url is None:
+                break
+        assert sum(pages, []) == sorted(
+            (student.id for student in students), reverse=True
+        ), (
+            'Убедитесь, что при одинаковой оценке постраничный вывод '
+            'возвращает каждого кандидата ровно один раз.'
+        )
+        response = client.get(response.data['previous'])
+        assert [
+            student['id'] for student in response.data['results']
+        ] == pages[-2], (
+            'Убедитесь, что ссылка previous возвращает предыдущую страницу.'
+        )
+        return
+
+    def test_students_from_vacancy_twin(
+            self, django_capture_on_commit_callbacks) -> None:
+        """
+        Тест GET запроса списка кандидатов для вакансий с одинаковыми
+        требованиями: вакансии используют общую запись кеша, а пересчет
+        строк VacancyMatch после изменения данных студентов делает
+        запись устаревшей.
+        """
+        hr: User = create_user_obj(num=1)
+        with django_capture_on_commit_callbacks(execute=True):
+            refs: dict[str, list] = self._create_students_for_matching()
+            vacancy = create_vacancy_obj(
+                num=1, hr=hr, refs=refs, skills=refs['skills'][:2],
+            )
+            twin = create_vacancy_obj(
+                num=2, hr=hr, refs=refs, skills=refs['skills'][1::-1],
+            )
+        client = client_auth_admin()
+        client.get(f'{API_STUDENTS_URL}?from_vacancy={vacancy.id}')
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(f'{API_STUDENTS_URL}?from_vacancy={twin.id}')
+        received_ids: list[int] = [
+            student['id'] for student in response.data['results']
+        ]
+        assert received_ids == [
+            refs['students'][2].id, refs['students'][0].id
+        ], (
+            'Убедитесь, что вакансии с одинаковыми требованиями используют '
+            'общую запись кеша кандидатов.'
+        )
+        assert not any(
+            VacancyMatch._meta.db_table in query['sql']
+            for query in queries.captured_queries
+        ), (
+            'Убедитесь, что кандидаты вакансии с такими же требованиями '
+            'берутся из кеша, а не из таблицы VacancyMatch.'
+        )
+        with django_capture_on_commit_callbacks(execute=True):
+            refs['students'][1].student_skill.create(skill=refs['skills'][1])
+        response = client.get(f'{API_STUDENTS_URL}?from_vacancy={twin.id}')
+        received_ids: list[int] = [
+            student['id'] for student in response.data['results']
+        ]
+        assert received_ids == [
+            student.id for student in reversed(refs['students'])
+        ], (
+            'Убедитесь, что после пересчета подходящих студентов кеш '
+            'кандидатов вакансии не используется.'
+        )
+        return
+
+    def test_students_from_vacancy_before_refresh(
+            self, django_capture_on_commit_callbacks) -> None:
+        """
+        Тест GET запроса списка кандидатов для вакансии, изменения которой
+        еще не пересчитаны в таблице VacancyMatch: список без фильтров
+        совпадает со строками таблицы, как и остальные выдачи,
+        а новая вакансия с такими же требованиями не получает
+        запись кеша по прежним строкам.
+        """
+        hr: User = create_user_obj(num=1)
+        with django_capture_on_commit_callbacks(execute=True):
+            refs: dict[str, list] = self._create_students_for_matching()
+            vacancy = create_vacancy_obj(
+                num=1, hr=hr, refs=refs, skills=refs['skills'][:2],
+            )
+        client = client_auth_admin(admin=hr)
+        client.get(f'{API_STUDENTS_URL}?from_vacancy={vacancy.id}')
+        with django_capture_on_commit_callbacks() as callbacks:
+            VacancySkill.objects.filter(
+                vacancy=vacancy, skill=refs['skills'][1],
+            ).delete()
+            twin = create_vacancy_obj(
+                num=2, hr=hr, refs=refs, skills=refs['skills'][:1],
+            )
+        for from_vacancy, expected_ids in (
+                (vacancy, [refs['students'][2].id, refs['students'][0].id]),
+                (twin, []),
+                ):  # noqa (E124)
+            response = client.get(
+                f'{API_STUDENTS_URL}?from_vacancy={from_vacancy.id}'
+            )
+            received_ids: list[int] = [
+                student['id'] for student in response.data['results']
+            ]
+            matches = client.get(API_VACANCIES_MATCHES_URL)
+            assert received_ids == expected_ids == next(
+                item['students'] for item in matches.data
+                if item['vacancy'] == from_vacancy.id
+            ), (
+                'Убедитесь, что до пересчета строк VacancyMatch список '
+                'кандидатов совпадает со строками таблицы.'
+            )
+        with django_capture_on_commit_callbacks(execute=True):
+            for callback in callbacks:
+                callback()
+        for from_vacancy in (vacancy, twin):
+            response = client.get(
+                f'{API_STUDENTS_URL}?from_vacancy={from_vacancy.id}'
+            )
+            received_ids: list[int] = [
+                student['id'] for student in response.data['results']
+            ]
+            assert received_ids == [
+                student.id for student in reversed(refs['students'])
+            ], (
+                'Убедитесь, что после пересчета строк VacancyMatch список '
+                'кандидатов соответствует новым требованиям вакансии.'
+            )
+        return
+
+    def test_vacancies_matches(
+            self, django_capture_on_commit_callbacks) -> None:
+        """
+        Тест GET запроса подходящих кандидатов для всех неархивных
+        вакансий пользователя и для указанной архивной вакансии.
+        """
+        hr: User = create_user_obj(num=1)
+        with django_capture_on_commit_callbacks(execute=True):
+            refs: dict[str, list] = self._create_students_for_matching()
+            vacancies = [
+                create_vacancy_obj(
+                    num=num, hr=hr, refs=refs, skills=skills,
+                ) for num, skills in (
+                    (1, refs['skills'][:2]),
+                    (2, refs['skills']),
+                )
+            ]
+        response = client_auth_admin(admin=hr).get(API_VACANCIES_MATCHES_URL)
+        received: dict[int, list[int]] = {
+            item['vacancy']: item['students'] for item in response.data
+        }
+        expected: dict[int, list[int]] = {
+            vacancies[0].id: [refs['students'][2].id, refs['students'][0].id],
+            vacancies[1].id: [refs['students'][2].id],
+        }
+        assert received == expected, (
+            f'Убедитесь, что эндпоинт {API_VACANCIES_MATCHES_URL} возвращает '
+            'подходящих кандидатов для всех вакансий пользователя.'
+        )
+        with django_capture_on_commit_callbacks(execute=True):
+            vacancies[0].is_archived = True
+            vacancies[0].save()
+        response = client_auth_admin(admin=hr).get(
+            f'{API_VACANCIES_MATCHES_URL}?ids={vacancies[0].id}'
+        )
+        assert response.data == [
+            {
+                'vacancy': vacancies[0].id,
+                'count': 2,
+                'students': expected[vacancies[0].id],
+            }
+        ], (
+            'Убедитесь, что для архивной вакансии кандидаты подбираются '
+            'по ее требованиям, как и в /students/?from_vacancy=.'
+        )
+        return
+
+    def test_students_from_vacancy_language_level(
+            self, django_capture_on_commit_callbacks) -> None:
+        """
+        Тест GET запроса списка кандидатов, подходящих под требования
+        вакансии по языкам: уровень владения сравнивается по порядковому
+        значению уровня, а не по его ID.
+        """
+        with django_capture_on_commit_callbacks(execute=True):
+            refs: dict[str, list] = self._create_students_for_matching()
+            vacancy = create_vacancy_obj(
+                num=1,
+                hr=create_user_obj(num=1),
+                refs=refs,
+                languages=((refs['languages'][0], refs['levels'][1]),),
+            )
+        response = client_auth_admin().get(
+            f'{API_STUDENTS_URL}?from_vacancy={vacancy.id}'
+        )
+        received_ids: list[int] = [
+            student['id'] for student in response.data['results']
+        ]
+        expected_ids: list[int] = [
+            refs['students'][1].id, refs['students'][0].id
+        ]
+        assert received_ids == expected_ids, (
+            'Убедитесь, что при передаче from_vacancy возвращаются только '
+            'кандидаты, владеющие языком на уровне не ниже требуемого.'
+        )
+        return
+
+    def test_students_unwatched(self) -> None:
+        """
+        Тест GET запроса списка кандидатов, которых пользователь
+        еще не просматривал.
+        """
+        refs: dict[str, list] = self._create_students_for_matching()
+        client = client_auth_admin()
+        watched_id: int = refs['students'][0].id
+        client.post(f'{API_STUDENTS_URL}{watched_id}/mark_watched/')
+        response = client.get(f'{API_STUDENTS_URL}?unwatched=1')
+        received_ids: set[int] = set(
+            student['id'] for student in response.data['results']
+        )
+        expected_ids: set[int] = set(
+            student.id for student in refs['students'][1:]
+        )
+        assert received_ids == expected_ids, (
+            'Убедитесь, что при передаче unwatched=1 просмотренные '
+            'кандидаты не возвращаются.'
+        )
+        response = client.get(f'{API_STUDENTS_URL}?watched=1')
+        received_ids: list[int] = [
+            student['id'] for student in response.data['results']
+        ]
+        assert received_ids == [watched_id], (
+            'Убедитесь, что при передаче watched=1 возвращаются только '
+            'просмотренные кандидаты.'
+        )
+        for query in ('watched=0', 'unwatched=false'):
+            response = client.get(f'{API_STUDENTS_URL}?{query}')
+            assert len(response.data['results']) == 3, (
+                f'Убедитесь, что при передаче {query} '
+                'кандидаты не фильтруются.'
+            )
+        response = client.get(f'{API_STUDENTS_URL}?watched=maybe')
+        assert response.status_code == 400, (
+            'Убедитесь, что при нелогическом значении watched '
+            'возвращается 400.'
+        )
+        return
+
+    def test_students_watched_other_hr_vacancy(
+            self, django_capture_on_commit_callbacks) -> None:
+        """
+        Тест GET запроса просмотренных кандидатов вакансии другого
+        пользователя: просмотры чужой вакансии не возвращаются.
+        """
+        owner: User = create_user_obj(num=1)
+        with django_capture_on_commit_callbacks(execute=True):
+            refs: dict[str, list] = self._create_students_for_matching()
+            vacancy: Vacancy = create_vacancy_obj(
+                num=1, hr=owner, refs=refs, skills=refs['skills'][:1],
+            )
+        owner_client = client_auth_admin(admin=owner)
+        watched_id: int = refs['students'][0].id
+        owner_client.post(
+            f'{API_STUDENTS_URL}{watched_id}/mark_watched/'
+            f'?vacancy={vacancy.id}'
+        )
+        url: str = f'{API_STUDENTS_URL}?from_vacancy={vacancy.id}&watched=1'
+        response = owner_client.get(url)
+        assert [
+            student['id'] for student in response.data['results']
+        ] == [watched_id], (
+            'Убедитесь, что владелец вакансии получает просмотренных '
+            'им кандидатов.'
+        )
+        other_client = client_auth_admin(admin=create_user_obj(num=2))
+        response = other_client.post(
+            f'{API_STUDENTS_URL}{watched_id}/mark_watched/'
+            f'?vacancy={vacancy.id}'
+        )
+        assert response.status_code == 404, (
+            'Убедитесь, что отметить просмотр в чужой вакансии нельзя.'
+        )
+        response = other_client.get(url)
+        assert response.data['results'] == [], (
+            'Убедитесь, что просмотры кандидатов чужой вакансии '
+            'не возвращаются.'
+        )
+        return
+
+    def test_students_facets(self) -> None:
+        """
+        Тест GET запроса количества кандидатов по значениям фильтров
+        с учетом переданных query параметров.
+        """
+        refs: dict[str, list] = self._create_students_for_matching()
+        skill_id: int = refs['skills'][1].id
+        response = client_auth_admin().get(
+            f'{API_STUDENTS_FACETS_URL}?skills={skill_id}'
+        )
+        assert response.data['cities'] == [
+            {'id': refs['cities'][0].id, 'count': 2}
+        ], (
+            'Убедитесь, что количество кандидатов считается только '
+            'среди подходящих под query параметры.'
+        )
+        assert response.data['skills'] == [
+            {'id': skill.id, 'count': count}
+            for skill, count in zip(refs['skills'], (2, 2, 1))
+        ], (
+            'Убедитесь, что количество кандидатов считается '
+            'для каждого навыка.'
+        )
+        return
+
+    def test_students_search(self) -> None:
+        """
+        Тест GET запроса на поиск кандидатов по тексту профиля
+        совместно с фильтрами.
+        """
+        refs: dict[str, list] = self._create_students_for_matching()
+        first, second, third = refs['students']
+        for student in (first, second):
+            student.about_exp = 'Разрабатывал backend на Django.'
+            student.save()
+        third.specialization = 'Аналитик данных'
+        third.save()
+        client = client_auth_admin()
+        response = client.get(
+            f'{API_STUDENTS_URL}?search=Django'
+            f'&skills={refs["skills"][1].id}'
+        )
+        received_ids: list[int] = [
+            student['id'] for student in response.data['results']
+        ]
+        assert received_ids == [first.id], (
+            'Убедитесь, что поиск по тексту профиля '
+            'совмещается с фильтрами.'
+        )
+        response = client.get(
+            f'{API_STUDENTS_URL}?search=Аналитик'
+        )
+        received_ids: list[int] = [
+            student['id'] for student in response.data['results']
+        ]
+        assert received_ids == [third.id], (
+            'Убедитесь, что поиск производится по специализации.'
+        )
+        return
+
+    def test_students_search_rank_ties(self) -> None:
+        """
+        Тест постраничного вывода кандидатов, отсортированных
+        по релевантности numeric, при одинаковой релевантности: позиция
+        курсора сравнивается в БД точно, и каждый кандидат выводится
+        ровно один раз.
+        """
+        refs: dict[str, list] = create_reference_objs()
+        students: list[Student] = [
+            create_student_obj(
+                num=num,
+                city=refs['cities'][0],
+                experience=refs['experiences'][0],
+            ) for num in range(5)
+        ]
+        ranked = Student.objects.annotate(
+            rank=Cast(
+                Value(0.5),
+                output_field=DecimalField(
+                    max_digits=STUDENT_SEARCH_RANK_MAX_DIGITS,
+                    decimal_places=STUDENT_SEARCH_RANK_DECIMAL_PLACES,
+                ),
+            ),
+        ).order_by('-rank', '-id')
+        url: str = f'{API_STUDENTS_URL}?limit=2'
+        pages: list[list[int]] = []
+        for _ in students:
+            paginator: StudentCursorPagination = StudentCursorPagination()
+            page: list[Student] = paginator.paginate_queryset(
+                ranked, Request(APIRequestFactory().get(url)),
+            )
+            pages.append([student.id for student in page])
+            url = paginator.get_next_link()
+            if url is None:
+                break
+        assert sum(pages, []) == sorted(
+            (student.id for student in students), reverse=True
+        ), (
+            'Убедитесь, что при одинаковой релевантности постраничный '
+            'вывод возвращает каждого кандидата ровно один раз.'
+        )
+        return
+
+    @pytest.mark.skipif(
+        not is_search_vector_supported(),
+        reason='Полнотекстовый поиск доступен только в PostgreSQL.',
+    )
+    def test_students_search_ties(self) -> None:
+        """
+        Тест постраничного вывода результатов полнотекстового поиска
+        при одинаковой релевантности ts_rank (float4).
+        """
+        refs: dict[str, list] = create_reference_objs()
+        students: list[Student] = []
+        for num in range(5):
+            student: Student = create_student_obj(
+                num=num,
+                city=refs['cities'][0],
+                experience=refs['experiences'][0],
+            )
+            student.about_exp = 'Разрабатывал backend на Django.'
+            student.save()
+            students.append(student)
+        client = client_auth_admin()
+        url: str = f'{API_STUDENTS_URL}?search=Django&limit=2'
+        pages: list[list[int]] = []
+        for _ in students:
+            response = client.get(url)
+            pages.append(
+                [student['id'] for student in response.data['results']]
+            )
+            url = response.data['next']
+            if url is None:
+                break
+        assert sum(pages, []) == sorted(
+            (student.id for student in students), reverse=True
+        ), (
+            'Убедитесь, что при одинаковой релевантности поиска '
+            'постраничный вывод возвращает каждого кандидата ровно один раз.'
+        )
+        return
+
+    def test_skills_autocomplete(
+            self, django_capture_on_commit_callbacks,
+            django_assert_num_queries) -> None:
+        """
+        Тест GET запроса подсказок навыков: поиск без учета регистра,
+        по вхождению и с опечаткой, сортировка по популярности,
+        которую пересчитывает задача Celery, а не запрос подсказок.
+        """
+        refs: dict[str, list] = create_reference_objs()
+        with django_capture_on_commit_callbacks(execute=True):
+            python, python_web, postgres = (
+                Skill.objects.create(
+                    name=name, category=refs['skills'][0].category,
+                )
+                for name in ('Python', 'Python Web', 'PostgreSQL')
+            )
+        create_student_obj(
+            num=1,
+            city=refs['cities'][0],
+            experience=refs['experiences'][0],
+            skills=(python_web,),
+        )
+        client = client_auth_admin()
+        response = client.get(f'{API_SKILLS_URL}?search=python')
+        assert [skill['id'] for skill in response.data] == [
+            python.id, python_web.id
+        ], (
+            'Убедитесь, что до пересчета популярности подсказки '
+            'сортируются по названию.'
+        )
+        update_autocomplete_popularity()
+        with django_assert_num_queries(0):
+            skill_autocomplete.search(text='python')
+        cases: tuple[tuple[str, list[Skill]]] = (
+            ('python', [python_web, python]),
+            ('sql', [postgres]),
+            ('pytgon', [python_web, python]),
+        )
+        for search, expected in cases:
+            response = client.get(f'{API_SKILLS_URL}?search={search}')
+            assert [skill['id'] for skill in response.data] == [
+                skill.id for skill in expected
+            ], (
+                f'Убедитесь, что по запросу "{search}" '
+                'возвращаются подходящие навыки.'
+            )
+        return
+
+    def test_students_sparse_fieldsets(self) -> None:
+        """
+        Тест GET запроса списка кандидатов с ограниченным набором полей:
+        ?fields=<поля> и ?view=compact.
+        """
+        self._create_students_for_matching()
+        client = client_auth_admin()
+        response = client.get(f'{API_STUDENTS_URL}?fields=id,city')
+        assert all(
+            set(student) == {'id', 'city'}
+            for student in response.data['results']
+        ), (
+            'Убедитесь, что ?fields ограничивает набор полей ответа.'
+        )
+        response = client.get(f'{API_STUDENTS_URL}?view=compact')
+        assert all(
+            set(student) == set(StudentSerializer.Meta.compact_fields)
+            for student in response.data['results']
+        ), (
+            'Убедитесь, что ?view=compact возвращает сокращенный набор полей.'
+        )
+        response = client.get(f'{API_STUDENTS_URL}?fields=id,password')
+        assert response.status_code == 400, (
+            'Убедитесь, что при запросе несуществующего поля '
+            'возвращается ошибка 400.'
+        )
+        return
+
+    def test_students_export(self) -> None:
+        """
+        Тест GET запроса потоковой выгрузки кандидатов в CSV и NDJSON
+        с учетом query параметров.
+        """
+        refs: dict[str, list] = self._create_students_for_matching()
+        skill_id: int = refs['skills'][1].id
+        client = client_auth_admin()
+        response = client.get(
+            f'{API_STUDENTS_EXPORT_URL}?skills={skill_id}'
+            '&fields=id,last_name&export_format=ndjson'
+        )
+        rows: list[dict] = [
+            json.loads(line)
+            for line in b''.join(response.streaming_content).splitlines()
+        ]
+        assert rows == [
+            {'id': student.id, 'last_name': student.last_name}
+            for student in (refs['students'][2], refs['students'][0])
+        ], (
+            'Убедитесь, что выгрузка NDJSON содержит подходящих '
+            'кандидатов с запрошенными полями.'
+        )
+        response = client.get(
+            f'{API_STUDENTS_EXPORT_URL}?skills={skill_id}&fields=id,city'
+        )
+        content: str = b''.join(response.streaming_content).decode()
+        assert content.lstrip('\ufeff').splitlines() == [
+            'id,city',
+            f'{refs["students"][2].id},{refs["cities"][0].name}',
+            f'{refs["students"][0].id},{refs["cities"][0].name}',
+        ], (
+            'Убедитесь, что выгрузка CSV содержит заголовок и строки '
+            'подходящих кандидатов.'
+        )
+        return
+
+    def test_export_job(self, django_capture_on_commit_callbacks) -> None:
+        """
+        Тест POST запроса на создание фоновой выгрузки кандидатов,
+        GET запроса ее статуса и скачивания файла только автором.
+        """
+        refs: dict[str, list] = self._create_students_for_matching()
+        client = client_auth_admin()
+        with django_capture_on_commit_callbacks(execute=True):
+            response = client.post(
+                API_EXPORTS_URL,
+                data={
+                    'kind': 'students',
+                    'query': {
+                        'skills': str(refs['skills'][1].id),
+                        'fields': 'id,last_name',
+                    },
+                },
+                format='json',
+            )
+        assert response.status_code == 201, (
+            'Убедитесь, что выгрузка создается.'
+        )
+        response = client.get(f'{API_EXPORTS_URL}{response.data["id"]}/')
+        assert response.data['status'] == 'done', (
+            'Убедитесь, что после выполнения задачи Celery '
+            'выгрузка получает статус done.'
+        )
+        job: ExportJob = ExportJob.objects.get(id=response.data['id'])
+        download_url: str = f'{API_EXPORTS_URL}{job.id}/download/'
+        assert response.data['file'].endswith(download_url), (
+            'Убедитесь, что выгрузка ссылается на эндпоинт скачивания, '
+            'а не на публичный файл.'
+        )
+        file_path: str = job.file.path
+        assert (
+            not file_path.startswith(settings.MEDIA_ROOT)
+            and file_path.startswith(settings.PRIVATE_MEDIA_ROOT)
+            and f'{job.kind}_{job.id}.' not in job.file.name
+        ), (
+            'Убедитесь, что файл выгрузки хранится вне MEDIA_ROOT '
+            'под случайным именем.'
+        )
+        other_response = client_auth_admin(
+            admin=create_user_obj(num=1)
+        ).get(download_url)
+        anon_response = client_anon().get(download_url)
+        response = client.get(download_url)
+        content: bytes = b''.join(response.streaming_content)
+        job.file.delete()
+        assert (
+            other_response.status_code == 404
+            and anon_response.status_code == 401
+        ), (
+            'Убедитесь, что файл выгрузки доступен только ее автору.'
+        )
+        assert response.status_code == 200, (
+            'Убедитесь, что автор выгрузки может скачать файл.'
+        )
+        lines: list[str] = (
+            gzip.decompress(content).decode('utf-8')
+            .lstrip('\ufeff').splitlines()
+        )
+        assert lines == [
+            'id,last_name',
+            *(
+                f'{student.id},{student.last_name}'
+                for student in (refs['students'][2], refs['students'][0])
+            ),
+        ], (
+            'Убедитесь, что файл выгрузки содержит подходящих кандидатов.'
+        )
+        return
+
+    def test_dictionaries(self, django_capture_on_commit_callbacks) -> None:
+        """
+        Тест GET запроса всех справочников: повторный запрос с ETag
+        возвращает 304, пока справочники не изменились.
+        """
+        create_reference_objs()
+        client = client_auth_admin()
+        response = client.get(API_DICTIONARIES_URL)
+        assert response.status_code == 200, (
+            'Убедитесь, что справочники доступны.'
+        )
+        etag: str = response['ETag']
+        response = client.get(API_DICTIONARIES_URL, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304, (
+            'Убедитесь, что при совпадении ETag возвращается 304.'
+        )
+        with django_capture_on_commit_callbacks(execute=True):
+            City.objects.create(name='Новый город')
+        response = client.get(API_DICTIONARIES_URL, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200, (
+            'Убедитесь, что после изменения справочника '
+            'возвращается новый ответ.'
+        )
+        assert 'Новый город' in (
+            city['name'] for city in response.json()['cities']
+        ), (
+            'Убедитесь, что новый ответ содержит измененный справочник.'
+        )
+        return
+
+    def test_students_filter_reference_cache(self) -> None:
+        """
+        Тест GET запроса кандидатов с фильтром по справочнику:
+        значения берутся из кеша справочников, новые значения
+        доступны сразу, несуществующие возвращают 400.
+        """
+        refs: dict[str, list] = self._create_students_for_matching()
+        client = client_auth_admin()
+        response = client.get(
+            f'{API_STUDENTS_URL}?city={refs["cities"][0].id}'
+        )
+        assert len(response.data['results']) == 3, (
+            'Убедитесь, что фильтрация по городу работает.'
+        )
+        city: City = City.objects.create(name='Новый город')
+        response = client.get(f'{API_STUDENTS_URL}?city={city.id}')
+        assert response.status_code == 200, (
+            'Убедитесь, что новый город доступен для фильтрации '
+            'без перезапуска приложения.'
+        )
+        assert response.data['results'] == [], (
+            'Убедитесь, что в новом городе нет кандидатов.'
+        )
+        response = client.get(f'{API_STUDENTS_URL}?city={city.id + 1}')
+        assert response.status_code == 400, (
+            'Убедитесь, что для несуществующего города возвращается 400.'
+        )
+        language, level = refs['languages'][0], refs['levels'][1]
+        with CaptureQueriesContext(connection) as queries:
+            client.get(
+                f'{API_STUDENTS_URL}?languages={language.id}-{level.id}'
+            )
+        assert not any(
+            'FROM "vacancy_languagelevel"' in query['sql']
+            for query in queries.captured_queries
+        ), (
+            'Убедитесь, что уровни владения языком для фильтрации '
+            'берутся из кеша справочников.'
+        )
+        return
+
+    def test_skill_categories(
+            self, django_capture_on_commit_callbacks) -> None:
+        """
+        Тест GET запроса навыков по категориям: ответ отдается сжатым
+        gzip, повторный запрос с ETag возвращает 304, пока навыки
+        не изменились.
+        """
+        with django_capture_on_commit_callbacks(execute=True):
+            refs: dict[str, list] = create_reference_objs(num=10)
+        client = client_auth_admin()
+        response = client.get(API_SKILL_CATEGORIES_URL)
+        assert response.status_code == 200, (
+            'Убедитесь, что навыки по категориям доступны.'
+        )
+        categories: list[dict] = response.json()
+        assert [skill['id'] for skill in categories[0]['skills']] == [
+            skill.id for skill in refs['skills']
+        ], (
+            'Убедитесь, что навыки сгруппированы по категориям.'
+        )
+        response = client.get(
+            API_SKILL_CATEGORIES_URL, HTTP_ACCEPT_ENCODING='gzip'
+        )
+        assert response['Content-Encoding'] == 'gzip', (
+            'Убедитесь, что ответ сжимается, если клиент принимает gzip.'
+        )
+        assert json.loads(gzip.decompress(response.content)) == categories, (
+            'Убедитесь, что сжатый ответ совпадает с несжатым.'
+        )
+        etag: str = response['ETag']
+        response = client.get(
+            API_SKILL_CATEGORIES_URL, HTTP_IF_NONE_MATCH=etag
+        )
+        assert response.status_code == 304, (
+            'Убедитесь, что при совпадении ETag возвращается 304.'
+        )
+        with django_capture_on_commit_callbacks(execute=True):
+            Skill.objects.create(
+                name='Новый навык', category=refs['skills'][0].category
+            )
+        response = client.get(
+            API_SKILL_CATEGORIES_URL, HTTP_IF_NONE_MATCH=etag
+        )
+        assert response.status_code == 200, (
+            'Убедитесь, что после изменения навыков возвращается новый ответ.'
+        )
+        assert 'Новый навык' in (
+            skill['name'] for skill in response.json()[0]['skills']
+        ), (
+            'Убедитесь, что новый ответ содержит измененные навыки.'
+        )
+        return
+
+    def test_vacancies_list(self) -> None:
+        """
+        Тест GET запроса списка вакансий пользователя постранично
+        с фильтрами по архивности и шаблонам и сортировкой по дате.
+        """
+        hr: User = create_user_obj(num=1)
+        refs: dict[str, list] = create_reference_objs()
+        vacancies = [
+            create_vacancy_obj(num=num, hr=hr, refs=refs)
+            for num in range(1, 5)
+        ]
+        Vacancy.objects.filter(id=vacancies[0].id).update(is_archived=True)
+        Vacancy.objects.filter(id=vacancies[1].id).update(is_template=True)
+        client = client_auth_admin(admin=hr)
+        response = client.get(f'{API_VACANCIES_URL}?archived=false&limit=2')
+        assert [item['id'] for item in response.data['results']] == [
+            vacancies[3].id, vacancies[2].id,
+        ], (
+            'Убедитесь, что список вакансий выводится постранично '
+            'без архивных вакансий при archived=false.'
+        )
+        response = client.get(response.data['next'])
+        assert [item['id'] for item in response.data['results']] == [
+            vacancies[1].id,
+        ], (
+            'Убедитесь, что следующая страница продолжает список.'
+        )
+        response = client.get(f'{API_VACANCIES_URL}?template=true')
+        assert [item['id'] for item in response.data['results']] == [
+            vacancies[1].id,
+        ], (
+            'Убедитесь, что при template=true выводятся только шаблоны.'
+        )
+        response = client.get(f'{API_VACANCIES_URL}?ordering=pub_datetime')
+        assert [item['id'] for item in response.data['results']] == [
+            vacancy.id for vacancy in vacancies
+        ], (
+            'Убедитесь, что вакансии сортируются по дате публикации.'
+        )
+        for query in ('archived=maybe', 'ordering=name'):
+            response = client.get(f'{API_VACANCIES_URL}?{query}')
+            assert response.status_code == 400, (
+                f'Убедитесь, что при {query} возвращается 400.'
+            )
+        return
+
+    def test_vacancies_bulk(
+            self, django_capture_on_commit_callbacks) -> None:
+        """
+        Тест POST запроса массового создания вакансий: подходящие
+        кандидаты пересчитываются после коммита, а при ошибках
+        не создается ни одна вакансия и ошибки возвращаются по порядку.
+        """
+        hr: User = create_user_obj(num=1)
+        refs: dict[str, list] = self._create_students_for_matching()
+        client = client_auth_admin(admin=hr)
+        with django_capture_on_commit_callbacks(execute=True):
+            response = client.post(
+                API_VACANCIES_BULK_URL,
+                data=[
+                    get_vacancy_data(
+                        num=num, refs=refs, skills=skills,
+                    ) for num, skills in (
+                        (1, refs['skills'][:2]),
+                        (2, refs['skills']),
+                    )
+                ],
+                format='json',
+            )
+        assert response.status_code == 201, (
+            f'Убедитесь, что эндпоинт {API_VACANCIES_BULK_URL} '
+            'создает вакансии.'
+        )
+        vacancy_ids: list[int] = [item['id'] for item in response.data]
+        assert [
+            sorted(skill['name'] for skill in item['skills'])
+            for item in response.data
+        ] == [
+            sorted(skill.name for skill in skills)
+            for skills in (refs['skills'][:2], refs['skills'])
+        ], (
+            'Убедитесь, что вакансии создаются с навыками '
+            'и возвращаются в порядке запроса.'
+        )
+        response = client.get(API_VACANCIES_MATCHES_URL)
+        received: dict[int, list[int]] = {
+            item['vacancy']: item['students'] for item in response.data
+        }
+        expected: dict[int, list[int]] = {
+            vacancy_ids[0]: [refs['students'][2].id, refs['students'][0].id],
+            vacancy_ids[1]: [refs['students'][2].id],
+        }
+        assert received == expected, (
+            'Убедитесь, что после массового создания вакансий '
+            'пересчитываются подходящие кандидаты.'
+        )
+        invalid_city: dict[str, any] = get_vacancy_data(num=4, refs=refs)
+        invalid_city['city'] = 0
+        response = client.post(
+            API_VACANCIES_BULK_URL,
+            data=[
+                get_vacancy_data(num=1, refs=refs),
+                get_vacancy_data(num=3, refs=refs),
+                invalid_city,
+                get_vacancy_data(num=3, refs=refs),
+            ],
+            format='json',
+        )
+        assert response.status_code == 400, (
+            'Убедитесь, что при некорректных вакансиях возвращается 400.'
+        )
+        assert [bool(errors) for errors in response.data] == [
+            True, False, True, True,
+        ], (
+            'Убедитесь, что ошибки возвращаются для каждой вакансии: '
+            'существующей, с несуществующим городом и повторной.'
+        )
+        assert Vacancy.objects.count() == 2, (
+            'Убедитесь, что при ошибках не создается ни одна вакансия.'
+        )
+        return
+
+    def test_vacancies_update(
+            self, django_capture_on_commit_callbacks) -> None:
+        """
+        Тест PATCH запроса вакансии: изменяются только отличающиеся
+        навыки и языки, подходящие кандидаты пересчитываются.
+        """
+        hr: User = create_user_obj(num=1)
+        with django_capture_on_commit_callbacks(execute=True):
+            refs: dict[str, list] = self._create_students_for_matching()
+            vacancy: Vacancy = create_vacancy_obj(
+                num=1, hr=hr, refs=refs, skills=refs['skills'][:2],
+            )
+        kept_skill_id: int = VacancySkill.objects.get(
+            vacancy=vacancy, skill=refs['skills'][1],
+        ).id
+        client = client_auth_admin(admin=hr)
+        with django_capture_on_commit_callbacks(execute=True):
+            response = client.patch(
+                f'{API_VACANCIES_URL}{vacancy.id}/',
+                data={
+                    'name': vacancy.name,
+                    'skills': [skill.id for skill in refs['skills'][1:]],
+                    'languages': [
+                        {
+                            'language': refs['languages'][1].id,
+                            'level': refs['levels'][2].id,
+                        },
+                    ],
+                },
+                format='json',
+            )
+        assert response.status_code == 200, (
+            'Убедитесь, что вакансия обновляется без изменения названия.'
+        )
+        assert set(
+            vacancy.vacancy_skill.values_list('skill_id', flat=True)
+        ) == {skill.id for skill in refs['skills'][1:]}, (
+            'Убедитесь, что навыки вакансии заменяются сообщенными.'
+        )
+        assert vacancy.vacancy_skill.filter(id=kept_skill_id).exists(), (
+            'Убедитесь, что совпадающие навыки вакансии не пересоздаются.'
+        )
+        assert list(
+            vacancy.vacancy_language.values_list('language_id', 'level_id')
+        ) == [(refs['languages'][1].id, refs['levels'][2].id)], (
+            'Убедитесь, что языки вакансии заменяются сообщенными.'
+        )
+        response = client.get(f'{API_VACANCIES_MATCHES_URL}?ids={vacancy.id}')
+        assert response.data[0]['students'] == [refs['students'][2].id], (
+            'Убедитесь, что после изменения требований вакансии '
+            'пересчитываются подходящие кандидаты.'
+        )
+        return
+
+    def test_vacancies_duplicate(self) -> None:
+        """
+        Тест POST и PATCH запросов и валидации модели (админка) вакансии
+        с названием и описанием существующей вакансии без учета регистра
+        и лишних пробелов.
+        """
+        hr: User = create_user_obj(num=1)
+        refs: dict[str, list] = create_reference_objs()
+        vacancy: Vacancy = create_vacancy_obj(num=1, hr=hr, refs=refs)
+        client = client_auth_admin(admin=hr)
+        data: dict[str, any] = get_vacancy_data(
+            num=1, refs=refs, skills=refs['skills'][:1],
+        )
+        data['name'] = f'  {vacancy.name.upper()} '
+        response = client.post(API_VACANCIES_URL, data=data, format='json')
+        assert response.status_code == 400, (
+            'Убедитесь, что вакансия с названием и описанием существующей '
+            'вакансии не создается.'
+        )
+        data['name'] = 'Другая вакансия'
+        response = client.post(API_VACANCIES_URL, data=data, format='json')
+        assert response.status_code == 201, (
+            'Убедитесь, что вакансия с другим названием создается.'
+        )
+        response = client.patch(
+            f'{API_VACANCIES_URL}{response.data["id"]}/',
+            data={'name': vacancy.name},
+            format='json',
+        )
+        assert response.status_code == 400, (
+            'Убедитесь, что вакансию нельзя переименовать '
+            'в существующую вакансию.'
+        )
+        assert Vacancy.objects.filter(name=vacancy.name).count() == 1, (
+            'Убедитесь, что при ошибке вакансия не изменяется.'
+        )
+        vacancy.clean()
+        with pytest.raises(DjangoValidationError):
+            Vacancy(
+                name=f' {vacancy.name.lower()}',
+                description=vacancy.description,
+                hr=hr,
+            ).clean()
+        return
+
+    def test_vacancies_integrity_error(self, monkeypatch) -> None:
+        """
+        Тест POST запроса вакансии, при котором база данных отклоняет
+        вставку не из-за дубликата: ошибка не выдается за дубликат.
+        """
+        hr: User = create_user_obj(num=1)
+        refs: dict[str, list] = create_reference_objs()
+        client = client_auth_admin(admin=hr)
+
+        def save(*args, **kwargs):
+            raise IntegrityError(
+                'NOT NULL constraint failed: vacancy_vacancy.hr_id'
+            )
+
+        monkeypatch.setattr(Vacancy, 'save', save)
+        with pytest.raises(IntegrityError):
+            client.post(
+                API_VACANCIES_URL,
+                data=get_vacancy_data(
+                    num=1, refs=refs, skills=refs['skills'][:1],
+                ),
+                format='json',
+            )
+        return
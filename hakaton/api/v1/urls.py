@@ -4,15 +4,16 @@ from rest_framework.routers import DefaultRouter
 from rest_framework.viewsets import ModelViewSet
 
 from api.v1.views import (
-    CityView, CurrencyView, EmploymentView, ExperienceView, LanguageView,
-    LanguageLevelView, ScheduleView, SkillSearchView, SkillCategoryView,
-    StudentViewSet, TaskViewSet, TokenObtainPairView, TokenRefreshView,
-    UserViewSet, VacancyViewSet,
+    CityView, CurrencyView, DictionariesView, EmploymentView, ExperienceView,
+    ExportJobViewSet, LanguageView, LanguageLevelView, ScheduleView,
+    SkillSearchView, SkillCategoryView, StudentViewSet, TaskViewSet,
+    TokenObtainPairView, TokenRefreshView, UserViewSet, VacancyViewSet,
 )
 
 router = DefaultRouter()
 
 ROUTER_DATA: list[dict[str, ModelViewSet]] = [
+    {'prefix': 'exports', 'viewset': ExportJobViewSet},
     {'prefix': 'students', 'viewset': StudentViewSet},
     {'prefix': 'tasks', 'viewset': TaskViewSet},
     {'prefix': 'users', 'viewset': UserViewSet},
@@ -29,6 +30,7 @@ for route in ROUTER_DATA:
 views: list[path] = [
     path('cities/', CityView.as_view(), name='city'),
     path('currencies/', CurrencyView.as_view(), name='currencies'),
+    path('dictionaries/', DictionariesView.as_view(), name='dictionaries'),
     path('employments/', EmploymentView.as_view(), name='employment'),
     path('experiences/', ExperienceView.as_view(), name='experiences'),
     path('languages/', LanguageView.as_view(), name='languages'),
@@ -3,6 +3,16 @@ from re import fullmatch
 from django.utils.translation import gettext
 from rest_framework.serializers import ValidationError
 
+BOOLEAN_ERROR: str = gettext(
+    "Неверное логическое значение. Используйте 'true' или 'false'."
+)
+BOOLEAN_VALUES: dict[str, bool] = {
+    'true': True,
+    '1': True,
+    'false': False,
+    '0': False,
+}
+
 DATE_ERROR: str = gettext(
     "Неверный формат даты. Используйте формат 'YYYY-MM-DD' или 'YYYY-MM'."
 )
@@ -17,3 +27,15 @@ def validate_date(value: str) -> str:
     if not fullmatch(pattern=DATE_PATTERN, string=value):
         raise ValidationError(DATE_ERROR)
     return value
+
+
+def validate_boolean(value: str) -> bool:
+    """
+    Производит валидацию логического значения query параметра.
+    Допускает 'true', '1', 'false' и '0' в любом регистре.
+    Возвращает bool.
+    """
+    boolean: bool = BOOLEAN_VALUES.get(value.lower())
+    if boolean is None:
+        raise ValidationError(BOOLEAN_ERROR)
+    return boolean
@@ -1,4 +1,5 @@
-from django.db.models import Q, QuerySet
+from django.db.models import Count, Exists, Model, OuterRef, QuerySet
+from django.http import FileResponse, Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import status
@@ -7,35 +8,68 @@ from rest_framework.exceptions import MethodNotAllowed
 from rest_framework.generics import ListAPIView
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
+from rest_framework.serializers import ValidationError
 from rest_framework_simplejwt.views import (
     TokenObtainPairView, TokenRefreshView
 )
+from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet
 
-from api.v1.filters import TaskMonthFilter
+from api.v1.exports import (
+    get_export_fields, iter_serialized, stream_csv, stream_ndjson,
+)
+from api.v1.filters import TaskMonthFilter, VacancyStatusFilter
 from api.v1.schemas import (
-    CITY_VIEW_SCHEMA, CURRENCY_VIEW_SCHEMA, EMPLOYMENT_VIEW_SCHEMA,
-    EXPERIENCE_VIEW_SCHEMA, LANGUAGE_VIEW_SCHEMA, LANGUAGE_LEVEL_VIEW_SCHEMA,
-    SCHEDULE_VIEW_SCHEMA, SKILL_CATEGORY_VIEW_SCHEMA, SKILL_SEARCH_VIEW_SCHEMA,
-    STUDENT_VIEW_SCHEMA, STUDENT_MARK_WATCHED_SCHEMA, TASK_VIEW_SCHEMA,
+    CITY_VIEW_SCHEMA, CURRENCY_VIEW_SCHEMA, DICTIONARIES_VIEW_SCHEMA,
+    EMPLOYMENT_VIEW_SCHEMA,
+    EXPERIENCE_VIEW_SCHEMA, EXPORT_JOB_VIEW_SCHEMA, LANGUAGE_VIEW_SCHEMA,
+    LANGUAGE_LEVEL_VIEW_SCHEMA, SCHEDULE_VIEW_SCHEMA,
+    SKILL_CATEGORY_VIEW_SCHEMA, SKILL_SEARCH_VIEW_SCHEMA,
+    STUDENT_EXPORT_SCHEMA, STUDENT_FACETS_SCHEMA, STUDENT_VIEW_SCHEMA,
+    STUDENT_MARK_WATCHED_SCHEMA, TASK_VIEW_SCHEMA,
     TASK_VIEW_LIST_SCHEMA, TOKEN_OBTAIN_SCHEMA, TOKEN_REFRESH_SCHEMA,
     USER_VIEW_SCHEMA, USER_ME_SCHEMA,
-    VACANCY_VIEW_SCHEMA,
+    VACANCY_BULK_SCHEMA, VACANCY_MATCHES_SCHEMA, VACANCY_VIEW_SCHEMA,
+)
+from api.v1.paginations import (
+    StudentCursorPagination, VacancyCursorPagination,
+)
+from api.v1.payloads import (
+    DICTIONARIES_VERSION_KEY, SKILL_CATEGORIES_VERSION_KEY,
+    build_skill_categories, get_payload_response,
 )
 from api.v1.permissions import IsOwnerPut
 from api.v1.serializers import (
     CitySerializer, CurrencySerializer, EmploymentSerializer,
-    ExperienceSerializer, LanguageSerializer, LanguageLevelSerializer,
-    ScheduleSerializer, SkillSerializer, SkillCategorySerializer,
+    ExperienceSerializer, ExportJobSerializer, LanguageSerializer,
+    LanguageLevelSerializer, ScheduleSerializer, SkillSerializer,
     StudentSerializer, TaskSerializer, VacancySerializer,
     UserRegisterSerializer, UserUpdateSerializer,
 )
-from student.models import Student
-from user.models import HrTask, HrWatched, User
+from api.v1.validatiors import validate_boolean
+from hakaton.app_data import (
+    EXPORT_FORMAT_CSV, EXPORT_FORMAT_NDJSON, EXPORT_FORMATS,
+    EXPORT_JOB_STATUS_DONE,
+    VACANCY_BULK_MAX_LEN,
+)
+from student.matching import (
+    filter_by_city, filter_by_employment, filter_by_experience,
+    filter_by_languages, filter_by_matches, filter_by_schedule,
+    filter_by_skills, get_matched_student_ids, get_matched_student_ids_bulk,
+    get_vacancy, rank_by_vacancy,
+)
+from student.models import (
+    Student, StudentEmployment, StudentLanguage, StudentSchedule, StudentSkill,
+)
+from student.search import search_students
+from user.models import ExportJob, HrTask, HrWatched, User
+from vacancy.autocomplete import city_autocomplete, skill_autocomplete
 from vacancy.models import (
     City, Currency, Employment, Experience, Language, LanguageLevel,
-    Schedule, Skill, SkillCategory, Vacancy,
+    Schedule, Skill, Vacancy, VacancyWatched,
 )
+from vacancy.reference_cache import reference_caches
+from vacancy.signals import schedule_vacancies_matches_refresh
 
 
 @extend_schema(**CITY_VIEW_SCHEMA)
@@ -49,10 +83,55 @@ class CityView(ListAPIView):
     def get_queryset(self):
         search_param: str = self.request.query_params.get('search')
         if search_param:
-            return City.objects.filter(name__startswith=search_param)
+            return city_autocomplete.search(text=search_param)
         return City.objects.all()
 
 
+@extend_schema(**DICTIONARIES_VIEW_SCHEMA)
+class DictionariesView(APIView):
+    """
+    Вью функция предоставления всех справочников одним ответом.
+    Ответ сериализуется один раз на версию справочников.
+    """
+
+    def get(self, request):
+        return get_payload_response(
+            request=request,
+            version_key=DICTIONARIES_VERSION_KEY,
+            build=self._build_dictionaries,
+        )
+
+    def _build_dictionaries(self) -> dict[str, list]:
+        """Сериализует все справочники."""
+        return {
+            'cities': CitySerializer(
+                City.objects.all(), many=True
+            ).data,
+            'currencies': CurrencySerializer(
+                Currency.objects.all(), many=True
+            ).data,
+            'employments': EmploymentSerializer(
+                Employment.objects.all(), many=True
+            ).data,
+            'experiences': ExperienceSerializer(
+                Experience.objects.all(), many=True
+            ).data,
+            'languages': LanguageSerializer(
+                Language.objects.all(), many=True
+            ).data,
+            'language_levels': LanguageLevelSerializer(
+                LanguageLevel.objects.all(), many=True
+            ).data,
+            'schedules': ScheduleSerializer(
+                Schedule.objects.all(), many=True
+            ).data,
+            'skills': SkillSerializer(
+                Skill.objects.all(), many=True
+            ).data,
+            'skill_categories': build_skill_categories(),
+        }
+
+
 @extend_schema(**EMPLOYMENT_VIEW_SCHEMA)
 class EmploymentView(ListAPIView):
     """
@@ -80,6 +159,41 @@ class ExperienceView(ListAPIView):
     serializer_class = ExperienceSerializer
 
 
+@extend_schema_view(**EXPORT_JOB_VIEW_SCHEMA)
+class ExportJobViewSet(ModelViewSet):
+    """
+    Вью-сет для взаимодействия с моделью ExportJob.
+    Файл выгрузки формируется задачей Celery после создания объекта.
+    """
+
+    http_method_names = ('get', 'post',)
+    serializer_class = ExportJobSerializer
+
+    def get_queryset(self):
+        return ExportJob.objects.filter(hr=self.request.user)
+
+    @action(
+        detail=True,
+        methods=('get',),
+        url_path='download',
+        url_name='download',
+    )
+    def download(self, request, pk: int):
+        """
+        Отдает файл выгрузки ее владельцу.
+        Файлы хранятся вне MEDIA_ROOT и не раздаются публично.
+        """
+        job: ExportJob = self.get_object()
+        if job.status != EXPORT_JOB_STATUS_DONE or not job.file:
+            raise Http404
+        return FileResponse(
+            job.file.open('rb'),
+            as_attachment=True,
+            filename=f'{job.kind}_{job.id}.csv.gz',
+            content_type='application/gzip',
+        )
+
+
 @extend_schema(**LANGUAGE_VIEW_SCHEMA)
 class LanguageView(ListAPIView):
     """
@@ -108,12 +222,18 @@ class ScheduleView(ListAPIView):
 
 
 @extend_schema(**SKILL_CATEGORY_VIEW_SCHEMA)
-class SkillCategoryView(ListAPIView):
+class SkillCategoryView(APIView):
     """
-    Вью функция list предоставления навыков, сгруппированных по категориям.
+    Вью функция предоставления навыков, сгруппированных по категориям.
+    Ответ сериализуется один раз на версию навыков и категорий.
     """
-    queryset = SkillCategory.objects.prefetch_related('skill').all()
-    serializer_class = SkillCategorySerializer
+
+    def get(self, request):
+        return get_payload_response(
+            request=request,
+            version_key=SKILL_CATEGORIES_VERSION_KEY,
+            build=build_skill_categories,
+        )
 
 
 @extend_schema(**SKILL_SEARCH_VIEW_SCHEMA)
@@ -128,7 +248,7 @@ class SkillSearchView(ListAPIView):
     def get_queryset(self):
         search_param: str = self.request.query_params.get('search')
         if search_param:
-            return Skill.objects.filter(name__startswith=search_param)
+            return skill_autocomplete.search(text=search_param)
         return Skill.objects.all()
 
 
@@ -137,41 +257,35 @@ class StudentViewSet(ModelViewSet):
     """Вью-сет для взаимодействия с моделью Student."""
     # INFO: метод POST нужен для того, чтобы дочерние @action
     #       эндпоинты с методом POST были доступны.
-    # TODO: выдавать список просмотренных.
     http_method_names = ('get', 'post',)
+    # INFO: закешированный список ID кандидатов вакансии, из которого
+    #       StudentCursorPagination выбирает ID страницы.
+    matched_ids: list[int] = None
+    pagination_class = StudentCursorPagination
     serializer_class = StudentSerializer
 
     def get_queryset(self):
-        students: QuerySet = Student.objects.all(
-        ).select_related(
-            'city',
-            'experience',
-        ).prefetch_related(
-            'student_employment',
-            'student_language',
-            'student_schedule',
-            'student_skill',
+        students: QuerySet = self.get_serializer_class().optimize_queryset(
+            queryset=Student.objects.all(),
+            request=self.request,
         )
+        students: QuerySet = self._filter_by_watched(students=students)
         from_vacancy: QuerySet = self._get_from_vacancy(
             vacancy_id=self.request.query_params.get('from_vacancy'),
             students=students,
         )
-        if from_vacancy:
+        if from_vacancy is not None:
             return from_vacancy
-        from_query: QuerySet = self._get_from_query(
+        return self._get_from_query(
             students=students,
             query=self.request.query_params,
         )
-        if from_query:
-            return from_query
-        return students
 
     @extend_schema(exclude=True)
     def create(self, request, *args, **kwargs):
         raise MethodNotAllowed(request.method)
 
     @extend_schema(**STUDENT_MARK_WATCHED_SCHEMA)
-    # TODO: добавить возможность отмечать в просмотренное вакансии.
     @action(
         detail=True,
         methods=('post',),
@@ -179,59 +293,267 @@ class StudentViewSet(ModelViewSet):
     )
     def mark_watched(self, request, pk: int):
         candidate: Student = get_object_or_404(Student, id=pk)
-        HrWatched.objects.create(
+        vacancy_id: str = request.query_params.get('vacancy')
+        if vacancy_id is not None:
+            vacancy: Vacancy = get_object_or_404(
+                Vacancy, id=vacancy_id, hr=request.user
+            )
+            VacancyWatched.objects.get_or_create(
+                vacancy=vacancy,
+                student=candidate,
+            )
+            return Response(status=status.HTTP_200_OK)
+        HrWatched.objects.get_or_create(
             hr=request.user,
             candidate=candidate
         )
         return Response(status=status.HTTP_200_OK)
 
+    @extend_schema(**STUDENT_EXPORT_SCHEMA)
+    @action(
+        detail=False,
+        methods=('get',),
+        url_path='export',
+        url_name='export',
+    )
+    def export(self, request):
+        """
+        Выгружает всех подходящих под query параметры кандидатов потоком
+        в формате CSV или NDJSON (query параметр 'export_format').
+        """
+        # INFO: параметр 'format' зарезервирован DRF для выбора рендерера.
+        export_format: str = request.query_params.get(
+            'export_format', EXPORT_FORMAT_CSV
+        )
+        if export_format not in EXPORT_FORMATS:
+            raise ValidationError(
+                {"Bad Request.": (
+                    'Формат выгрузки должен быть одним из: '
+                    f'{", ".join(EXPORT_FORMATS)}.'
+                )}
+            )
+        rows = iter_serialized(
+            queryset=self.get_queryset(),
+            serializer_class=self.get_serializer_class(),
+            context=self.get_serializer_context(),
+        )
+        if export_format == EXPORT_FORMAT_NDJSON:
+            response: StreamingHttpResponse = StreamingHttpResponse(
+                stream_ndjson(rows=rows),
+                content_type='application/x-ndjson',
+            )
+        else:
+            fields: tuple[str] = get_export_fields(
+                serializer_class=self.get_serializer_class(),
+                request=request,
+            )
+            response: StreamingHttpResponse = StreamingHttpResponse(
+                stream_csv(rows=rows, fields=fields),
+                content_type='text/csv; charset=utf-8',
+            )
+        response['Content-Disposition'] = (
+            f'attachment; filename="students.{export_format}"'
+        )
+        return response
+
+    @extend_schema(**STUDENT_FACETS_SCHEMA)
+    @action(
+        detail=False,
+        methods=('get',),
+        url_path='facets',
+        url_name='facets',
+    )
+    def facets(self, request):
+        """
+        Возвращает количество подходящих под query параметры кандидатов
+        в разрезе городов, опыта работы, типов занятости, графиков работы,
+        навыков и уровней владения языками.
+        Независимо от количества значений выполняется шесть запросов
+        с группировкой.
+        """
+        students: QuerySet = self._get_from_query(
+            students=Student.objects.all(),
+            query=request.query_params,
+        ).order_by().values('id')
+        related_facets: dict[str, tuple[Model, dict[str, str]]] = {
+            'employments': (StudentEmployment, {'id': 'employment_id'}),
+            'languages': (
+                StudentLanguage,
+                {'language': 'language_id', 'level': 'level_id'},
+            ),
+            'schedules': (StudentSchedule, {'id': 'schedule_id'}),
+            'skills': (StudentSkill, {'id': 'skill_id'}),
+        }
+        facets: dict[str, list[dict[str, int]]] = {
+            'cities': self._count_facet(
+                queryset=Student.objects.filter(id__in=students),
+                fields={'id': 'city_id'},
+            ),
+            'experiences': self._count_facet(
+                queryset=Student.objects.filter(id__in=students),
+                fields={'id': 'experience_id'},
+            ),
+        }
+        for facet, (model, fields) in related_facets.items():
+            facets[facet] = self._count_facet(
+                queryset=model.objects.filter(student_id__in=students),
+                fields=fields,
+            )
+        return Response(facets, status=status.HTTP_200_OK)
+
+    def _count_facet(
+            self, queryset: QuerySet, fields: dict[str, str]
+            ) -> list[dict[str, int]]:
+        """
+        Возвращает количество объектов queryset для каждого сочетания
+        значений полей. fields - соответствие названий в ответе
+        названиям полей модели.
+        """
+        return list(
+            {**dict(zip(fields, row[:-1])), 'count': row[-1]}
+            for row in queryset.order_by().values_list(
+                *fields.values()
+            ).annotate(
+                count=Count('id')
+            ).order_by(*fields.values())
+        )
+
+    def _filter_by_watched(self, students: QuerySet) -> QuerySet:
+        """
+        Проверяет query параметры 'watched' и 'unwatched'. Оставляет только
+        просмотренных или только непросмотренных кандидатов соответственно,
+        если значение параметра - 'true' или '1'.
+        При передаче 'from_vacancy' учитываются просмотры в рамках вакансии
+        (VacancyWatched) только по вакансиям пользователя, иначе - просмотры
+        пользователя при глобальном поиске (HrWatched).
+        Проверка выполняется подзапросом EXISTS / NOT EXISTS по уникальным
+        парам (hr, candidate) и (vacancy, student) без выгрузки ID.
+        """
+        query: dict[str, str] = self.request.query_params
+        flags: dict[str, bool] = {
+            param: validate_boolean(value=query.get(param))
+            for param in ('watched', 'unwatched')
+            if query.get(param) is not None
+        }
+        if not any(flags.values()):
+            return students
+        try:
+            vacancy_id: int = int(query.get('from_vacancy'))
+        except (TypeError, ValueError):
+            vacancy_id: None = None
+        if vacancy_id is not None:
+            watched: Exists = Exists(VacancyWatched.objects.filter(
+                vacancy_id=vacancy_id,
+                vacancy__hr=self.request.user,
+                student=OuterRef('pk'),
+            ))
+        else:
+            watched: Exists = Exists(HrWatched.objects.filter(
+                hr=self.request.user,
+                candidate=OuterRef('pk'),
+            ))
+        if flags.get('watched'):
+            students: QuerySet = students.filter(watched)
+        if flags.get('unwatched'):
+            students: QuerySet = students.filter(~watched)
+        return students
+
     def _get_from_query(self, students: QuerySet, query: dict[str, any]) -> QuerySet:  # noqa (E501)
         """
         Проверяет query параметры. Если хотя бы один параметр существует,
         возвращает всех кандидатов, которые соответствуют.
-        Иначе - возвращает None.
+        Иначе - возвращает всех кандидатов.
         """
         # TODO: подумать над рефакторингом и оптимизацией.
         if query.get('city') is not None:
-            students: QuerySet = self._filter_by_city(
+            students: QuerySet = filter_by_city(
                 students=students,
-                city=City.objects.get(id=query.get('city'))
+                city=self._get_reference(
+                    model=City,
+                    obj_id=query.get('city'),
+                    desc='города',
+                )
             )
         if query.get('experience') is not None:
-            students: QuerySet = self._filter_by_experience(
+            students: QuerySet = filter_by_experience(
                 students=students,
-                experience=Experience.objects.get(id=query.get('experience'))
+                experience=self._get_reference(
+                    model=Experience,
+                    obj_id=query.get('experience'),
+                    desc='опыта работы',
+                )
             )
         if query.get('employment') is not None:
-            students: QuerySet = self._filter_by_employment(
+            students: QuerySet = filter_by_employment(
                 students=students,
-                employment=Employment.objects.get(id=query.get('employment'))
+                employment=self._get_reference(
+                    model=Employment,
+                    obj_id=query.get('employment'),
+                    desc='формата работы',
+                )
             )
         if query.get('schedule') is not None:
-            students: QuerySet = self._filter_by_schedule(
+            students: QuerySet = filter_by_schedule(
                 students=students,
-                schedule=Schedule.objects.get(id=query.get('schedule'))
+                schedule=self._get_reference(
+                    model=Schedule,
+                    obj_id=query.get('schedule'),
+                    desc='графика работы',
+                )
             )
         if query.get('skills') is not None:
-            students: QuerySet = self._filter_by_skills(
+            try:
+                skill_ids: list[int] = list(
+                    int(skill_id)
+                    for skill_id in query.get('skills').split(',')
+                )
+            except ValueError:
+                raise ValidationError(
+                    {"Bad Request.": "Неверный формат перечня ID навыков."}
+                )
+            students: QuerySet = filter_by_skills(
                 students=students,
-                skill_ids=query.get('skills')
+                skill_ids=skill_ids,
             )
         if query.get('languages') is not None:
             languages_data: list[str] = list(query.get('languages').split(','))
+            # INFO: в query параметре передается ID уровня владения языком,
+            #       а фильтрация производится по его порядковому значению.
             languages: list[dict[str, int]] = []
             for language in languages_data:
-                language_id, language_level = language.split('-')
+                try:
+                    language_id, level_id = (
+                        int(value) for value in language.split('-')
+                    )
+                except ValueError:
+                    raise ValidationError(
+                        {
+                            "Bad Request.": (
+                                "Неверный формат перечня языков. Используйте "
+                                "формат <ID языка>-<ID уровня>,..."
+                            )
+                        }
+                    )
+                level: LanguageLevel = self._get_reference(
+                    model=LanguageLevel,
+                    obj_id=level_id,
+                    desc='уровня владения языком',
+                )
                 languages.append(
                     {
                         'language_id': language_id,
-                        'language_level': language_level
+                        'language_level': level.level
                     }
                 )
-            students: QuerySet = self._filter_by_languages(
+            students: QuerySet = filter_by_languages(
                 students=students,
                 languages=languages,
             )
+        if query.get('search'):
+            students: QuerySet = search_students(
+                students=students,
+                text=query.get('search'),
+            )
         return students
 
 
@@ -239,133 +561,53 @@ class StudentViewSet(ModelViewSet):
         """
         Проверяет query параметр 'from_vacancy'. Если такой параметр существует
         и является ID существующей вакансии - возвращает всех кандидатов,
-        которые подходят под требования вакансии.
+        которые подходят под требования вакансии (подзапросом к таблице
+        VacancyMatch, для архивных вакансий - по требованиям вакансии).
         Иначе - возвращает None.
+        Для списка без других фильтров по неархивной вакансии
+        ID кандидатов берутся из кеша строк VacancyMatch по хешу
+        требований вакансии (matched_ids): возвращаются все кандидаты,
+        а ID страницы выбирает StudentCursorPagination.
         """
         try:
             vacancy_id: int = int(vacancy_id)
         except (TypeError, ValueError):
-            vacancy_id: None = None
-        if (vacancy_id is None or
-                not Vacancy.objects.filter(id=vacancy_id).exists()
-                ):  # noqa (E124)
             return None
-        vacancy: Vacancy = Vacancy.objects.select_related(
-            'city',
-            'experience',
-            'employment',
-            'schedule',
-        ).prefetch_related(
-            'vacancy_employment',
-            'vacancy_language',
-            'vacancy_skill',
-        ).get(
-            id=vacancy_id,
-        )
-        students: QuerySet = self._filter_by_city(
-            students=students,
-            city=vacancy.city
-        )
-        students: QuerySet = self._filter_by_employment(
-            students=students,
-            employment=vacancy.employment
-        )
-        students: QuerySet = self._filter_by_experience(
-            students=students,
-            experience=vacancy.experience
+        ranked: bool = (
+            self.action in ('export', 'list',)
+            and self.request.query_params.get('mode') == 'ranked'
         )
-        students: QuerySet = self._filter_by_languages(
-            students=students,
-            languages=list(
-                {
-                    'language_id': languages.language.id,
-                    'language_level': languages.level.level
-                } for languages in vacancy.vacancy_language.all()
-            )
-        )
-        students: QuerySet = self._filter_by_schedule(
-            students=students,
-            schedule=vacancy.schedule
-        )
-        students: QuerySet = self._filter_by_skills(
-            students=students,
-            skill_ids=list(skill.id for skill in vacancy.vacancy_skill.all())
-        )
-        return students
-
-    def _filter_by_city(self, students: QuerySet, city: City) -> QuerySet:
-        """
-        Принимает список студентов. Производит фильтрацию тех из них,
-        кто имеет возможность работать непосредственно в офисе.
-        Возвращает отфильтрованный список студентов.
-        """
-        return students.filter(Q(city=city) | Q(relocation=True))
-
-    def _filter_by_experience(
-            self, students: QuerySet, experience: Experience) -> QuerySet:
-        """
-        Принимает список студентов. Производит фильтрацию тех из них,
-        кто имеет указанный в вакансии опыт работы.
-        Возвращает отфильтрованный список студентов.
-        """
-        return students.filter(experience=experience)
-
-    def _filter_by_employment(
-            self, students: QuerySet, employment: Employment) -> QuerySet:
-        """
-        Принимает список студентов. Производит фильтрацию тех из них,
-        кто имеет указанный в вакансии тип занятости.
-        Возвращает отфильтрованный список студентов.
-        """
-        return students.filter(student_employment__employment=employment)
-
-    def _filter_by_languages(
-            self, students: QuerySet, languages: list[dict]) -> QuerySet:
-        """
-        Принимает список студентов. Производит фильтрацию тех из них,
-        кто имеет все (или более) указанные в вакансии навыки.
-        Возвращает отфильтрованный список студентов.
-        """
-        user_lists = [
-            students.filter(
-                student_language__language_id=language['language_id'],
-                student_language__level__gte=language['language_level'],
-            ).values_list(
-                'id', flat=True
-            ) for language in languages
-        ]
-        common_users = set(user_lists[0])
-        for user_list in user_lists[1:]:
-            common_users &= set(user_list)
-        return students.filter(id__in=common_users)
-
-    def _filter_by_schedule(
-            self, students: QuerySet, schedule: Schedule) -> QuerySet:
-        """
-        Принимает список студентов. Производит фильтрацию тех из них,
-        кто имеет указанный в вакансии график работы.
-        Возвращает отфильтрованный список студентов.
-        """
-        return students.filter(student_schedule__schedule=schedule)
-
-    def _filter_by_skills(
-            self, students: QuerySet, skill_ids: list[int]) -> QuerySet:
+        # INFO: требования вакансии нужны только для ранжирования
+        #       и подбора по архивной вакансии.
+        vacancy: Vacancy = Vacancy.objects.only(
+            'id', 'is_archived',
+        ).filter(
+            id=vacancy_id,
+        ).first()
+        if vacancy is None:
+            return None
+        if (not ranked and not vacancy.is_archived and self.action == 'list'
+                and not students.query.has_filters()):
+            self.matched_ids = get_matched_student_ids(vacancy_id=vacancy_id)
+            return students
+        if ranked or vacancy.is_archived:
+            vacancy: Vacancy = get_vacancy(vacancy_id=vacancy_id)
+        if ranked:
+            return rank_by_vacancy(students=students, vacancy=vacancy)
+        return filter_by_matches(students=students, vacancy=vacancy)
+
+    def _get_reference(
+            self, model: type[Model], obj_id: str, desc: str) -> Model:
         """
-        Принимает список студентов. Производит фильтрацию тех из них,
-        кто имеет все (или более) указанные в вакансии навыки.
-        Возвращает отфильтрованный список студентов.
+        Возвращает объект справочника из кеша в памяти процесса.
+        Если объекта не существует, возвращает ошибку 400.
         """
-        user_lists = [
-            students.filter(
-                student_skill__skill_id=skill_id
-            ).values_list(
-                'id', flat=True
-            ) for skill_id in skill_ids
-        ]
-        common_users = set(user_lists[0])
-        for user_list in user_lists[1:]:
-            common_users &= set(user_list)
-        return students.filter(id__in=common_users)
+        obj: Model = reference_caches[model].get(obj_id=obj_id)
+        if obj is None:
+            raise ValidationError(
+                {"Bad Request.": f"Указанного {desc} не существует."}
+            )
+        return obj
 
 
 @extend_schema_view(**TASK_VIEW_SCHEMA)
@@ -445,7 +687,6 @@ class UserViewSet(ModelViewSet):
 
 # TODO: ввиду того, что skills указаны как write_only,
 #       в документации на GET запросы это поле не показано.
-# TODO: дописать метод update().
 # INFO: при обновлении вакансии возможно имеет смысл очистить список
 #       просмотренных кандидатов, так как условия могли измениться.
 #       Только при изменении ключевых полей: навыки, условия работы.
@@ -453,22 +694,96 @@ class UserViewSet(ModelViewSet):
 class VacancyViewSet(ModelViewSet):
     """Вью-сет для взаимодействия с моделью Vacancy."""
 
+    filter_backends = (VacancyStatusFilter,)
     http_method_names = ('get', 'post', 'patch',)
+    pagination_class = VacancyCursorPagination
     serializer_class = VacancySerializer
     queryset = Vacancy.objects.all()
 
     def get_queryset(self):
-        # TODO: проверить актуальность полей.
-        return Vacancy.objects.filter(
-            hr=self.request.user,
-        ).select_related(
-            'hr',
-            'city',
-        ).prefetch_related(
-            'vacancy_employment',
-            'vacancy_language',
-            'vacancy_skill',
+        return self.get_serializer_class().optimize_queryset(
+            queryset=Vacancy.objects.filter(hr=self.request.user),
+            request=self.request,
         )
 
     def retrieve(self, request, *args, **kwargs):
         return super().retrieve(request, *args, **kwargs)
+
+    @extend_schema(**VACANCY_BULK_SCHEMA)
+    @action(
+        detail=False,
+        methods=('post',),
+        url_path='bulk',
+        url_name='bulk',
+    )
+    def bulk(self, request):
+        """
+        Создает сразу несколько вакансий пользователя.
+        Сигналы post_save при bulk_create не отправляются,
+        поэтому пересчет подходящих студентов ставится в очередь явно.
+        """
+        serializer: VacancySerializer = self.get_serializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=VACANCY_BULK_MAX_LEN,
+        )
+        serializer.is_valid(raise_exception=True)
+        vacancy_ids: list[int] = [
+            vacancy.id for vacancy in serializer.save()
+        ]
+        schedule_vacancies_matches_refresh(vacancy_ids=vacancy_ids)
+        vacancies: QuerySet = self.get_queryset().filter(
+            id__in=vacancy_ids,
+        ).order_by('id')
+        return Response(
+            self.get_serializer(vacancies, many=True).data,
+            status=status.HTTP_201_CREATED,
+        )
+
+    @extend_schema(**VACANCY_MATCHES_SCHEMA)
+    @action(
+        detail=False,
+        methods=('get',),
+        url_path='matches',
+        url_name='matches',
+    )
+    def matches(self, request):
+        """
+        Возвращает подходящих кандидатов сразу для нескольких вакансий
+        пользователя: указанных в query параметре 'ids' или, если он
+        не передан, для всех неархивных.
+        """
+        vacancies: QuerySet = Vacancy.objects.filter(hr=request.user)
+        ids: str = request.query_params.get('ids')
+        if ids:
+            try:
+                ids: list[int] = list(int(id) for id in ids.split(','))
+            except ValueError:
+                raise ValidationError(
+                    {"Bad Request.": "Неверный формат перечня ID вакансий."}
+                )
+            vacancies: QuerySet = vacancies.filter(id__in=ids)
+        else:
+            vacancies: QuerySet = vacancies.filter(is_archived=False)
+        vacancy_ids: list[int] = []
+        archived_ids: list[int] = []
+        for vacancy_id, is_archived in vacancies.values_list(
+                'id', 'is_archived'):
+            vacancy_ids.append(vacancy_id)
+            if is_archived:
+                archived_ids.append(vacancy_id)
+        matched: dict[int, list[int]] = get_matched_student_ids_bulk(
+            vacancy_ids=vacancy_ids,
+            archived_ids=archived_ids,
+        )
+        return Response(
+            [
+                {
+                    'vacancy': vacancy_id,
+                    'count': len(student_ids),
+                    'students': student_ids,
+                } for vacancy_id, student_ids in matched.items()
+            ],
+            status=status.HTTP_200_OK,
+        )
@@ -65,6 +65,8 @@ STUDENT_SPEC_MAX_LEN: int = 30
 
 TASK_DESCRIPTION_MAX_LEN: int = 50
 
+VACANCY_CONTENT_HASH_LEN: int = 40
+VACANCY_UNIQUE_CONSTRAINT: str = 'unique_vacancy'
 VACANCY_CURR_MAX_LEN: int = 10
 VACANCY_EXP_MAX_LEN: int = 10
 VACANCY_NAME_MAX_LEN: int = 30
@@ -98,6 +100,145 @@ def user_avatar_path(instance, filename) -> str:
     return f'{USER_PHOTO_FOLDER}{unique_filename}'
 
 
+"""Matching settings."""
+
+
+# INFO: время хранения в кеше хешей требований вакансий и списков
+#       подходящих под требования студентов. Записи становятся
+#       неактуальными раньше при изменении данных.
+MATCH_CACHE_TIMEOUT: int = 60 * 60 * 24
+
+# INFO: веса составляющих оценки соответствия кандидата вакансии
+#       при ранжированной выдаче (?from_vacancy=<id>&mode=ranked).
+#       Навыки и языки учитываются за каждое совпадение.
+MATCH_WEIGHT_CITY: int = 3
+MATCH_WEIGHT_EMPLOYMENT: int = 2
+MATCH_WEIGHT_EXP: int = 3
+MATCH_WEIGHT_LANGUAGE: int = 2
+MATCH_WEIGHT_SCHEDULE: int = 2
+MATCH_WEIGHT_SKILL: int = 4
+
+# INFO: журнал изменений индекса навыков студентов (student.skill_index):
+#       время хранения записей и наибольшее количество версий, которое
+#       процесс догоняет по журналу. При большем отставании
+#       или потере записей индекс перестраивается из БД целиком.
+SKILL_INDEX_CHANGES_TIMEOUT: int = 60 * 60 * 24
+SKILL_INDEX_CHANGES_MAX_LEN: int = 1000
+
+# INFO: количество кандидатов на странице списка студентов
+#       (query параметр limit).
+STUDENT_PAGE_SIZE: int = 50
+STUDENT_PAGE_SIZE_MAX: int = 200
+
+# INFO: конфигурация полнотекстового поиска PostgreSQL (?search=<text>),
+#       точность релевантности (numeric) и веса полей профиля студента
+#       в поисковом векторе.
+STUDENT_SEARCH_CONFIG: str = 'russian'
+STUDENT_SEARCH_RANK_DECIMAL_PLACES: int = 8
+STUDENT_SEARCH_RANK_MAX_DIGITS: int = 12
+STUDENT_SEARCH_WEIGHTS: dict[str, str] = {
+    'specialization': 'A',
+    'about_exp': 'B',
+    'about_me': 'C',
+    'about_education': 'D',
+}
+
+# INFO: количество вакансий на странице списка вакансий
+#       (query параметр limit) и допустимые сортировки (ordering).
+VACANCY_PAGE_SIZE: int = 20
+VACANCY_PAGE_SIZE_MAX: int = 100
+VACANCY_ORDERINGS: tuple[str] = ('-id', 'pub_datetime', '-pub_datetime',)
+
+# INFO: максимальное количество вакансий в одном запросе
+#       массового создания /vacancies/bulk/.
+VACANCY_BULK_MAX_LEN: int = 500
+
+
+"""Export settings."""
+
+
+# INFO: количество студентов, которое читается из БД и сериализуется
+#       за один шаг при потоковой выгрузке.
+EXPORT_CHUNK_SIZE: int = 2000
+
+EXPORT_FORMAT_CSV: str = 'csv'
+EXPORT_FORMAT_NDJSON: str = 'ndjson'
+EXPORT_FORMATS: tuple[str] = (EXPORT_FORMAT_CSV, EXPORT_FORMAT_NDJSON,)
+
+# INFO: фоновые выгрузки (ExportJob) сохраняются в PRIVATE_MEDIA_ROOT
+#       (не раздается публично) в виде CSV, сжатого gzip, и отдаются
+#       только автору выгрузки.
+EXPORT_JOB_ERROR_MAX_LEN: int = 512
+EXPORT_JOB_FIELD_MAX_LEN: int = 10
+EXPORT_JOB_FOLDER: str = 'export/'
+
+EXPORT_JOB_KIND_STUDENTS: str = 'students'
+EXPORT_JOB_KIND_TASKS: str = 'tasks'
+EXPORT_JOB_KIND_VACANCIES: str = 'vacancies'
+EXPORT_JOB_KINDS: tuple[tuple[str, str]] = (
+    (EXPORT_JOB_KIND_STUDENTS, 'Кандидаты'),
+    (EXPORT_JOB_KIND_TASKS, 'Задачи календаря'),
+    (EXPORT_JOB_KIND_VACANCIES, 'Вакансии'),
+)
+
+EXPORT_JOB_STATUS_PENDING: str = 'pending'
+EXPORT_JOB_STATUS_RUNNING: str = 'running'
+EXPORT_JOB_STATUS_DONE: str = 'done'
+EXPORT_JOB_STATUS_FAILED: str = 'failed'
+EXPORT_JOB_STATUSES: tuple[tuple[str, str]] = (
+    (EXPORT_JOB_STATUS_PENDING, 'В очереди'),
+    (EXPORT_JOB_STATUS_RUNNING, 'Выполняется'),
+    (EXPORT_JOB_STATUS_DONE, 'Готово'),
+    (EXPORT_JOB_STATUS_FAILED, 'Ошибка'),
+)
+
+
+"""Autocomplete settings."""
+
+
+# INFO: максимальное количество подсказок при поиске навыков и городов.
+AUTOCOMPLETE_LIMIT: int = 20
+
+# INFO: период (в секундах) пересчета популярности навыков и городов
+#       для индексов автодополнения задачей Celery beat.
+AUTOCOMPLETE_POPULARITY_INTERVAL: int = 60 * 60
+
+
+"""Payload settings."""
+
+
+# INFO: время хранения в кеше заранее сериализованных ответов API.
+#       Ответы становятся неактуальными раньше при изменении данных.
+PAYLOAD_CACHE_TIMEOUT: int = 60 * 60 * 24
+
+# INFO: ответы короче (в байтах) не сжимаются: выигрыш меньше заголовков.
+PAYLOAD_GZIP_MIN_LEN: int = 200
+
+
+"""Reference cache settings."""
+
+
+# INFO: период (в секундах) проверки актуальности справочников,
+#       закешированных в памяти процесса.
+REFERENCE_CACHE_CHECK_INTERVAL: int = 5
+
+
+"""Query detector settings."""
+
+
+# INFO: обнаружение N+1 запросов к БД (hakaton.query_detector):
+#       предупреждение в лог (или исключение при QUERY_DETECTOR_RAISE),
+#       если один SQL запрос выполнен за HTTP запрос больше
+#       QUERY_DETECTOR_THRESHOLD раз.
+QUERY_DETECTOR_ENABLED: bool = (
+    os.getenv('QUERY_DETECTOR_ENABLED', 'False') == 'True'
+)
+QUERY_DETECTOR_RAISE: bool = (
+    os.getenv('QUERY_DETECTOR_RAISE', 'False') == 'True'
+)
+QUERY_DETECTOR_THRESHOLD: int = int(os.getenv('QUERY_DETECTOR_THRESHOLD', 10))
+
+
 """Email settings."""
 
 
@@ -0,0 +1,32 @@
+"""
+Счетчики версий данных, общие для всех процессов приложения.
+
+Счетчик хранится в кеше Django (Redis). Процессы сравнивают сохраненную
+у себя версию с текущей, чтобы понять, устарели ли локальные данные.
+"""
+from time import time
+
+from django.core.cache import cache
+
+
+def get_version(key: str) -> int:
+    """
+    Возвращает текущее значение счетчика версии.
+    Если счетчика нет в кеше (например, после очистки Redis),
+    создает его с начальным значением от текущего времени: так новая
+    версия не совпадет ни с одной из ранее выданных.
+    """
+    version: int = cache.get(key)
+    if version is None:
+        cache.add(key, int(time() * 1000), timeout=None)
+        version: int = cache.get(key)
+    return version
+
+
+def bump_version(key: str) -> int:
+    """Увеличивает счетчик версии и возвращает новое значение."""
+    try:
+        return cache.incr(key)
+    except ValueError:
+        get_version(key=key)
+        return cache.incr(key)
@@ -0,0 +1,43 @@
+"""
+Накопление значений до коммита текущей транзакции.
+
+Сигналы моделей отправляются для каждой измененной строки, и одно
+изменение через API или админку может затронуть несколько строк одного
+объекта. Значения (например, ID вакансий для пересчета) собираются
+в набор, и после коммита функция обработки вызывается один раз
+со всеми накопленными значениями.
+"""
+from threading import local
+from typing import Callable, Iterable
+
+from django.db import transaction
+
+_pending: local = local()
+
+
+def on_commit_batch(flush: Callable[[list], None], values: Iterable) -> None:
+    """
+    Добавляет values в набор значений flush и регистрирует вызов flush
+    после коммита текущей транзакции. flush вызывается один раз
+    с отсортированным списком значений, накопленных к коммиту;
+    остальные зарегистрированные вызовы ничего не делают.
+    """
+    # INFO: вызов регистрируется при каждом добавлении: если транзакция
+    #       или точка сохранения откатится, оставшиеся в наборе значения
+    #       будут обработаны после следующего коммита (пересчет
+    #       повторяем), а новые значения не потеряются.
+    batches: dict[Callable, set] = getattr(_pending, 'batches', None)
+    if batches is None:
+        batches: dict[Callable, set] = {}
+        _pending.batches = batches
+    batches.setdefault(flush, set()).update(values)
+    transaction.on_commit(lambda: _flush_batch(flush=flush))
+    return
+
+
+def _flush_batch(flush: Callable[[list], None]) -> None:
+    """Вызывает flush с накопленными значениями, если они есть."""
+    values: set = _pending.batches.pop(flush, None)
+    if values:
+        flush(sorted(values))
+    return
@@ -0,0 +1,142 @@
+"""
+Обнаружение N+1 запросов к базе данных при обработке HTTP запроса.
+
+Middleware группирует SQL запросы, выполненные во время обработки
+HTTP запроса, по нормализованному виду (без значений параметров
+и с одинаковыми списками IN). Если один и тот же запрос выполнен
+больше QUERY_DETECTOR_THRESHOLD раз, в лог hakaton.query_detector
+пишется предупреждение с именем представления и фрагментом стека
+вызовов проекта, а при QUERY_DETECTOR_RAISE - выбрасывается исключение
+(для тестов и тестового стенда).
+
+Подключение и порог задаются в settings:
+    - QUERY_DETECTOR_ENABLED
+    - QUERY_DETECTOR_RAISE
+    - QUERY_DETECTOR_THRESHOLD
+"""
+import logging
+import re
+import traceback
+from collections import Counter
+from typing import Callable
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.http import HttpRequest, HttpResponse
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+SQL_IN_LIST: re.Pattern = re.compile(r'\bIN \([^()]*\)', re.IGNORECASE)
+SQL_NUMBER: re.Pattern = re.compile(r'\b\d+\b')
+SQL_STRING: re.Pattern = re.compile(r"'(?:[^']|'')*'")
+
+# INFO: количество последних вызовов кода проекта в примере стека.
+STACK_SAMPLE_LEN: int = 8
+
+
+class NPlusOneQueryError(Exception):
+    """Один и тот же SQL запрос выполнен больше допустимого числа раз."""
+
+    pass
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Приводит SQL запрос к виду без значений: строки и числа заменяются
+    на '?', списки IN - на 'IN (...)'.
+    """
+    sql: str = SQL_STRING.sub('?', sql)
+    sql: str = SQL_NUMBER.sub('?', sql)
+    return SQL_IN_LIST.sub('IN (...)', sql)
+
+
+def get_stack_sample() -> list[str]:
+    """
+    Возвращает последние STACK_SAMPLE_LEN вызовов кода проекта
+    (без установленных библиотек и самого детектора).
+    """
+    base_dir: str = str(settings.BASE_DIR)
+    frames: list[traceback.FrameSummary] = [
+        frame for frame in traceback.extract_stack()
+        if frame.filename.startswith(base_dir)
+        and 'site-packages' not in frame.filename
+        and frame.filename != __file__
+    ]
+    return traceback.format_list(frames[-STACK_SAMPLE_LEN:])
+
+
+class QueryCounter:
+    """
+    Обертка выполнения SQL запросов (connection.execute_wrapper):
+    считает запросы по нормализованному виду и сохраняет стек вызовов
+    при первом превышении порога.
+    """
+
+    def __init__(self, threshold: int) -> None:
+        self.threshold: int = threshold
+        self.counts: Counter = Counter()
+        self.samples: dict[str, list[str]] = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        statement: str = normalize_sql(sql=sql)
+        self.counts[statement] += 1
+        if self.counts[statement] == self.threshold + 1:
+            self.samples[statement] = get_stack_sample()
+        return execute(sql, params, many, context)
+
+    def get_repeated(self) -> dict[str, int]:
+        """Возвращает запросы, выполненные больше порога, и их количество."""
+        return {
+            statement: count for statement, count in self.counts.items()
+            if count > self.threshold
+        }
+
+
+class QueryDetectorMiddleware:
+    """Middleware обнаружения N+1 запросов к базе данных."""
+
+    def __init__(self, get_response: Callable) -> None:
+        if not getattr(settings, 'QUERY_DETECTOR_ENABLED', False):
+            raise MiddlewareNotUsed
+        self.get_response: Callable = get_response
+        self.threshold: int = settings.QUERY_DETECTOR_THRESHOLD
+        self.raise_error: bool = settings.QUERY_DETECTOR_RAISE
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        counter: QueryCounter = QueryCounter(threshold=self.threshold)
+        # INFO: запросы потоковых ответов (StreamingHttpResponse)
+        #       выполняются после выхода из middleware и не учитываются.
+        with connection.execute_wrapper(counter):
+            response: HttpResponse = self.get_response(request)
+        repeated: dict[str, int] = counter.get_repeated()
+        if repeated:
+            self._report(
+                request=request, counter=counter, repeated=repeated,
+            )
+        return response
+
+    def _report(
+            self,
+            request: HttpRequest,
+            counter: QueryCounter,
+            repeated: dict[str, int],
+            ) -> None:
+        """Пишет предупреждение в лог или выбрасывает исключение."""
+        resolver_match = request.resolver_match
+        view_name: str = (
+            resolver_match.view_name if resolver_match else request.path
+        )
+        message: str = '\n\n'.join(
+            f'{count} x {statement}\n'
+            + ''.join(counter.samples[statement])
+            for statement, count in repeated.items()
+        )
+        message: str = (
+            f'N+1 запросы в {request.method} {view_name} '
+            f'(порог {self.threshold}):\n{message}'
+        )
+        if self.raise_error:
+            raise NPlusOneQueryError(message)
+        logger.warning(message)
+        return
@@ -4,20 +4,54 @@ from corsheaders.defaults import default_headers
 from celery.schedules import crontab
 
 from hakaton.app_data import (  # noqa F401
-    ACCESS_TOKEN_LIFETIME_TD, BASE_DIR, CITE_DOMAIN, CITE_IP, DB_POSTGRESQL,
+    ACCESS_TOKEN_LIFETIME_TD, AUTOCOMPLETE_POPULARITY_INTERVAL, BASE_DIR, CITE_DOMAIN, CITE_IP, DB_POSTGRESQL,
     DB_SQLITE, DEFAULT_FROM_EMAIL, EMAIL_HOST, EMAIL_PORT, EMAIL_HOST_USER,
     EMAIL_HOST_PASSWORD, EMAIL_USE_TLS, EMAIL_USE_SSL, EMAIL_SSL_CERTFILE,
-    EMAIL_SSL_KEYFILE, EMAIL_TIMEOUT, SECRET_KEY,
+    EMAIL_SSL_KEYFILE, EMAIL_TIMEOUT, QUERY_DETECTOR_ENABLED,
+    QUERY_DETECTOR_RAISE, QUERY_DETECTOR_THRESHOLD, SECRET_KEY,
 )
 
 
 """App settings."""
 
 
-# TODO: подключить логгер.
 DEBUG = False
 
 
+"""Logging settings."""
+
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'default': {
+            'format': '{asctime} {levelname} {name}: {message}',
+            'style': '{',
+        },
+    },
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'default',
+        },
+    },
+    'root': {
+        'handlers': ('console',),
+        'level': 'WARNING',
+    },
+    'loggers': {
+        'hakaton.query_detector': {
+            'level': 'WARNING',
+        },
+    },
+}
+
+QUERY_DETECTOR_ENABLED: bool = QUERY_DETECTOR_ENABLED
+QUERY_DETECTOR_RAISE: bool = QUERY_DETECTOR_RAISE
+QUERY_DETECTOR_THRESHOLD: int = QUERY_DETECTOR_THRESHOLD
+
+
 """Celery settings."""
 
 
@@ -28,6 +62,10 @@ CELERY_BEAT_SCHEDULE = {
         'task': 'user.tasks.send_hr_task_notify',
         'schedule': crontab(hour=7),
     },
+    'update_autocomplete_popularity': {
+        'task': 'vacancy.tasks.update_autocomplete_popularity',
+        'schedule': AUTOCOMPLETE_POPULARITY_INTERVAL,
+    },
 }
 
 CELERY_TASK_TRACK_STARTED = True
@@ -37,6 +75,17 @@ CELERY_BROKER_URL = 'redis://hr_practicum_redis:6379/0'
 CELERY_RESULT_BACKEND = 'redis://hr_practicum_redis:6379/0'
 
 
+"""Cache settings."""
+
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': 'redis://hr_practicum_redis:6379/1',
+    },
+}
+
+
 """Email settings."""
 
 
@@ -74,6 +123,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'django_celery_beat',
     'django_filters',
@@ -130,6 +180,11 @@ MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
 MEDIA_URL = 'media/'
 
+# INFO: файлы выгрузок содержат персональные данные кандидатов,
+#       поэтому хранятся вне MEDIA_ROOT (не раздаются nginx) и отдаются
+#       только владельцу выгрузки через /api/v1/exports/<id>/download/.
+PRIVATE_MEDIA_ROOT = os.path.join(BASE_DIR, 'private_media')
+
 STATIC_ROOT = os.path.join(BASE_DIR, 'static')
 
 STATIC_URL = 'static/'
@@ -216,6 +271,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'hakaton.query_detector.QueryDetectorMiddleware',
 ]
 
 REST_FRAMEWORK = {
@@ -1,8 +1,22 @@
 from hakaton.app_data import DB_SQLITE
 from hakaton.settings import *  # noqa F403
 
+CELERY_TASK_ALWAYS_EAGER = True
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+}
+
 DATABASES = DB_SQLITE
 
 SECRET_KEY = 'test_secret_key'
 
+# INFO: в тестах N+1 запросы приводят к ошибке.
+QUERY_DETECTOR_ENABLED = True
+QUERY_DETECTOR_RAISE = True
+
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media_test')  # noqa F405
+
+PRIVATE_MEDIA_ROOT = os.path.join(BASE_DIR, 'private_media_test')  # noqa F405
@@ -30,6 +30,8 @@ echo @@@@@@@@@@@@@@@@@@@@@@  import database data  @@@@@@@@@@@@@@@@@@@@@@@
 echo @@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@
 
 python manage.py csv_db_import
+python manage.py rebuild_skill_index
+python manage.py rebuild_vacancy_matches
 
 echo импортированы:
 echo     - города
@@ -5,3 +5,6 @@ class StudentConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'student'
     verbose_name = 'Студенты Практикума'
+
+    def ready(self):
+        import student.signals  # noqa F401
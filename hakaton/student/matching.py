@@ -0,0 +1,723 @@
+"""
+Подбор кандидатов под требования вакансий.
+
+Модуль содержит фильтры списка студентов по требованиям вакансии,
+ранжирование кандидатов по оценке соответствия, поддержку таблицы
+VacancyMatch, в которой хранятся подходящие под вакансию студенты,
+и кеш списков подходящих студентов по хешу требований вакансии.
+"""
+from collections import defaultdict
+from hashlib import sha1
+import json
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import (
+    Case, Count, Exists, ExpressionWrapper, IntegerField, OuterRef, Q,
+    QuerySet, Subquery, Value, When,
+)
+from django.db.models.functions import Coalesce
+
+from hakaton.app_data import (
+    MATCH_CACHE_TIMEOUT,
+    MATCH_WEIGHT_CITY, MATCH_WEIGHT_EMPLOYMENT, MATCH_WEIGHT_EXP,
+    MATCH_WEIGHT_LANGUAGE, MATCH_WEIGHT_SCHEDULE, MATCH_WEIGHT_SKILL,
+)
+from hakaton.cache_versions import bump_version, get_version
+from student.models import (
+    Student, StudentEmployment, StudentLanguage, StudentSchedule, StudentSkill,
+)
+from student.skill_index import skill_index
+from vacancy.models import (
+    City, Employment, Experience, LanguageLevel, Schedule, Vacancy,
+    VacancyLanguage, VacancyMatch, VacancySkill,
+)
+from vacancy.reference_cache import reference_caches
+
+MATCHES_VERSION_KEY: str = 'vacancy_matches_version'
+VACANCY_FINGERPRINT_KEY: str = 'vacancy_fingerprint_{vacancy_id}'
+MATCHED_STUDENTS_KEY: str = 'matched_students_{fingerprint}_{version}'
+
+
+def get_vacancies(vacancy_ids: list[int]) -> QuerySet:
+    """Возвращает вакансии со всеми требованиями к кандидатам."""
+    return Vacancy.objects.select_related(
+        'city',
+        'experience',
+        'employment',
+        'schedule',
+    ).prefetch_related(
+        'vacancy_language__language',
+        'vacancy_language__level',
+        'vacancy_skill',
+    ).filter(
+        id__in=vacancy_ids,
+    )
+
+
+def get_vacancy(vacancy_id: int) -> Vacancy:
+    """
+    Возвращает вакансию со всеми требованиями к кандидатам.
+    Если вакансии не существует - возвращает None.
+    """
+    return get_vacancies(vacancy_ids=(vacancy_id,)).first()
+
+
+def get_vacancy_languages(vacancy: Vacancy) -> list[dict[str, int]]:
+    """Возвращает требования вакансии к владению языками."""
+    return list(
+        {
+            'language_id': languages.language.id,
+            'language_level': languages.level.level
+        } for languages in vacancy.vacancy_language.all()
+    )
+
+
+def get_vacancy_skill_ids(vacancy: Vacancy) -> list[int]:
+    """Возвращает ID требуемых вакансией навыков."""
+    return list(
+        vacancy_skill.skill_id
+        for vacancy_skill in vacancy.vacancy_skill.all()
+    )
+
+
+def get_vacancy_fingerprint(vacancy: Vacancy) -> str:
+    """
+    Возвращает хеш требований вакансии к кандидатам: город, опыт работы,
+    тип занятости, график работы, навыки и языки с порядковыми уровнями
+    владения. Вакансии с одинаковыми требованиями имеют одинаковый хеш.
+    """
+    requirements: list = [
+        vacancy.city_id,
+        vacancy.experience_id,
+        vacancy.employment_id,
+        vacancy.schedule_id,
+        sorted(set(get_vacancy_skill_ids(vacancy=vacancy))),
+        sorted(set(
+            (language['language_id'], language['language_level'])
+            for language in get_vacancy_languages(vacancy=vacancy)
+        )),
+    ]
+    return sha1(json.dumps(requirements).encode()).hexdigest()
+
+
+def get_matched_student_ids(vacancy_id: int) -> list[int]:
+    """
+    Возвращает отсортированный по возрастанию список ID студентов,
+    полностью подходящих под требования неархивной вакансии,
+    по строкам VacancyMatch.
+    Результат кешируется по хешу требований вакансии и версии таблицы
+    VacancyMatch: вакансии с одинаковыми требованиями используют общую
+    запись кеша, а любой пересчет строк таблицы делает все записи
+    устаревшими. Хеш требований записывается по ID вакансии при пересчете
+    ее строк (refresh_vacancy_matches) и поэтому всегда соответствует
+    строкам таблицы, даже если вакансия изменена, а пересчет еще
+    не выполнен. Если хеша нет, запись кеша относится только к вакансии.
+    """
+    # INFO: версия читается до строк таблицы: если строки будут
+    #       пересчитаны во время чтения, результат сохранится
+    #       под устаревшей версией.
+    version: int = get_version(key=MATCHES_VERSION_KEY)
+    fingerprint: str = cache.get(
+        VACANCY_FINGERPRINT_KEY.format(vacancy_id=vacancy_id)
+    )
+    if fingerprint is None:
+        fingerprint: str = f'vacancy_{vacancy_id}'
+    cache_key: str = MATCHED_STUDENTS_KEY.format(
+        fingerprint=fingerprint, version=version,
+    )
+    student_ids: list[int] = cache.get(cache_key)
+    if student_ids is None:
+        student_ids: list[int] = list(
+            VacancyMatch.objects.filter(
+                vacancy_id=vacancy_id,
+            ).order_by(
+                'student_id',
+            ).values_list(
+                'student_id', flat=True,
+            )
+        )
+        cache.set(cache_key, student_ids, timeout=MATCH_CACHE_TIMEOUT)
+    return student_ids
+
+
+def invalidate_matched_students() -> None:
+    """Делает устаревшими все закешированные списки подходящих студентов."""
+    bump_version(key=MATCHES_VERSION_KEY)
+    return
+
+
+def _set_vacancy_fingerprint(vacancy_id: int, fingerprint: str) -> None:
+    """
+    Сохраняет хеш требований, по которым рассчитаны строки VacancyMatch
+    вакансии. Для архивных и удаленных вакансий хеш удаляется.
+    """
+    key: str = VACANCY_FINGERPRINT_KEY.format(vacancy_id=vacancy_id)
+    if fingerprint is None:
+        cache.delete(key)
+    else:
+        cache.set(key, fingerprint, timeout=MATCH_CACHE_TIMEOUT)
+    return
+
+
+def _matches_refreshed(
+        changed: bool, vacancy_id: int = None, fingerprint: str = None,
+        ) -> None:
+    """
+    После коммита пересчета строк VacancyMatch сохраняет хеш требований
+    вакансии (если указана вакансия) и, если строки изменились, делает
+    устаревшими закешированные списки подходящих студентов. До коммита
+    списки читаются из прежних строк таблицы и остаются согласованными
+    с ними.
+    """
+    def refreshed() -> None:
+        if vacancy_id is not None:
+            _set_vacancy_fingerprint(
+                vacancy_id=vacancy_id, fingerprint=fingerprint,
+            )
+        if changed:
+            invalidate_matched_students()
+        return
+
+    transaction.on_commit(refreshed)
+    return
+
+
+def filter_by_matches(students: QuerySet, vacancy: Vacancy) -> QuerySet:
+    """
+    Принимает список студентов. Производит фильтрацию тех из них,
+    кто полностью подходит под требования вакансии.
+    Для неархивных вакансий используются заранее рассчитанные строки
+    VacancyMatch: условие передается в БД подзапросом, без перечня ID.
+    Строки архивных вакансий удаляются, поэтому для них студенты
+    подбираются по требованиям вакансии (см. filter_by_vacancy):
+    в этом случае вакансия должна быть загружена get_vacancy.
+    Возвращает отфильтрованный список студентов.
+    """
+    if vacancy.is_archived:
+        return filter_by_vacancy(students=students, vacancy=vacancy)
+    return students.filter(
+        Exists(
+            VacancyMatch.objects.filter(
+                vacancy_id=vacancy.id,
+                student_id=OuterRef('pk'),
+            )
+        )
+    )
+
+
+def get_matched_student_ids_bulk(
+        vacancy_ids: list[int],
+        archived_ids: list[int] = (),
+        ) -> dict[int, list[int]]:
+    """
+    Возвращает для каждой из указанных вакансий отсортированный
+    по убыванию список ID полностью подходящих студентов.
+    Все неархивные вакансии обрабатываются одним запросом к таблице
+    VacancyMatch. Строки архивных вакансий (archived_ids) удаляются,
+    поэтому для них студенты подбираются по требованиям вакансий
+    за один проход (см. get_student_ids_by_vacancies).
+    """
+    matched: dict[int, list[int]] = {
+        vacancy_id: [] for vacancy_id in vacancy_ids
+    }
+    if archived_ids:
+        for vacancy_id, student_ids in get_student_ids_by_vacancies(
+                vacancies=list(get_vacancies(vacancy_ids=archived_ids)),
+                ).items():  # noqa (E124)
+            matched[vacancy_id] = sorted(student_ids, reverse=True)
+    for vacancy_id, student_id in VacancyMatch.objects.filter(
+            vacancy_id__in=set(vacancy_ids) - set(archived_ids),
+            ).order_by(
+                'vacancy_id', '-student_id',
+            ).values_list(
+                'vacancy_id', 'student_id',
+            ):  # noqa (E124)
+        matched[vacancy_id].append(student_id)
+    return matched
+
+
+def get_student_ids_by_vacancies(
+        vacancies: list[Vacancy]) -> dict[int, set[int]]:
+    """
+    Возвращает для каждой из вакансий ID полностью подходящих студентов.
+    Вакансии должны быть загружены get_vacancies.
+    Данные студентов, которые могут подойти хотя бы под одну вакансию,
+    читаются из БД один раз (по одному запросу к каждой таблице),
+    после чего каждая вакансия проверяется в памяти. Количество запросов
+    не зависит от количества вакансий. Требования по навыкам проверяются
+    по индексу навыков.
+    """
+    if not vacancies:
+        return {}
+    students: QuerySet = Student.objects.filter(
+        Q(city_id__in=set(vacancy.city_id for vacancy in vacancies))
+        | Q(relocation=True),
+        experience_id__in=set(vacancy.experience_id for vacancy in vacancies),
+    )
+    attributes: dict[int, tuple[int, bool, int]] = {
+        student_id: (city_id, relocation, experience_id)
+        for student_id, city_id, relocation, experience_id
+        in students.order_by().values_list(
+            'id', 'city_id', 'relocation', 'experience_id',
+        )
+    }
+    employments: dict[int, set[int]] = defaultdict(set)
+    for student_id, employment_id in StudentEmployment.objects.filter(
+            student__in=students.values('id'),
+            employment_id__in=set(
+                vacancy.employment_id for vacancy in vacancies
+            ),
+            ).order_by().values_list(
+                'student_id', 'employment_id',
+            ):  # noqa (E124)
+        employments[student_id].add(employment_id)
+    schedules: dict[int, set[int]] = defaultdict(set)
+    for student_id, schedule_id in StudentSchedule.objects.filter(
+            student__in=students.values('id'),
+            schedule_id__in=set(vacancy.schedule_id for vacancy in vacancies),
+            ).order_by().values_list(
+                'student_id', 'schedule_id',
+            ):  # noqa (E124)
+        schedules[student_id].add(schedule_id)
+    requirements: dict[int, dict[int, int]] = {}
+    for vacancy in vacancies:
+        levels: dict[int, int] = {}
+        for language in get_vacancy_languages(vacancy=vacancy):
+            language_id: int = language['language_id']
+            levels[language_id] = max(
+                language['language_level'],
+                levels.get(language_id, language['language_level']),
+            )
+        requirements[vacancy.id] = levels
+    languages: dict[int, dict[int, int]] = defaultdict(dict)
+    language_ids: set[int] = set()
+    for levels in requirements.values():
+        language_ids.update(levels)
+    if language_ids:
+        for student_id, language_id, level in StudentLanguage.objects.filter(
+                student__in=students.values('id'),
+                language_id__in=language_ids,
+                ).order_by().values_list(
+                    'student_id', 'language_id', 'level__level',
+                ):  # noqa (E124)
+            languages[student_id][language_id] = max(
+                level, languages[student_id].get(language_id, level)
+            )
+    matched: dict[int, set[int]] = {}
+    for vacancy in vacancies:
+        student_ids: set[int] = set(
+            student_id
+            for student_id, (city_id, relocation, experience_id)
+            in attributes.items()
+            if experience_id == vacancy.experience_id
+            and (relocation or city_id == vacancy.city_id)
+            and vacancy.employment_id in employments[student_id]
+            and vacancy.schedule_id in schedules[student_id]
+            and all(
+                languages[student_id].get(language_id, -1) >= level
+                for language_id, level in requirements[vacancy.id].items()
+            )
+        )
+        skill_ids: list[int] = get_vacancy_skill_ids(vacancy=vacancy)
+        if skill_ids and student_ids:
+            student_ids &= set(skill_index.match(skill_ids=skill_ids))
+        matched[vacancy.id] = student_ids
+    return matched
+
+
+def filter_by_vacancy(students: QuerySet, vacancy: Vacancy) -> QuerySet:
+    """
+    Принимает список студентов. Производит фильтрацию тех из них,
+    кто полностью подходит под требования вакансии.
+    Возвращает отфильтрованный список студентов.
+    """
+    return filter_by_skills(
+        students=_filter_by_vacancy_conditions(
+            students=students,
+            vacancy=vacancy,
+        ),
+        skill_ids=get_vacancy_skill_ids(vacancy=vacancy),
+    )
+
+
+def get_student_ids_by_vacancy(vacancy: Vacancy) -> set[int]:
+    """
+    Возвращает ID студентов, полностью подходящих под требования вакансии.
+    Требования по навыкам проверяются по индексу навыков в памяти
+    процесса: ID, выбранные из БД по остальным требованиям,
+    пересекаются с результатом индекса в Python, без передачи
+    перечня ID обратно в БД.
+    """
+    student_ids: set[int] = set(
+        _filter_by_vacancy_conditions(
+            students=Student.objects.all(),
+            vacancy=vacancy,
+        ).values_list('id', flat=True)
+    )
+    skill_ids: list[int] = get_vacancy_skill_ids(vacancy=vacancy)
+    if skill_ids:
+        student_ids &= set(skill_index.match(skill_ids=skill_ids))
+    return student_ids
+
+
+def _filter_by_vacancy_conditions(
+        students: QuerySet, vacancy: Vacancy) -> QuerySet:
+    """
+    Производит фильтрацию студентов по всем требованиям вакансии,
+    кроме навыков: город, тип занятости, опыт, языки и график работы.
+    """
+    students: QuerySet = filter_by_city(
+        students=students,
+        city=vacancy.city
+    )
+    students: QuerySet = filter_by_employment(
+        students=students,
+        employment=vacancy.employment
+    )
+    students: QuerySet = filter_by_experience(
+        students=students,
+        experience=vacancy.experience
+    )
+    students: QuerySet = filter_by_languages(
+        students=students,
+        languages=get_vacancy_languages(vacancy=vacancy),
+    )
+    return filter_by_schedule(
+        students=students,
+        schedule=vacancy.schedule
+    )
+
+
+def rank_by_vacancy(students: QuerySet, vacancy: Vacancy) -> QuerySet:
+    """
+    Принимает список студентов. Вычисляет для каждого из них
+    взвешенную оценку соответствия требованиям вакансии: совпадающие
+    навыки, языки, опыт работы, график работы, тип занятости
+    и город (или готовность к переезду).
+    Возвращает студентов с ненулевой оценкой, отсортированных
+    по ее убыванию (при равной оценке - по убыванию id).
+    Top-k выбирается в БД: курсор по паре (score, id)
+    (см. api.v1.paginations.KeysetCursorPagination) добавляет
+    к этой сортировке LIMIT k + 1, а следующие k кандидатов - условие
+    (score < S) OR (score = S AND id < ID), без OFFSET. Полный список
+    кандидатов не выбирается и не сериализуется.
+    """
+    languages: list[dict] = get_vacancy_languages(vacancy=vacancy)
+    skill_ids: list[int] = get_vacancy_skill_ids(vacancy=vacancy)
+    skills_score = Value(0)
+    if skill_ids:
+        skills_count: QuerySet = StudentSkill.objects.filter(
+            student=OuterRef('pk'),
+            skill_id__in=skill_ids,
+        ).order_by().values('student').annotate(
+            count=Count('id'),
+        ).values('count')
+        skills_score = Coalesce(
+            Subquery(skills_count, output_field=IntegerField()), 0
+        ) * MATCH_WEIGHT_SKILL
+    languages_score = Value(0)
+    if languages:
+        languages_count: QuerySet = StudentLanguage.objects.filter(
+            get_languages_condition(languages=languages),
+            student=OuterRef('pk'),
+        ).order_by().values('student').annotate(
+            count=Count('id'),
+        ).values('count')
+        languages_score = Coalesce(
+            Subquery(languages_count, output_field=IntegerField()), 0
+        ) * MATCH_WEIGHT_LANGUAGE
+    score = (
+        skills_score
+        + languages_score
+        + Case(
+            When(
+                Q(city=vacancy.city) | Q(relocation=True),
+                then=MATCH_WEIGHT_CITY,
+            ),
+            default=0,
+        )
+        + Case(
+            When(experience=vacancy.experience, then=MATCH_WEIGHT_EXP),
+            default=0,
+        )
+        + Case(
+            When(
+                Exists(StudentEmployment.objects.filter(
+                    student=OuterRef('pk'),
+                    employment=vacancy.employment,
+                )),
+                then=MATCH_WEIGHT_EMPLOYMENT,
+            ),
+            default=0,
+        )
+        + Case(
+            When(
+                Exists(StudentSchedule.objects.filter(
+                    student=OuterRef('pk'),
+                    schedule=vacancy.schedule,
+                )),
+                then=MATCH_WEIGHT_SCHEDULE,
+            ),
+            default=0,
+        )
+    )
+    return students.annotate(
+        score=ExpressionWrapper(score, output_field=IntegerField()),
+    ).filter(
+        score__gt=0,
+    ).order_by(
+        '-score', '-id',
+    )
+
+
+def filter_by_city(students: QuerySet, city: City) -> QuerySet:
+    """
+    Принимает список студентов. Производит фильтрацию тех из них,
+    кто имеет возможность работать непосредственно в офисе.
+    Возвращает отфильтрованный список студентов.
+    """
+    return students.filter(Q(city=city) | Q(relocation=True))
+
+
+def filter_by_experience(
+        students: QuerySet, experience: Experience) -> QuerySet:
+    """
+    Принимает список студентов. Производит фильтрацию тех из них,
+    кто имеет указанный в вакансии опыт работы.
+    Возвращает отфильтрованный список студентов.
+    """
+    return students.filter(experience=experience)
+
+
+def filter_by_employment(
+        students: QuerySet, employment: Employment) -> QuerySet:
+    """
+    Принимает список студентов. Производит фильтрацию тех из них,
+    кто имеет указанный в вакансии тип занятости.
+    Возвращает отфильтрованный список студентов.
+    """
+    return students.filter(student_employment__employment=employment)
+
+
+def filter_by_languages(
+        students: QuerySet, languages: list[dict]) -> QuerySet:
+    """
+    Принимает список студентов. Производит фильтрацию тех из них,
+    кто владеет всеми указанными в вакансии языками на требуемом уровне.
+    Уровень в languages указывается порядковым значением
+    LanguageLevel.level, а не ID уровня.
+    Возвращает отфильтрованный список студентов.
+    Проверка выполняется одним подзапросом с группировкой по студенту:
+    студент подходит, если количество языков с подходящим уровнем
+    равно количеству требуемых языков. Несколько требований к одному
+    языку сводятся к наибольшему уровню.
+    """
+    if not languages:
+        return students
+    levels: dict[int, int] = {}
+    for language in languages:
+        language_id: int = int(language['language_id'])
+        level: int = int(language['language_level'])
+        levels[language_id] = max(level, levels.get(language_id, level))
+    languages: list[dict] = list(
+        {'language_id': language_id, 'language_level': level}
+        for language_id, level in levels.items()
+    )
+    matched: QuerySet = StudentLanguage.objects.filter(
+        get_languages_condition(languages=languages),
+    ).values(
+        'student_id',
+    ).annotate(
+        languages_count=Count('language_id'),
+    ).filter(
+        languages_count=len(languages),
+    ).order_by().values('student_id')
+    return students.filter(id__in=matched)
+
+
+def get_languages_condition(languages: list[dict]) -> Q:
+    """
+    Возвращает условие для модели StudentLanguage: язык совпадает
+    с одним из указанных и порядковый уровень владения (LanguageLevel.level)
+    не ниже требуемого.
+    Порядковый уровень заменяется перечнем ID подходящих уровней
+    (level_id IN (...)), поэтому условие не требует соединения
+    с LanguageLevel. Это не диапазон по порядковому уровню:
+    по индексу (language, level, student) для каждого языка выполняется
+    поиск по значению language и каждому ID уровня из перечня.
+    Уровни берутся из кеша справочников в памяти процесса.
+    """
+    levels: list[LanguageLevel] = reference_caches[LanguageLevel].all()
+    condition: Q = Q()
+    for language in languages:
+        condition |= Q(
+            language_id=language['language_id'],
+            level_id__in=sorted(
+                level.id for level in levels
+                if level.level >= int(language['language_level'])
+            ),
+        )
+    return condition
+
+
+def filter_by_schedule(
+        students: QuerySet, schedule: Schedule) -> QuerySet:
+    """
+    Принимает список студентов. Производит фильтрацию тех из них,
+    кто имеет указанный в вакансии график работы.
+    Возвращает отфильтрованный список студентов.
+    """
+    return students.filter(student_schedule__schedule=schedule)
+
+
+def filter_by_skills(
+        students: QuerySet, skill_ids: list[int]) -> QuerySet:
+    """
+    Принимает список студентов. Производит фильтрацию тех из них,
+    кто имеет все (или более) указанные в вакансии навыки.
+    Возвращает отфильтрованный список студентов.
+    Проверка выполняется одним подзапросом с группировкой по студенту:
+    студент подходит, если количество найденных навыков равно
+    количеству требуемых.
+    """
+    skill_ids: set[int] = set(int(skill_id) for skill_id in skill_ids)
+    if not skill_ids:
+        return students
+    matched: QuerySet = StudentSkill.objects.filter(
+        skill_id__in=skill_ids,
+    ).values(
+        'student_id',
+    ).annotate(
+        skills_count=Count('skill_id'),
+    ).filter(
+        skills_count=len(skill_ids),
+    ).order_by().values('student_id')
+    return students.filter(id__in=matched)
+
+
+def filter_vacancies_by_student(
+        vacancies: QuerySet, student: Student) -> QuerySet:
+    """
+    Принимает список вакансий. Производит фильтрацию тех из них,
+    под требования которых полностью подходит студент.
+    Условия зеркальны filter_by_vacancy: вакансия не подходит,
+    если у нее есть навык или требование к языку,
+    которым студент не удовлетворяет.
+    Возвращает отфильтрованный список вакансий.
+    """
+    vacancies: QuerySet = vacancies.filter(
+        experience_id=student.experience_id,
+        employment_id__in=list(
+            employment.employment_id
+            for employment in student.student_employment.all()
+        ),
+        schedule_id__in=list(
+            schedule.schedule_id
+            for schedule in student.student_schedule.all()
+        ),
+    )
+    if not student.relocation:
+        vacancies: QuerySet = vacancies.filter(city_id=student.city_id)
+    missed_skills: QuerySet = VacancySkill.objects.filter(
+        vacancy=OuterRef('pk'),
+    ).exclude(
+        skill_id__in=list(
+            skill.skill_id for skill in student.student_skill.all()
+        ),
+    )
+    satisfied_languages: Q = Q()
+    for language in student.student_language.all():
+        satisfied_languages |= Q(
+            language_id=language.language_id,
+            level__level__lte=language.level.level,
+        )
+    missed_languages: QuerySet = VacancyLanguage.objects.filter(
+        vacancy=OuterRef('pk'),
+    )
+    if satisfied_languages:
+        missed_languages: QuerySet = missed_languages.exclude(
+            satisfied_languages
+        )
+    return vacancies.filter(~Exists(missed_skills), ~Exists(missed_languages))
+
+
+def _apply_matches(
+        matches: QuerySet, field: str, new_ids: set[int], **fixed) -> bool:
+    """
+    Приводит набор строк VacancyMatch из matches к new_ids:
+    добавляет строки с недостающими значениями поля field
+    и удаляет лишние. fixed - общие для всех строк значения полей.
+    Возвращает True, если строки изменились.
+    """
+    old_ids: set[int] = set(matches.values_list(field, flat=True))
+    if old_ids == new_ids:
+        return False
+    with transaction.atomic():
+        matches.filter(**{f'{field}__in': old_ids - new_ids}).delete()
+        VacancyMatch.objects.bulk_create(
+            (
+                VacancyMatch(**fixed, **{field: obj_id})
+                for obj_id in new_ids - old_ids
+            ),
+            ignore_conflicts=True,
+        )
+    return True
+
+
+def refresh_vacancy_matches(vacancy_id: int) -> None:
+    """
+    Пересчитывает строки VacancyMatch одной вакансии по всем студентам.
+    Для архивных и удаленных вакансий строки удаляются.
+    """
+    matches: QuerySet = VacancyMatch.objects.filter(vacancy_id=vacancy_id)
+    vacancy: Vacancy = get_vacancy(vacancy_id=vacancy_id)
+    if vacancy is None or vacancy.is_archived:
+        _matches_refreshed(
+            changed=bool(matches.delete()[0]), vacancy_id=vacancy_id,
+        )
+        return
+    changed: bool = _apply_matches(
+        matches=matches,
+        field='student_id',
+        new_ids=get_student_ids_by_vacancy(vacancy=vacancy),
+        vacancy_id=vacancy_id,
+    )
+    _matches_refreshed(
+        changed=changed,
+        vacancy_id=vacancy_id,
+        fingerprint=get_vacancy_fingerprint(vacancy=vacancy),
+    )
+    return
+
+
+def refresh_student_matches(student_id: int) -> None:
+    """
+    Пересчитывает строки VacancyMatch одного студента
+    по всем неархивным вакансиям.
+    """
+    matches: QuerySet = VacancyMatch.objects.filter(student_id=student_id)
+    student: Student = Student.objects.prefetch_related(
+        'student_employment',
+        'student_language__level',
+        'student_schedule',
+        'student_skill',
+    ).filter(
+        id=student_id,
+    ).first()
+    if student is None:
+        _matches_refreshed(changed=bool(matches.delete()[0]))
+        return
+    vacancies: QuerySet = filter_vacancies_by_student(
+        vacancies=Vacancy.objects.filter(is_archived=False),
+        student=student,
+    )
+    _matches_refreshed(
+        changed=_apply_matches(
+            matches=matches,
+            field='vacancy_id',
+            new_ids=set(vacancies.values_list('id', flat=True)),
+            student_id=student_id,
+        ),
+    )
+    return
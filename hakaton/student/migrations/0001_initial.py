@@ -0,0 +1,89 @@
+# Generated by Django 4.2.6 on 2026-10-18 20:18
+
+import django.contrib.postgres.search
+from django.db import migrations, models
+import hakaton.app_data
+import phonenumber_field.modelfields
+import user.validators
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Student',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('email', models.EmailField(max_length=254, unique=True, validators=[user.validators.validate_email], verbose_name='Адрес электронной почты')),
+                ('first_name', models.CharField(blank=True, max_length=30, null=True, validators=[user.validators.validate_name], verbose_name='Имя')),
+                ('last_name', models.CharField(blank=True, max_length=30, null=True, validators=[user.validators.validate_name], verbose_name='Фамилия')),
+                ('phone', phonenumber_field.modelfields.PhoneNumberField(max_length=128, region='RU', unique=True, verbose_name='Номер телефона')),
+                ('link_vk', models.CharField(blank=True, max_length=50, null=True, validators=[user.validators.validate_link], verbose_name='Ссылка на страницу vk')),
+                ('link_tg', models.CharField(blank=True, max_length=50, null=True, validators=[user.validators.validate_link], verbose_name='Ссылка на страницу telegram')),
+                ('link_fb', models.CharField(blank=True, max_length=50, null=True, validators=[user.validators.validate_link], verbose_name='Ссылка на страницу facebook')),
+                ('link_be', models.CharField(blank=True, max_length=50, null=True, validators=[user.validators.validate_link], verbose_name='Ссылка на страницу behance')),
+                ('link_in', models.CharField(blank=True, max_length=50, null=True, validators=[user.validators.validate_link], verbose_name='Ссылка на страницу linkedin')),
+                ('avatar', models.ImageField(blank=True, null=True, upload_to=hakaton.app_data.user_avatar_path, verbose_name='Аватар')),
+                ('relocation', models.BooleanField(verbose_name='Готовность к переезду')),
+                ('specialization', models.CharField(blank=True, max_length=30, null=True, verbose_name='Специализация')),
+                ('about_me', models.TextField(blank=True, max_length=150, null=True, verbose_name='Обо мне')),
+                ('about_exp', models.TextField(blank=True, max_length=150, null=True, verbose_name='Об опыте')),
+                ('about_education', models.TextField(blank=True, max_length=150, null=True, verbose_name='Об образовании')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True, verbose_name='Поисковый вектор')),
+            ],
+            options={
+                'verbose_name': 'Студент',
+                'verbose_name_plural': 'Студенты',
+                'ordering': ('-id',),
+            },
+        ),
+        migrations.CreateModel(
+            name='StudentEmployment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+            ],
+            options={
+                'verbose_name': 'Тип занятости студента',
+                'verbose_name_plural': 'Типы занятости работы студентов',
+                'ordering': ('-id',),
+            },
+        ),
+        migrations.CreateModel(
+            name='StudentLanguage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+            ],
+            options={
+                'verbose_name': 'Уровень владения языком',
+                'verbose_name_plural': 'Уровни владения языками',
+                'ordering': ('-id',),
+            },
+        ),
+        migrations.CreateModel(
+            name='StudentSchedule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+            ],
+            options={
+                'verbose_name': 'Тип графика работы студента',
+                'verbose_name_plural': 'Типы графиков работы студентов',
+                'ordering': ('-id',),
+            },
+        ),
+        migrations.CreateModel(
+            name='StudentSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+            ],
+            options={
+                'verbose_name': 'Навыки студента',
+                'verbose_name_plural': 'Навыки студентов',
+                'ordering': ('-id',),
+            },
+        ),
+    ]
@@ -0,0 +1,97 @@
+# Generated by Django 4.2.6 on 2026-10-18 20:18
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('student', '0001_initial'),
+        ('vacancy', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studentskill',
+            name='skill',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='student_skill', to='vacancy.skill', verbose_name='Навык'),
+        ),
+        migrations.AddField(
+            model_name='studentskill',
+            name='student',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='student_skill', to='student.student', verbose_name='Студент'),
+        ),
+        migrations.AddField(
+            model_name='studentschedule',
+            name='schedule',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='student_schedule', to='vacancy.schedule', verbose_name='График работы'),
+        ),
+        migrations.AddField(
+            model_name='studentschedule',
+            name='student',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='student_schedule', to='student.student', verbose_name='Студент'),
+        ),
+        migrations.AddField(
+            model_name='studentlanguage',
+            name='language',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='student_language', to='vacancy.language', verbose_name='Разговорный язык'),
+        ),
+        migrations.AddField(
+            model_name='studentlanguage',
+            name='level',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='student_language', to='vacancy.languagelevel', verbose_name='Уровень владения'),
+        ),
+        migrations.AddField(
+            model_name='studentlanguage',
+            name='student',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='student_language', to='student.student', verbose_name='Студент'),
+        ),
+        migrations.AddField(
+            model_name='studentemployment',
+            name='employment',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='student_employment', to='vacancy.employment', verbose_name='Тип занятости'),
+        ),
+        migrations.AddField(
+            model_name='studentemployment',
+            name='student',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='student_employment', to='student.student', verbose_name='Студент'),
+        ),
+        migrations.AddField(
+            model_name='student',
+            name='city',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='student', to='vacancy.city', verbose_name='Город проживания'),
+        ),
+        migrations.AddField(
+            model_name='student',
+            name='experience',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='student', to='vacancy.experience', verbose_name='Опыт работы'),
+        ),
+        migrations.AddConstraint(
+            model_name='studentskill',
+            constraint=models.UniqueConstraint(fields=('student', 'skill'), name='unique_student_skill'),
+        ),
+        migrations.AddConstraint(
+            model_name='studentschedule',
+            constraint=models.UniqueConstraint(fields=('student', 'schedule'), name='unique_student_schedule'),
+        ),
+        migrations.AddIndex(
+            model_name='studentlanguage',
+            index=models.Index(fields=['language', 'level', 'student'], name='student_language_level_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='studentlanguage',
+            constraint=models.UniqueConstraint(fields=('student', 'language'), name='unique_student_language'),
+        ),
+        migrations.AddConstraint(
+            model_name='studentemployment',
+            constraint=models.UniqueConstraint(fields=('student', 'employment'), name='unique_student_employment'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='student_search_vector_idx'),
+        ),
+    ]
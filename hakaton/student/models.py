@@ -1,3 +1,5 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from phonenumber_field.modelfields import PhoneNumberField
 
@@ -121,9 +123,23 @@ class Student(models.Model):
         blank=True,
         null=True,
     )
+    # INFO: поле заполняется сигналом student.signals.student_saved
+    #       и используется только при работе с PostgreSQL.
+    search_vector = SearchVectorField(
+        verbose_name='Поисковый вектор',
+        editable=False,
+        blank=True,
+        null=True,
+    )
 
     class Meta:
         ordering = ('-id',)
+        indexes = (
+            GinIndex(
+                fields=('search_vector',),
+                name='student_search_vector_idx',
+            ),
+        )
         verbose_name = 'Студент'
         verbose_name_plural = 'Студенты'
 
@@ -194,6 +210,12 @@ class StudentLanguage(models.Model):
                 name='unique_student_language',
             )
         ]
+        indexes = [
+            models.Index(
+                fields=('language', 'level', 'student'),
+                name='student_language_level_idx',
+            )
+        ]
         ordering = ('-id',)
         verbose_name = 'Уровень владения языком'
         verbose_name_plural = 'Уровни владения языками'
@@ -0,0 +1,93 @@
+from django.contrib.postgres.search import (
+    SearchQuery, SearchRank, SearchVector,
+)
+from django.db import connection
+from django.db.models import DecimalField, F, Q, QuerySet
+from django.db.models.functions import Cast
+
+from hakaton.app_data import (
+    STUDENT_SEARCH_CONFIG, STUDENT_SEARCH_RANK_DECIMAL_PLACES,
+    STUDENT_SEARCH_RANK_MAX_DIGITS, STUDENT_SEARCH_WEIGHTS,
+)
+from student.models import Student
+
+
+def is_search_vector_supported() -> bool:
+    """
+    Возвращает True, если используемая БД поддерживает
+    полнотекстовый поиск по tsvector (PostgreSQL).
+    """
+    return connection.vendor == 'postgresql'
+
+
+def get_search_vector() -> SearchVector:
+    """
+    Возвращает выражение поискового вектора по текстовым полям
+    профиля студента с учетом весов полей.
+    """
+    vector: SearchVector = None
+    for field, weight in STUDENT_SEARCH_WEIGHTS.items():
+        field_vector: SearchVector = SearchVector(
+            field, weight=weight, config=STUDENT_SEARCH_CONFIG,
+        )
+        vector = field_vector if vector is None else vector + field_vector
+    return vector
+
+
+def get_search_rank(query: SearchQuery) -> Cast:
+    """
+    Возвращает выражение релевантности студента поисковому запросу.
+    ts_rank возвращает float4: после сохранения в курсоре
+    (см. api.v1.paginations.KeysetCursorPagination) значение
+    сравнивается в БД как float8 и не равно исходному, из-за чего
+    студенты с одинаковой релевантностью повторяются или пропускаются
+    на соседних страницах. Поэтому релевантность приводится к numeric:
+    значение в курсоре и в БД совпадает точно.
+    """
+    return Cast(
+        SearchRank(F('search_vector'), query),
+        output_field=DecimalField(
+            max_digits=STUDENT_SEARCH_RANK_MAX_DIGITS,
+            decimal_places=STUDENT_SEARCH_RANK_DECIMAL_PLACES,
+        ),
+    )
+
+
+def update_search_vector(student_ids: list[int] = None) -> None:
+    """
+    Пересчитывает поисковый вектор указанных студентов одним
+    UPDATE запросом. Если список не передан - пересчитывает всех.
+    Для БД без поддержки tsvector ничего не делает.
+    """
+    if not is_search_vector_supported():
+        return
+    students: QuerySet = Student.objects.all()
+    if student_ids is not None:
+        students = students.filter(id__in=student_ids)
+    students.update(search_vector=get_search_vector())
+    return
+
+
+def search_students(students: QuerySet, text: str) -> QuerySet:
+    """
+    Принимает список студентов. Производит полнотекстовый поиск
+    по специализации и разделам "Обо мне", "Об опыте", "Об образовании".
+    Возвращает найденных студентов, отсортированных по релевантности.
+    """
+    if not is_search_vector_supported():
+        # INFO: в БД без tsvector (SQLite в тестах) выполняется
+        #       поиск подстроки без ранжирования.
+        condition: Q = Q()
+        for field in STUDENT_SEARCH_WEIGHTS:
+            condition |= Q(**{f'{field}__icontains': text})
+        return students.filter(condition)
+    query: SearchQuery = SearchQuery(
+        text, config=STUDENT_SEARCH_CONFIG, search_type='websearch',
+    )
+    return students.filter(
+        search_vector=query,
+    ).annotate(
+        rank=get_search_rank(query=query),
+    ).order_by(
+        '-rank', '-id',
+    )
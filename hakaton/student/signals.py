@@ -0,0 +1,89 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from hakaton.on_commit import on_commit_batch
+from student.models import (
+    Student, StudentEmployment, StudentLanguage, StudentSchedule, StudentSkill,
+)
+from student.search import update_search_vector
+from student.skill_index import skill_index
+from vacancy.tasks import refresh_students_matches_task
+
+
+def refresh_students_matches(student_ids: list[int]) -> None:
+    """
+    Записывает студентов, измененных в транзакции, в журнал индекса
+    навыков и ставит в очередь Celery одну задачу пересчета их
+    подходящих вакансий. Журнал записывается до постановки задачи:
+    пересчет и запросы, выполненные после него, видят новые навыки.
+    """
+    skill_index.log_changes(student_ids=student_ids)
+    refresh_students_matches_task.delay(student_ids=student_ids)
+    return
+
+
+def schedule_student_matches_refresh(student_id: int) -> None:
+    """
+    Ставит в очередь пересчет подходящих вакансий студента после коммита
+    текущей транзакции. Студенты, измененные в одной транзакции,
+    пересчитываются одной задачей по одному разу.
+    """
+    on_commit_batch(flush=refresh_students_matches, values=(student_id,))
+    return
+
+
+@receiver(post_save, sender=Student)
+def student_saved(sender, instance, **kwargs):
+    """
+    Пересчитывает поисковый вектор и подходящие вакансии
+    после изменения студента.
+    """
+    update_search_vector(student_ids=(instance.id,))
+    schedule_student_matches_refresh(student_id=instance.id)
+    return
+
+
+@receiver(post_delete, sender=Student)
+def student_deleted(sender, instance, **kwargs):
+    """Пересчитывает подходящие вакансии после удаления студента."""
+    schedule_student_matches_refresh(student_id=instance.id)
+    return
+
+
+@receiver(post_save, sender=StudentEmployment)
+@receiver(post_save, sender=StudentLanguage)
+@receiver(post_save, sender=StudentSchedule)
+@receiver(post_save, sender=StudentSkill)
+@receiver(post_delete, sender=StudentEmployment)
+@receiver(post_delete, sender=StudentLanguage)
+@receiver(post_delete, sender=StudentSchedule)
+@receiver(post_delete, sender=StudentSkill)
+def student_requirement_changed(sender, instance, **kwargs):
+    """
+    Пересчитывает подходящие вакансии после изменения
+    навыков, языков, графиков работы или типов занятости студента.
+    """
+    schedule_student_matches_refresh(student_id=instance.student_id)
+    return
+
+
+@receiver(pre_save, sender=StudentEmployment)
+@receiver(pre_save, sender=StudentLanguage)
+@receiver(pre_save, sender=StudentSchedule)
+@receiver(pre_save, sender=StudentSkill)
+def student_relation_saving(sender, instance, **kwargs):
+    """
+    Запоминает прежнее состояние изменяемой строки: через админку
+    строку можно перенести к другому студенту или навыку.
+    Если строка переносится к другому студенту, пересчитывает
+    подходящие вакансии и прежнего студента.
+    """
+    instance._previous = None
+    if not instance._state.adding:
+        instance._previous = sender.objects.filter(pk=instance.pk).first()
+    if (instance._previous is not None
+            and instance._previous.student_id != instance.student_id):
+        schedule_student_matches_refresh(
+            student_id=instance._previous.student_id
+        )
+    return
@@ -0,0 +1,171 @@
+"""
+Индекс навыков студентов в памяти процесса.
+
+Для каждого навыка хранится битовая маска по ID студентов:
+бит N установлен, если студент с ID = N владеет навыком.
+Поиск студентов, владеющих всеми требуемыми навыками, сводится к
+побитовому AND масок навыков, который выполняется над целыми числами
+Python без обращения к базе данных.
+
+Индекс используется там, где пересчитывается таблица VacancyMatch
+(задачи Celery), а изменения StudentSkill происходят в процессах
+веб-сервера. Поэтому после коммита изменений сигналы не меняют индекс
+своего процесса, а записывают ID измененных студентов в журнал
+в кеше Django (Redis) под очередной версией индекса
+(см. hakaton.cache_versions). При обращении к индексу процесс
+догоняет текущую версию по журналу: перечитывает из БД навыки только
+измененных студентов. Индекс перестраивается из БД целиком при первом
+обращении, после invalidate, при потере записей журнала или отставании
+больше SKILL_INDEX_CHANGES_MAX_LEN версий.
+"""
+from collections import defaultdict
+from threading import Lock
+
+from django.core.cache import cache
+
+from hakaton.app_data import (
+    SKILL_INDEX_CHANGES_MAX_LEN, SKILL_INDEX_CHANGES_TIMEOUT,
+)
+from hakaton.cache_versions import bump_version, get_version
+from student.models import StudentSkill
+
+SKILL_INDEX_VERSION_KEY: str = 'student_skill_index_version'
+SKILL_INDEX_CHANGES_KEY: str = 'student_skill_index_changes_{version}'
+
+
+def _ids_to_mask(ids: list[int]) -> int:
+    """Собирает битовую маску из списка ID."""
+    mask: bytearray = bytearray(max(ids) // 8 + 1)
+    for obj_id in ids:
+        mask[obj_id >> 3] |= 1 << (obj_id & 7)
+    return int.from_bytes(mask, 'little')
+
+
+def _mask_to_ids(mask: int) -> list[int]:
+    """Возвращает отсортированный по убыванию список ID из битовой маски."""
+    ids: list[int] = []
+    data: bytes = mask.to_bytes((mask.bit_length() + 7) // 8, 'little')
+    for byte_num, byte in enumerate(data):
+        if not byte:
+            continue
+        for bit in range(8):
+            if byte >> bit & 1:
+                ids.append(byte_num * 8 + bit)
+    ids.reverse()
+    return ids
+
+
+class SkillIndex:
+    """Индекс навыков студентов в виде битовых масок."""
+
+    def __init__(self) -> None:
+        self._lock: Lock = Lock()
+        self._skills: dict[int, int] = {}
+        self._version: int = None
+
+    def build(self) -> None:
+        """Перестраивает индекс по данным из базы данных."""
+        version: int = get_version(key=SKILL_INDEX_VERSION_KEY)
+        students_by_skill: dict[int, list[int]] = defaultdict(list)
+        for student_id, skill_id in StudentSkill.objects.values_list(
+                'student_id', 'skill_id'
+                ).order_by().iterator(chunk_size=10000):  # noqa (E124)
+            students_by_skill[skill_id].append(student_id)
+        skills: dict[int, int] = {
+            skill_id: _ids_to_mask(ids=student_ids)
+            for skill_id, student_ids in students_by_skill.items()
+        }
+        with self._lock:
+            self._skills = skills
+            self._version = version
+        return
+
+    def invalidate(self) -> None:
+        """
+        Помечает индекс устаревшим во всех процессах: версия увеличивается
+        без записи в журнал, поэтому каждый процесс перестроит индекс
+        целиком при следующем обращении.
+        Необходимо вызывать после изменений StudentSkill в обход сигналов
+        (например, bulk_create).
+        """
+        bump_version(key=SKILL_INDEX_VERSION_KEY)
+        with self._lock:
+            self._version = None
+        return
+
+    def log_changes(self, student_ids: list[int]) -> None:
+        """
+        Записывает в журнал ID студентов, навыки которых могли измениться,
+        под новой версией индекса. Вызывается после коммита изменений
+        до постановки в очередь пересчета их подходящих вакансий.
+        """
+        version: int = bump_version(key=SKILL_INDEX_VERSION_KEY)
+        cache.set(
+            SKILL_INDEX_CHANGES_KEY.format(version=version),
+            list(student_ids),
+            timeout=SKILL_INDEX_CHANGES_TIMEOUT,
+        )
+        return
+
+    def match(self, skill_ids: list[int]) -> list[int]:
+        """
+        Возвращает ID студентов, владеющих всеми указанными навыками,
+        отсортированные по убыванию.
+        """
+        version: int = get_version(key=SKILL_INDEX_VERSION_KEY)
+        if self._version != version and not self._apply_changes(
+                version=version):
+            self.build()
+        skills: dict[int, int] = self._skills
+        mask: int = -1
+        for skill_id in set(int(skill_id) for skill_id in skill_ids):
+            mask &= skills.get(skill_id, 0)
+            if not mask:
+                return []
+        if mask == -1:
+            return []
+        return _mask_to_ids(mask=mask)
+
+    def _apply_changes(self, version: int) -> bool:
+        """
+        Догоняет версию version по журналу изменений: перечитывает
+        из БД навыки студентов, измененных после версии индекса.
+        Возвращает False, если индекс нужно перестроить целиком.
+        """
+        with self._lock:
+            if (self._version is None
+                    or not 0 < version - self._version
+                    <= SKILL_INDEX_CHANGES_MAX_LEN):
+                return False
+            keys: list[str] = list(
+                SKILL_INDEX_CHANGES_KEY.format(version=change_version)
+                for change_version in range(self._version + 1, version + 1)
+            )
+            changes: dict[str, list[int]] = cache.get_many(keys)
+            if len(changes) != len(keys):
+                return False
+            student_ids: set[int] = set()
+            for changed_ids in changes.values():
+                student_ids.update(changed_ids)
+            students_by_skill: dict[int, list[int]] = defaultdict(list)
+            for student_id, skill_id in StudentSkill.objects.filter(
+                    student_id__in=student_ids,
+                    ).values_list(
+                        'student_id', 'skill_id',
+                    ).order_by():  # noqa (E124)
+                students_by_skill[skill_id].append(student_id)
+            cleared: int = ~_ids_to_mask(ids=list(student_ids))
+            skills: dict[int, int] = {
+                skill_id: mask & cleared
+                for skill_id, mask in self._skills.items()
+            }
+            for skill_id, changed_ids in students_by_skill.items():
+                skills[skill_id] = (
+                    skills.get(skill_id, 0) | _ids_to_mask(ids=changed_ids)
+                )
+            self._skills = skills
+            self._version = version
+        return True
+
+
+skill_index: SkillIndex = SkillIndex()
@@ -1,7 +1,52 @@
 from django.contrib import admin
 
 from hakaton.app_data import ADMIN_LIST_PER_PAGE
-from user.models import HrFavorited, HrTask, HrWatched, User
+from user.models import ExportJob, HrFavorited, HrTask, HrWatched, User
+
+
+@admin.register(ExportJob)
+class ExportJobAdmin(admin.ModelAdmin):
+    """
+    Переопределяет административный интерфейс Django для модели ExportJob.
+
+    Атрибуты:
+        - list_display (tuple) - список полей для отображения в интерфейсе:
+            - ID (id)
+            - внешний ключ на User (hr)
+            - объекты выгрузки (kind)
+            - статус (status)
+            - дата создания (created_datetime)
+            - дата завершения (finished_datetime)
+        - list_filter (tuple) - список фильтров:
+            - объекты выгрузки (kind)
+            - статус (status)
+        - readonly_fields (tuple) - список полей только для чтения:
+            - все поля модели, выгрузки создаются через API
+        - list_per_page (int) - количество объектов на одной странице
+    """
+    list_display = (
+        'id',
+        'hr',
+        'kind',
+        'status',
+        'created_datetime',
+        'finished_datetime',
+    )
+    list_filter = (
+        'kind',
+        'status',
+    )
+    readonly_fields = (
+        'hr',
+        'kind',
+        'query',
+        'status',
+        'file',
+        'error',
+        'created_datetime',
+        'finished_datetime',
+    )
+    list_per_page = ADMIN_LIST_PER_PAGE
 
 
 @admin.register(HrFavorited)
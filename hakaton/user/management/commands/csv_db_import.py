@@ -14,14 +14,22 @@ import os
 from django.core.management.base import BaseCommand, CommandError
 from django.db.models import QuerySet
 
+from api.v1.payloads import (
+    DICTIONARIES_VERSION_KEY, SKILL_CATEGORIES_VERSION_KEY,
+)
+from hakaton.cache_versions import bump_version
 from student.models import (
     Student, StudentEmployment, StudentLanguage, StudentSchedule, StudentSkill,
 )
+from student.search import update_search_vector
+from student.skill_index import skill_index
+from vacancy.autocomplete import city_autocomplete, skill_autocomplete
 from vacancy.models import (
     City, Currency, Employment, Experience, Language, LanguageLevel,
     Schedule, Skill, SkillCategory, Vacancy, VacancyLanguage, VacancySkill,
     VacancyStudentStatus,
 )
+from vacancy.reference_cache import ReferenceCache, reference_caches
 from user.models import User
 
 CSV_BASE_PATH: str = 'user/management/commands/data/'
@@ -45,124 +53,126 @@ def import_csv(csv_name: str) -> csv.DictReader:
 def import_city() -> None:
     """Импортирует данные в модель City."""
     csv_data: csv.DictReader = import_csv(csv_name='city')
-    obj_exists: QuerySet = City.objects.all()
     obj_new: list[City] = []
     for row in csv_data:
-        if obj_exists.filter(name=row['name']).exists():
+        if reference_caches[City].get_by_name(name=row['name']):
             continue
         obj_new.append(City(**row))
     City.objects.bulk_create(obj_new)
+    # INFO: bulk_create не вызывает сигналы, кеш справочника и индекс
+    #       автодополнения нужно сбросить.
+    reference_caches[City].invalidate()
+    city_autocomplete.invalidate()
 
 
 def import_currency() -> None:
     """Импортирует данные в модель Currency."""
     csv_data: csv.DictReader = import_csv(csv_name='currency')
-    obj_exists: QuerySet = Currency.objects.all()
     obj_new: list[Currency] = []
     for row in csv_data:
-        if obj_exists.filter(name=row['name']).exists():
+        if reference_caches[Currency].get_by_name(name=row['name']):
             continue
         obj_new.append(Currency(**row))
     Currency.objects.bulk_create(obj_new)
+    reference_caches[Currency].invalidate()
     return
 
 
 def import_employment() -> None:
     """Импортирует данные в модель Employment."""
     csv_data: csv.DictReader = import_csv(csv_name='employment')
-    obj_exists: QuerySet = Employment.objects.all()
     obj_new: list[Employment] = []
     for row in csv_data:
-        if obj_exists.filter(name=row['name']).exists():
+        if reference_caches[Employment].get_by_name(name=row['name']):
             continue
         obj_new.append(Employment(**row))
     Employment.objects.bulk_create(obj_new)
+    reference_caches[Employment].invalidate()
     return
 
 
 def import_experience() -> None:
     """Импортирует данные в модель Experience."""
     csv_data: csv.DictReader = import_csv(csv_name='experience')
-    obj_exists: QuerySet = Experience.objects.all()
     obj_new: list[Experience] = []
     for row in csv_data:
-        if obj_exists.filter(name=row['name']).exists():
+        if reference_caches[Experience].get_by_name(name=row['name']):
             continue
         obj_new.append(Experience(**row))
     Experience.objects.bulk_create(obj_new)
+    reference_caches[Experience].invalidate()
     return
 
 
 def import_language() -> None:
     """Импортирует данные в модель Language."""
     csv_data: csv.DictReader = import_csv(csv_name='language')
-    obj_exists: QuerySet = Language.objects.all()
     obj_new: list[Language] = []
     for row in csv_data:
-        if obj_exists.filter(name=row['name']).exists():
+        if reference_caches[Language].get_by_name(name=row['name']):
             continue
         obj_new.append(Language(**row))
     Language.objects.bulk_create(obj_new)
+    reference_caches[Language].invalidate()
     return
 
 
 def import_language_level() -> None:
     """Импортирует данные в модель LanguageLevel."""
     csv_data: csv.DictReader = import_csv(csv_name='language_level')
-    obj_exists: QuerySet = LanguageLevel.objects.all()
     obj_new: list[LanguageLevel] = []
     for row in csv_data:
-        if obj_exists.filter(name=row['name']).exists():
+        if reference_caches[LanguageLevel].get_by_name(name=row['name']):
             continue
         obj_new.append(LanguageLevel(**row))
     LanguageLevel.objects.bulk_create(obj_new)
+    reference_caches[LanguageLevel].invalidate()
     return
 
 
 def import_schedule() -> None:
     """Импортирует данные в модель Currency."""
     csv_data: csv.DictReader = import_csv(csv_name='schedule')
-    obj_exists: QuerySet = Schedule.objects.all()
     obj_new: list[Schedule] = []
     for row in csv_data:
-        if obj_exists.filter(name=row['name']).exists():
+        if reference_caches[Schedule].get_by_name(name=row['name']):
             continue
         obj_new.append(Schedule(**row))
     Schedule.objects.bulk_create(obj_new)
+    reference_caches[Schedule].invalidate()
     return
 
 
 def import_skill_category() -> None:
     """Импортирует данные в модель Skill."""
     csv_data: csv.DictReader = import_csv(csv_name='skill_category')
-    obj_exists: QuerySet = SkillCategory.objects.all()
     obj_new: list[SkillCategory] = []
     for row in csv_data:
-        if obj_exists.filter(name=row['name']).exists():
+        if reference_caches[SkillCategory].get_by_name(name=row['name']):
             continue
         obj_new.append(SkillCategory(**row))
     SkillCategory.objects.bulk_create(obj_new)
+    reference_caches[SkillCategory].invalidate()
     return
 
 
 def import_skill() -> None:
     """Импортирует данные в модель SkillCategory."""
     csv_data: csv.DictReader = import_csv(csv_name='skill')
-    obj_exists: QuerySet = Skill.objects.all()
-    categories_exists: QuerySet = SkillCategory.objects.all()
+    categories: ReferenceCache = reference_caches[SkillCategory]
     obj_new: list[Skill] = []
     for row in csv_data:
-        if obj_exists.filter(name=row['name']).exists():
+        if reference_caches[Skill].get_by_name(name=row['name']):
             continue
-        if not categories_exists.filter(name=row['category']).exists():
-            continue
-        obj_new.append(
-            Skill(
-                name=row['name'],
-                category=categories_exists.get(name=row['category'])
-            )
+        category: SkillCategory = categories.get_by_name(
+            name=row['category']
         )
+        if category is None:
+            continue
+        obj_new.append(Skill(name=row['name'], category=category))
     Skill.objects.bulk_create(obj_new)
+    reference_caches[Skill].invalidate()
+    skill_autocomplete.invalidate()
     return
 
 
@@ -198,13 +208,13 @@ def create_student():
         7: 'Седьмой',
         8: 'Восьмой',
     }
-    cities: QuerySet = City.objects.all()
-    experiences: QuerySet = Experience.objects.all()
-    employments: QuerySet = Employment.objects.all()
-    languages: QuerySet = Language.objects.all()
-    language_levels: QuerySet = LanguageLevel.objects.all()
-    schedules: QuerySet = Schedule.objects.all()
-    skills: QuerySet = Skill.objects.all()
+    cities: ReferenceCache = reference_caches[City]
+    experiences: ReferenceCache = reference_caches[Experience]
+    employments: ReferenceCache = reference_caches[Employment]
+    languages: ReferenceCache = reference_caches[Language]
+    language_levels: ReferenceCache = reference_caches[LanguageLevel]
+    schedules: ReferenceCache = reference_caches[Schedule]
+    skills: ReferenceCache = reference_caches[Skill]
     for row in csv_data:
         num: int = int(row['num'])
         if obj_exists.filter(id=row['num']).exists():
@@ -219,10 +229,10 @@ def create_student():
             link_fb=f'https://facebbok.com/ivan-{num}/',
             link_be=f'https://behance.com/ivan-{num}/',
             link_in=f'https://linkedin.com/ivan-{num}/',
-            city=cities.get(id=row['city']),
+            city=cities.get(obj_id=row['city']),
             relocation=row['relocation'],
             specialization=f'Специализация №{num}',
-            experience=experiences.get(id=row['experience']),
+            experience=experiences.get(obj_id=row['experience']),
             about_me=f'Тут о студенте №{num}',
             about_exp=f'Тут об опыте студента №{num}',
             about_education=f'Тут об образовании студента №{num}',
@@ -231,7 +241,7 @@ def create_student():
         student_employment_new.append(
             StudentEmployment(
                 student=student,
-                employment=employments.get(id=row['employment']),
+                employment=employments.get(obj_id=row['employment']),
             )
         )
         row_languages: list[str] = list(row.get('language').split('/'))
@@ -240,8 +250,8 @@ def create_student():
             student_language_new.append(
                 StudentLanguage(
                     student=student,
-                    language=languages.get(id=lang_id),
-                    level=language_levels.get(id=level_id),
+                    language=languages.get(obj_id=lang_id),
+                    level=language_levels.get(obj_id=level_id),
                 )
             )
         row_schedules: list[str] = list(row.get('schedule').split('/'))
@@ -249,7 +259,7 @@ def create_student():
             student_schedule_new.append(
                 StudentSchedule(
                     student=student,
-                    schedule=schedules.get(id=schedule_id),
+                    schedule=schedules.get(obj_id=schedule_id),
                 )
             )
         row_skills: list[str] = list(row.get('skill').split('/'))
@@ -257,7 +267,7 @@ def create_student():
             student_skill_new.append(
                 StudentSkill(
                     student=student,
-                    skill=skills.get(id=skill_id),
+                    skill=skills.get(obj_id=skill_id),
                 )
             )
     Student.objects.bulk_create(obj_new)
@@ -265,6 +275,10 @@ def create_student():
     StudentLanguage.objects.bulk_create(student_language_new)
     StudentSchedule.objects.bulk_create(student_schedule_new)
     StudentSkill.objects.bulk_create(student_skill_new)
+    # INFO: bulk_create не вызывает сигналы, индекс навыков нужно сбросить,
+    #       а поисковые векторы студентов - пересчитать.
+    skill_index.invalidate()
+    update_search_vector()
     return
 
 
@@ -291,14 +305,14 @@ def create_vacancy():
         )
     else:
         hr: User = User.objects.get(email='hr.user@email.com')
-    cities: QuerySet = City.objects.all()
-    currencies: QuerySet = Currency.objects.all()
-    experiences: QuerySet = Experience.objects.all()
-    employments: QuerySet = Employment.objects.all()
-    languages: QuerySet = Language.objects.all()
-    language_levels: QuerySet = LanguageLevel.objects.all()
-    schedules: QuerySet = Schedule.objects.all()
-    skills: QuerySet = Skill.objects.all()
+    cities: ReferenceCache = reference_caches[City]
+    currencies: ReferenceCache = reference_caches[Currency]
+    experiences: ReferenceCache = reference_caches[Experience]
+    employments: ReferenceCache = reference_caches[Employment]
+    languages: ReferenceCache = reference_caches[Language]
+    language_levels: ReferenceCache = reference_caches[LanguageLevel]
+    schedules: ReferenceCache = reference_caches[Schedule]
+    skills: ReferenceCache = reference_caches[Skill]
     for row in csv_data:
         num: int = int(row['num'])
         name: str = f'Тут название вакансии №{num}'
@@ -307,7 +321,7 @@ def create_vacancy():
         vacancy: Vacancy = Vacancy(
             hr=hr,
             name=name,
-            city=cities.get(id=row['city']),
+            city=cities.get(obj_id=row['city']),
             address=f'Тут адрес вакансии №{num}',
             description=f'Тут описание вакансии №{num}',
             responsibilities=f'Тут обязанности вакансии №{num}',
@@ -315,12 +329,13 @@ def create_vacancy():
             conditions=f'Тут условия вакансии №{num}',
             salary_from=1000,
             salary_to=2000,
-            currency=currencies.get(id=row['currency']),
+            currency=currencies.get(obj_id=row['currency']),
             testcase=f'Тут тестовое задание вакансии №{num}',
-            experience=experiences.get(id=row['experience']),
-            employment=employments.get(id=row['employment']),
-            schedule=schedules.get(id=row['schedule']),
+            experience=experiences.get(obj_id=row['experience']),
+            employment=employments.get(obj_id=row['employment']),
+            schedule=schedules.get(obj_id=row['schedule']),
         )
+        vacancy.content_hash = vacancy.get_content_hash()
         obj_new.append(vacancy)
         row_languages: list[str] = list(row['languages'].split('/'))
         for row_language in row_languages:
@@ -328,8 +343,8 @@ def create_vacancy():
             vacancy_language_new.append(
                 VacancyLanguage(
                     vacancy=vacancy,
-                    language=languages.get(id=lang_id),
-                    level=language_levels.get(id=level_id),
+                    language=languages.get(obj_id=lang_id),
+                    level=language_levels.get(obj_id=level_id),
                 )
             )
         row_skills: list[str] = list(row.get('skills').split('/'))
@@ -337,7 +352,7 @@ def create_vacancy():
             vacancy_skill_new.append(
                 VacancySkill(
                     vacancy=vacancy,
-                    skill=skills.get(id=skill_id)
+                    skill=skills.get(obj_id=skill_id)
                 )
             )
     Vacancy.objects.bulk_create(obj_new)
@@ -361,8 +376,16 @@ class Command(BaseCommand):
             import_skill_category()
             import_skill()
             import_vacancy_student_status()
+            # INFO: bulk_create не вызывает сигналы, сохраненные ответы
+            #       /dictionaries/ и /skills/by-categories/ нужно сбросить.
+            bump_version(key=DICTIONARIES_VERSION_KEY)
+            bump_version(key=SKILL_CATEGORIES_VERSION_KEY)
             create_student()
             create_vacancy()
+            # INFO: популярность для автодополнения обновляется задачей
+            #       Celery beat, после импорта ее нужно пересчитать сразу.
+            city_autocomplete.update_popularity()
+            skill_autocomplete.update_popularity()
         except Exception as err:
             raise CommandError(f'Exception has occurred: {err}')
         return
@@ -0,0 +1,27 @@
+"""
+Команда для перестроения индекса навыков студентов.
+
+Вызов команды осуществляется из папки с manage.py файлом:
+python manage.py rebuild_skill_index
+
+Индекс хранится в памяти каждого процесса приложения (в том числе
+воркеров Celery, которые пересчитывают таблицу VacancyMatch). Команда
+не может перестроить индекс в чужих процессах: она помечает индекс
+устаревшим, и каждый процесс перестроит его из БД целиком
+при следующем обращении.
+"""
+from django.core.management.base import BaseCommand
+
+from student.skill_index import skill_index
+
+
+class Command(BaseCommand):
+    help = 'Invalidating in-memory student skill index in all processes.'
+
+    def handle(self, *args: any, **options: any):
+        skill_index.invalidate()
+        self.stdout.write(
+            'Индекс навыков студентов будет перестроен всеми процессами '
+            'при следующем обращении.'
+        )
+        return
@@ -0,0 +1,34 @@
+"""
+Команда для полного пересчета таблицы подходящих студентов вакансий.
+
+Вызов команды осуществляется из папки с manage.py файлом:
+python manage.py rebuild_vacancy_matches
+
+В обычном режиме таблица VacancyMatch поддерживается сигналами.
+Команда нужна после массового импорта данных в обход сигналов
+(например, csv_db_import) и для восстановления таблицы.
+"""
+from django.core.management.base import BaseCommand
+
+from student.matching import refresh_vacancy_matches
+from student.skill_index import skill_index
+from vacancy.models import Vacancy, VacancyMatch
+
+
+class Command(BaseCommand):
+    help = 'Rebuilding vacancy-student match table.'
+
+    def handle(self, *args: any, **options: any):
+        skill_index.invalidate()
+        VacancyMatch.objects.filter(vacancy__is_archived=True).delete()
+        vacancy_ids: list[int] = list(
+            Vacancy.objects.filter(
+                is_archived=False
+            ).values_list('id', flat=True)
+        )
+        for vacancy_id in vacancy_ids:
+            refresh_vacancy_matches(vacancy_id=vacancy_id)
+        self.stdout.write(
+            f'Пересчитаны подходящие студенты {len(vacancy_ids)} вакансий.'
+        )
+        return
@@ -0,0 +1,117 @@
+# Generated by Django 4.2.6 on 2026-10-18 20:18
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import hakaton.app_data
+import phonenumber_field.modelfields
+import user.models
+import user.validators
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('student', '0001_initial'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='User',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_login', models.DateTimeField(blank=True, null=True, verbose_name='last login')),
+                ('email', models.EmailField(max_length=254, unique=True, validators=[user.validators.validate_email], verbose_name='Адрес электронной почты')),
+                ('first_name', models.CharField(max_length=30, validators=[user.validators.validate_name], verbose_name='Имя')),
+                ('last_name', models.CharField(max_length=30, validators=[user.validators.validate_name], verbose_name='Фамилия')),
+                ('password', models.CharField(max_length=512, validators=[user.validators.validate_password], verbose_name='Пароль')),
+                ('phone', phonenumber_field.modelfields.PhoneNumberField(max_length=128, region='RU', unique=True, verbose_name='Номер телефона')),
+                ('avatar', models.ImageField(blank=True, null=True, upload_to=hakaton.app_data.user_avatar_path, verbose_name='Аватар')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Статус активного')),
+                ('is_staff', models.BooleanField(default=False, verbose_name='Статус администратора')),
+                ('is_superuser', models.BooleanField(default=False, verbose_name='Статус суперпользователя')),
+                ('date_joined', models.DateTimeField(auto_now_add=True, verbose_name='Дата регистрации')),
+                ('groups', models.ManyToManyField(blank=True, help_text='The groups this user belongs to. A user will get all permissions granted to each of their groups.', related_name='user_set', related_query_name='user', to='auth.group', verbose_name='groups')),
+                ('user_permissions', models.ManyToManyField(blank=True, help_text='Specific permissions for this user.', related_name='user_set', related_query_name='user', to='auth.permission', verbose_name='user permissions')),
+            ],
+            options={
+                'verbose_name': 'HR специалист',
+                'verbose_name_plural': 'HR специалисты',
+                'ordering': ('-id',),
+            },
+            managers=[
+                ('objects', user.models.UserManager()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='HrWatched',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('candidate', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='hr_watched', to='student.student', verbose_name='Кандидат')),
+                ('hr', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='hr_watched', to=settings.AUTH_USER_MODEL, verbose_name='HR-специалист')),
+            ],
+            options={
+                'verbose_name': 'Просмотренное для HR специалиста',
+                'verbose_name_plural': 'Просмотренное для HR специалистов',
+                'ordering': ('-id',),
+            },
+        ),
+        migrations.CreateModel(
+            name='HrTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('description', models.CharField(max_length=50, verbose_name='Описание задачи')),
+                ('date', models.DateField(verbose_name='Дата задачи')),
+                ('time', models.TimeField(verbose_name='Время задачи')),
+                ('hr', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='hr_task', to=settings.AUTH_USER_MODEL, verbose_name='HR-специалист')),
+            ],
+            options={
+                'verbose_name': 'Задача HR-специалиста',
+                'verbose_name_plural': 'Задачи HR-специалистов',
+                'ordering': ('date', 'time'),
+            },
+        ),
+        migrations.CreateModel(
+            name='HrFavorited',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('candidate', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='hr_favorited', to='student.student', verbose_name='Кандидат')),
+                ('hr', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='hr_favorited', to=settings.AUTH_USER_MODEL, verbose_name='HR-специалист')),
+            ],
+            options={
+                'verbose_name': 'Избранное для HR специалиста',
+                'verbose_name_plural': 'Избранное для HR специалистов',
+                'ordering': ('-id',),
+            },
+        ),
+        migrations.CreateModel(
+            name='ExportJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('students', 'Кандидаты'), ('tasks', 'Задачи календаря'), ('vacancies', 'Вакансии')], max_length=10, verbose_name='Объекты выгрузки')),
+                ('query', models.JSONField(blank=True, default=dict, verbose_name='Query параметры выгрузки')),
+                ('status', models.CharField(choices=[('pending', 'В очереди'), ('running', 'Выполняется'), ('done', 'Готово'), ('failed', 'Ошибка')], default='pending', max_length=10, verbose_name='Статус')),
+                ('file', models.FileField(blank=True, null=True, storage=user.models.get_private_storage, upload_to='export/', verbose_name='Файл выгрузки')),
+                ('error', models.CharField(blank=True, max_length=512, null=True, verbose_name='Ошибка')),
+                ('created_datetime', models.DateTimeField(auto_now_add=True, verbose_name='Дата создания')),
+                ('finished_datetime', models.DateTimeField(blank=True, null=True, verbose_name='Дата завершения')),
+                ('hr', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='export_job', to=settings.AUTH_USER_MODEL, verbose_name='HR-специалист')),
+            ],
+            options={
+                'verbose_name': 'Выгрузка HR специалиста',
+                'verbose_name_plural': 'Выгрузки HR специалистов',
+                'ordering': ('-id',),
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='hrwatched',
+            constraint=models.UniqueConstraint(fields=('hr', 'candidate'), name='unique_candidate_hr_watched'),
+        ),
+        migrations.AddConstraint(
+            model_name='hrfavorited',
+            constraint=models.UniqueConstraint(fields=('hr', 'candidate'), name='unique_candidate_hr_favorite'),
+        ),
+    ]
@@ -1,17 +1,29 @@
 # TODO: возможно стоит вынести навыки, языки и т.п. в отдельный модуль.
 from django.contrib.auth.models import PermissionsMixin
 from django.contrib.auth.base_user import AbstractBaseUser, BaseUserManager
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
 from django.db import models
 # TODO: использовать from django.utils.translation import ugettext_lazy
 from phonenumber_field.modelfields import PhoneNumberField
 
 from hakaton.app_data import (
     user_avatar_path,
-    DJANGO_HASH_LEN, TASK_DESCRIPTION_MAX_LEN, USER_NAME_MAX_LEN,
+    DJANGO_HASH_LEN, EXPORT_JOB_ERROR_MAX_LEN, EXPORT_JOB_FIELD_MAX_LEN,
+    EXPORT_JOB_FOLDER, EXPORT_JOB_KINDS, EXPORT_JOB_STATUS_PENDING,
+    EXPORT_JOB_STATUSES, TASK_DESCRIPTION_MAX_LEN, USER_NAME_MAX_LEN,
 )
 from user.validators import validate_email, validate_name, validate_password
 
 
+def get_private_storage() -> FileSystemStorage:
+    """
+    Возвращает хранилище файлов, которые не раздаются публично
+    (PRIVATE_MEDIA_ROOT вне MEDIA_ROOT).
+    """
+    return FileSystemStorage(location=settings.PRIVATE_MEDIA_ROOT)
+
+
 class UserManager(BaseUserManager):
     """Менеджер по созданию и управлению пользователями."""
 
@@ -197,3 +209,63 @@ class HrWatched(models.Model):
 
     def __str__(self):
         return f'{self.hr}: {self.candidate}'
+
+
+class ExportJob(models.Model):
+    """
+    Модель фоновых выгрузок HR-специалиста.
+    Файл выгрузки формируется задачей Celery user.tasks.run_export_job.
+    """
+
+    hr = models.ForeignKey(
+        verbose_name='HR-специалист',
+        to='user.User',
+        related_name='export_job',
+        on_delete=models.CASCADE,
+    )
+    kind = models.CharField(
+        verbose_name='Объекты выгрузки',
+        max_length=EXPORT_JOB_FIELD_MAX_LEN,
+        choices=EXPORT_JOB_KINDS,
+    )
+    query = models.JSONField(
+        verbose_name='Query параметры выгрузки',
+        default=dict,
+        blank=True,
+    )
+    status = models.CharField(
+        verbose_name='Статус',
+        max_length=EXPORT_JOB_FIELD_MAX_LEN,
+        choices=EXPORT_JOB_STATUSES,
+        default=EXPORT_JOB_STATUS_PENDING,
+    )
+    file = models.FileField(
+        verbose_name='Файл выгрузки',
+        upload_to=EXPORT_JOB_FOLDER,
+        storage=get_private_storage,
+        blank=True,
+        null=True,
+    )
+    error = models.CharField(
+        verbose_name='Ошибка',
+        max_length=EXPORT_JOB_ERROR_MAX_LEN,
+        blank=True,
+        null=True,
+    )
+    created_datetime = models.DateTimeField(
+        verbose_name='Дата создания',
+        auto_now_add=True,
+    )
+    finished_datetime = models.DateTimeField(
+        verbose_name='Дата завершения',
+        blank=True,
+        null=True,
+    )
+
+    class Meta:
+        ordering = ('-id',)
+        verbose_name = 'Выгрузка HR специалиста'
+        verbose_name_plural = 'Выгрузки HR специалистов'
+
+    def __str__(self):
+        return f'{self.hr}: {self.kind} ({self.status})'
@@ -0,0 +1,16 @@
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from user.models import ExportJob
+from user.tasks import run_export_job
+
+
+@receiver(post_save, sender=ExportJob)
+def export_job_created(sender, instance, created, **kwargs):
+    """Ставит в очередь Celery формирование выгрузки после коммита."""
+    if created:
+        transaction.on_commit(
+            lambda: run_export_job.delay(job_id=instance.id)
+        )
+    return
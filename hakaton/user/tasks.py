@@ -2,14 +2,34 @@
 Список задач для Celery.
 """
 
+import gzip
 from datetime import date
+from secrets import token_hex
+from tempfile import TemporaryFile
 
 from celery import shared_task
+from django.core.files import File
 from django.core.mail import send_mail
 from django.db.models import QuerySet
+from django.utils import timezone
 
+from api.v1.exports import (
+    build_export_view, get_export_fields, iter_serialized, stream_csv,
+)
+from api.v1.views import StudentViewSet, TaskViewSet, VacancyViewSet
+from hakaton.app_data import (
+    EXPORT_JOB_ERROR_MAX_LEN, EXPORT_JOB_KIND_STUDENTS, EXPORT_JOB_KIND_TASKS,
+    EXPORT_JOB_KIND_VACANCIES, EXPORT_JOB_STATUS_DONE,
+    EXPORT_JOB_STATUS_FAILED, EXPORT_JOB_STATUS_RUNNING,
+)
 from hakaton.settings import DEFAULT_FROM_EMAIL
-from user.models import User
+from user.models import ExportJob, User
+
+EXPORT_JOB_VIEWSETS: dict[str, type] = {
+    EXPORT_JOB_KIND_STUDENTS: StudentViewSet,
+    EXPORT_JOB_KIND_TASKS: TaskViewSet,
+    EXPORT_JOB_KIND_VACANCIES: VacancyViewSet,
+}
 
 
 @shared_task
@@ -34,3 +54,50 @@ def send_hr_task_notify() -> None:
             fail_silently=False,
         )
     return
+
+
+@shared_task
+def run_export_job(job_id: int) -> None:
+    """
+    Формирует файл фоновой выгрузки: CSV, сжатый gzip, с объектами,
+    которые вернул бы API по сохраненным query параметрам.
+    Строки читаются из БД и записываются в файл пачками.
+    """
+    job: ExportJob = ExportJob.objects.select_related('hr').get(id=job_id)
+    job.status = EXPORT_JOB_STATUS_RUNNING
+    job.save(update_fields=('status',))
+    try:
+        view = build_export_view(
+            viewset_class=EXPORT_JOB_VIEWSETS[job.kind],
+            user=job.hr,
+            query=job.query,
+        )
+        serializer_class = view.get_serializer_class()
+        fields: tuple[str] = get_export_fields(
+            serializer_class=serializer_class,
+            request=view.request,
+        )
+        rows = iter_serialized(
+            queryset=view.filter_queryset(view.get_queryset()),
+            serializer_class=serializer_class,
+            context={'fields': fields},
+        )
+        with TemporaryFile() as tmp_file:
+            with gzip.open(
+                    tmp_file, 'wt', encoding='utf-8', newline=''
+                    ) as archive:  # noqa (E125)
+                archive.writelines(stream_csv(rows=rows, fields=fields))
+            tmp_file.seek(0)
+            # INFO: имя файла случайное, чтобы его нельзя было подобрать.
+            job.file.save(
+                f'{job.kind}_{token_hex(16)}.csv.gz',
+                File(tmp_file),
+                save=False,
+            )
+        job.status = EXPORT_JOB_STATUS_DONE
+    except Exception as error:
+        job.status = EXPORT_JOB_STATUS_FAILED
+        job.error = str(error)[:EXPORT_JOB_ERROR_MAX_LEN]
+    job.finished_datetime = timezone.now()
+    job.save()
+    return
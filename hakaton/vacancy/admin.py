@@ -4,7 +4,8 @@ from hakaton.app_data import ADMIN_LIST_PER_PAGE
 from vacancy.models import (
     City, Currency, Employment, Experience, Language, LanguageLevel, Schedule,
     Skill, SkillCategory, Vacancy, VacancyEmployment, VacancyFavorited,
-    VacancyLanguage, VacancySkill, VacancyStudentStatus, VacancyWatched,
+    VacancyLanguage, VacancyMatch, VacancySkill, VacancyStudentStatus,
+    VacancyWatched,
 )
 
 
@@ -473,6 +474,38 @@ class VacancyLanguageAdmin(admin.ModelAdmin):
     list_per_page = ADMIN_LIST_PER_PAGE
 
 
+@admin.register(VacancyMatch)
+class VacancyMatchAdmin(admin.ModelAdmin):
+    """
+    Переопределяет административный интерфейс Django для модели VacancyMatch.
+    Объекты модели вычисляются автоматически и доступны только для чтения.
+
+    Атрибуты:
+        - list_display (tuple) - список полей для отображения в интерфейсе:
+            - ID (id)
+            - вакансия (vacancy)
+            - студент (student)
+        - list_filter (tuple) - список фильтров:
+            - вакансия (vacancy)
+        - list_per_page (int) - количество объектов на одной странице
+    """
+    list_display = (
+        'id',
+        'vacancy',
+        'student',
+    )
+    list_filter = (
+        'vacancy',
+    )
+    list_per_page = ADMIN_LIST_PER_PAGE
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
 @admin.register(VacancySkill)
 class VacancySkillAdmin(admin.ModelAdmin):
     """
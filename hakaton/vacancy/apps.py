@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class VacancyConfig(AppConfig):
     name = 'vacancy'
     verbose_name = 'Вакансии'
+
+    def ready(self):
+        import vacancy.signals  # noqa F401
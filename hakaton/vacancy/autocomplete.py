@@ -0,0 +1,239 @@
+"""
+Индексы автодополнения названий навыков и городов в памяти процесса.
+
+Названия хранятся в нижнем регистре в отсортированном списке: поиск
+по префиксу выполняется бинарным поиском (bisect), поиск по вхождению -
+перебором, только если совпадений по префиксу не хватило до лимита.
+Для поиска с одной опечаткой заранее строится словарь вариантов начал
+названий с одним удаленным символом (symmetric delete), поэтому запрос
+сводится к нескольким обращениям к словарю. Ответ формируется
+без обращения к базе данных.
+
+Результаты ранжируются по типу совпадения, затем по популярности
+(количеству студентов и вакансий, использующих значение).
+
+Индекс перестраивается при изменении справочника (сигналы моделей City
+и Skill, см. hakaton.cache_versions). Популярность требует группировки
+по таблицам студентов и вакансий, поэтому не вычисляется в запросе:
+ее раз в AUTOCOMPLETE_POPULARITY_INTERVAL секунд пересчитывает задача
+Celery beat (vacancy.tasks.update_autocomplete_popularity) и сохраняет
+в кеше Django (Redis), а процессы перечитывают ее из кеша при изменении
+версии. До первого пересчета подсказки сортируются без учета
+популярности.
+"""
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from threading import Lock
+from typing import Callable
+
+from django.core.cache import cache
+from django.db.models import Count, Model, QuerySet
+
+from hakaton.app_data import AUTOCOMPLETE_LIMIT
+from hakaton.cache_versions import bump_version, get_version
+from student.models import Student, StudentSkill
+from vacancy.models import City, Skill, Vacancy, VacancySkill
+
+CITY_AUTOCOMPLETE_VERSION_KEY: str = 'city_autocomplete_version'
+SKILL_AUTOCOMPLETE_VERSION_KEY: str = 'skill_autocomplete_version'
+CITY_POPULARITY_KEY: str = 'city_autocomplete_popularity'
+SKILL_POPULARITY_KEY: str = 'skill_autocomplete_popularity'
+
+# INFO: ранги типов совпадения, меньше - выше в выдаче.
+MATCH_PREFIX: int = 0
+MATCH_WORD_PREFIX: int = 1
+MATCH_INFIX: int = 2
+MATCH_TYPO: int = 3
+
+# INFO: минимальная длина запроса для поиска с опечаткой,
+#       иначе под запрос подходит почти любое название.
+TYPO_MIN_LEN: int = 3
+# INFO: запросы длиннее ищутся с опечаткой только по первым символам.
+TYPO_MAX_LEN: int = 24
+
+
+def _normalize(text: str) -> str:
+    """Приводит текст к виду для сравнения без учета регистра."""
+    return text.strip().casefold().replace('ё', 'е')
+
+
+def _get_deletes(text: str) -> set[str]:
+    """Возвращает варианты текста с одним удаленным символом."""
+    return set(text[:i] + text[i + 1:] for i in range(len(text)))
+
+
+def _get_typo_keys(name: str) -> set[str]:
+    """
+    Возвращает ключи поиска с опечаткой для названия: начала названия
+    длиной от TYPO_MIN_LEN - 1 до TYPO_MAX_LEN + 1 символов и их варианты
+    с одним удаленным символом. Запрос с одной опечаткой совпадает
+    с названием, если запрос или его вариант с удаленным символом
+    есть среди ключей названия.
+    """
+    keys: set[str] = set()
+    max_length: int = min(len(name), TYPO_MAX_LEN + 1)
+    for length in range(TYPO_MIN_LEN - 1, max_length + 1):
+        prefix: str = name[:length]
+        keys.add(prefix)
+        keys |= _get_deletes(text=prefix)
+    return keys
+
+
+class AutocompleteIndex:
+    """Индекс автодополнения для модели с полем name."""
+
+    def __init__(
+            self,
+            version_key: str,
+            popularity_key: str,
+            get_objects: Callable[[], list[Model]],
+            get_popularity: Callable[[], Counter],
+            ) -> None:
+        self._lock: Lock = Lock()
+        self._version_key: str = version_key
+        self._popularity_key: str = popularity_key
+        self._popularity_version_key: str = f'{popularity_key}_version'
+        self._get_objects = get_objects
+        self._get_popularity = get_popularity
+        self._names: list[tuple[str, int]] = []
+        self._objects: dict[int, Model] = {}
+        self._popularity: Counter = Counter()
+        self._typos: dict[str, set[int]] = {}
+        self._version: int = None
+        self._popularity_version: int = None
+
+    def build(self) -> None:
+        """Перестраивает индекс названий по данным из базы данных."""
+        version: int = get_version(key=self._version_key)
+        objects: dict[int, Model] = {
+            obj.id: obj for obj in self._get_objects()
+        }
+        names: list[tuple[str, int]] = sorted(
+            (_normalize(obj.name), obj.id) for obj in objects.values()
+        )
+        typos: dict[str, set[int]] = defaultdict(set)
+        for name, obj_id in names:
+            for key in _get_typo_keys(name=name):
+                typos[key].add(obj_id)
+        with self._lock:
+            self._names = names
+            self._typos = dict(typos)
+            self._objects = objects
+            self._version = version
+        return
+
+    def update_popularity(self) -> None:
+        """
+        Пересчитывает популярность по базе данных и сохраняет ее в кеше
+        для всех процессов. Вызывается задачей Celery beat.
+        """
+        cache.set(
+            self._popularity_key, dict(self._get_popularity()), timeout=None,
+        )
+        bump_version(key=self._popularity_version_key)
+        return
+
+    def _load_popularity(self) -> None:
+        """Читает из кеша популярность, пересчитанную задачей Celery."""
+        version: int = get_version(key=self._popularity_version_key)
+        popularity: Counter = Counter(cache.get(self._popularity_key, {}))
+        with self._lock:
+            self._popularity = popularity
+            self._popularity_version = version
+        return
+
+    def invalidate(self) -> None:
+        """Помечает индекс устаревшим во всех процессах."""
+        bump_version(key=self._version_key)
+        with self._lock:
+            self._version = None
+        return
+
+    def search(
+            self, text: str, limit: int = AUTOCOMPLETE_LIMIT) -> list[Model]:
+        """
+        Возвращает до limit объектов, название которых начинается
+        с text, содержит text или отличается от него одной опечаткой.
+        Регистр не учитывается.
+        """
+        if self._version != get_version(key=self._version_key):
+            self.build()
+        if self._popularity_version != get_version(
+                key=self._popularity_version_key):
+            self._load_popularity()
+        query: str = _normalize(text)
+        if not query:
+            return []
+        names: list[tuple[str, int]] = self._names
+        matches: dict[int, int] = {}
+        start: int = bisect_left(names, (query,))
+        for name, obj_id in names[start:]:
+            if not name.startswith(query):
+                break
+            matches[obj_id] = MATCH_PREFIX
+        if len(matches) < limit:
+            word_query: str = f' {query}'
+            for name, obj_id in names:
+                if obj_id in matches:
+                    continue
+                if word_query in name:
+                    matches[obj_id] = MATCH_WORD_PREFIX
+                elif query in name:
+                    matches[obj_id] = MATCH_INFIX
+        if len(matches) < limit and len(query) >= TYPO_MIN_LEN:
+            typo_query: str = query[:TYPO_MAX_LEN]
+            typos: dict[str, set[int]] = self._typos
+            for key in _get_deletes(text=typo_query) | {typo_query}:
+                for obj_id in typos.get(key, ()):
+                    matches.setdefault(obj_id, MATCH_TYPO)
+        popularity: Counter = self._popularity
+        objects: dict[int, Model] = self._objects
+        return [
+            objects[obj_id] for obj_id in sorted(
+                matches,
+                key=lambda obj_id: (
+                    matches[obj_id], -popularity[obj_id], objects[obj_id].name
+                ),
+            )[:limit]
+        ]
+
+
+def _count_by(queryset: QuerySet, field: str) -> Counter:
+    """Возвращает количество объектов queryset по значениям поля."""
+    return Counter(
+        dict(
+            queryset.order_by().values_list(field).annotate(
+                count=Count('id'),
+            )
+        )
+    )
+
+
+def _get_city_popularity() -> Counter:
+    """Популярность города: количество студентов и вакансий в нем."""
+    return (
+        _count_by(queryset=Student.objects.all(), field='city_id')
+        + _count_by(queryset=Vacancy.objects.all(), field='city_id')
+    )
+
+
+def _get_skill_popularity() -> Counter:
+    """Популярность навыка: количество студентов и вакансий с ним."""
+    return (
+        _count_by(queryset=StudentSkill.objects.all(), field='skill_id')
+        + _count_by(queryset=VacancySkill.objects.all(), field='skill_id')
+    )
+
+
+city_autocomplete: AutocompleteIndex = AutocompleteIndex(
+    version_key=CITY_AUTOCOMPLETE_VERSION_KEY,
+    popularity_key=CITY_POPULARITY_KEY,
+    get_objects=lambda: list(City.objects.all()),
+    get_popularity=_get_city_popularity,
+)
+skill_autocomplete: AutocompleteIndex = AutocompleteIndex(
+    version_key=SKILL_AUTOCOMPLETE_VERSION_KEY,
+    popularity_key=SKILL_POPULARITY_KEY,
+    get_objects=lambda: list(Skill.objects.all()),
+    get_popularity=_get_skill_popularity,
+)
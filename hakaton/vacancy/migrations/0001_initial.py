@@ -0,0 +1,300 @@
+# Generated by Django 4.2.6 on 2026-10-18 20:18
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('student', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='City',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=30, unique=True, verbose_name='Город')),
+            ],
+            options={
+                'verbose_name': 'Город',
+                'verbose_name_plural': 'Города',
+                'ordering': ('name',),
+            },
+        ),
+        migrations.CreateModel(
+            name='Currency',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=30, unique=True, verbose_name='Название валюты')),
+                ('symbol', models.CharField(max_length=1, unique=True, verbose_name='Символ')),
+            ],
+            options={
+                'verbose_name': 'Валюта',
+                'verbose_name_plural': 'Валюты',
+                'ordering': ('name',),
+            },
+        ),
+        migrations.CreateModel(
+            name='Employment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=30, unique=True, verbose_name='Тип занятости')),
+            ],
+            options={
+                'verbose_name': 'Тип занятости',
+                'verbose_name_plural': 'Типы занятости',
+                'ordering': ('name',),
+            },
+        ),
+        migrations.CreateModel(
+            name='Experience',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=30, unique=True, verbose_name='Срок опыта работы')),
+            ],
+            options={
+                'verbose_name': 'Срок опыта работы',
+                'verbose_name_plural': 'Сроки опыта работы',
+                'ordering': ('id',),
+            },
+        ),
+        migrations.CreateModel(
+            name='Language',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=30, unique=True, verbose_name='Название языка')),
+            ],
+            options={
+                'verbose_name': 'Название языка',
+                'verbose_name_plural': 'Названия языков',
+                'ordering': ('name',),
+            },
+        ),
+        migrations.CreateModel(
+            name='LanguageLevel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=30, unique=True, verbose_name='Название')),
+                ('level', models.IntegerField(unique=True, verbose_name='Уровень владения')),
+            ],
+            options={
+                'verbose_name': 'Уровень владения языком',
+                'verbose_name_plural': 'Уровни владения языками',
+                'ordering': ('level',),
+            },
+        ),
+        migrations.CreateModel(
+            name='Schedule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=30, unique=True, verbose_name='График работы')),
+            ],
+            options={
+                'verbose_name': 'График работы',
+                'verbose_name_plural': 'Графики работы',
+                'ordering': ('name',),
+            },
+        ),
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True, verbose_name='Навык')),
+            ],
+            options={
+                'verbose_name': 'Навык',
+                'verbose_name_plural': 'Навыки',
+                'ordering': ('name',),
+            },
+        ),
+        migrations.CreateModel(
+            name='SkillCategory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, verbose_name='Категория')),
+            ],
+            options={
+                'verbose_name': 'Категория навыков',
+                'verbose_name_plural': 'Категории навыков',
+                'ordering': ('name',),
+            },
+        ),
+        migrations.CreateModel(
+            name='Vacancy',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=30, verbose_name='Название')),
+                ('address', models.CharField(blank=True, max_length=60, null=True, verbose_name='Адрес офиса')),
+                ('description', models.TextField(blank=True, default=None, max_length=512, null=True, verbose_name='Описание')),
+                ('responsibilities', models.TextField(max_length=512, verbose_name='Обязанности')),
+                ('requirements', models.TextField(max_length=512, verbose_name='Требования')),
+                ('conditions', models.TextField(max_length=512, verbose_name='Условия')),
+                ('salary_from', models.PositiveIntegerField(verbose_name='Заработная вилка, от')),
+                ('salary_to', models.PositiveIntegerField(verbose_name='Заработная вилка, до')),
+                ('testcase', models.TextField(blank=True, default=None, max_length=512, null=True, verbose_name='Тестовый задание для кандидатов')),
+                ('pub_datetime', models.DateTimeField(auto_now_add=True, verbose_name='Дата и время создания')),
+                ('is_archived', models.BooleanField(default=False, verbose_name='Статус архивной')),
+                ('is_template', models.BooleanField(default=False, verbose_name='Статус шаблона')),
+                ('template_invite', models.TextField(default='Вы нам подходите! Ура!', max_length=512, verbose_name='Шаблон письма-приглашения')),
+                ('content_hash', models.CharField(editable=False, max_length=40, verbose_name='Хеш названия и описания')),
+                ('city', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='vacancy', to='vacancy.city', verbose_name='Город')),
+                ('currency', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='vacancy', to='vacancy.currency', verbose_name='Валюта')),
+                ('employment', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='vacancy', to='vacancy.employment', verbose_name='Тип занятости')),
+                ('experience', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='vacancy', to='vacancy.experience', verbose_name='Опыт работы')),
+                ('hr', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='vacancy', to=settings.AUTH_USER_MODEL, verbose_name='Ответственный HR')),
+                ('schedule', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='vacancy', to='vacancy.schedule', verbose_name='График работы')),
+            ],
+            options={
+                'verbose_name': 'Вакансия',
+                'verbose_name_plural': 'Вакансии',
+                'ordering': ('-id',),
+            },
+        ),
+        migrations.CreateModel(
+            name='VacancyStudentStatus',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=30, unique=True, verbose_name='Статус студента')),
+            ],
+            options={
+                'verbose_name': 'Статус студента на вакансии',
+                'verbose_name_plural': 'Статусы студентов на вакансиях',
+                'ordering': ('-id',),
+            },
+        ),
+        migrations.CreateModel(
+            name='VacancyWatched',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='vacancy_watched', to='student.student', verbose_name='Просмотренный студент')),
+                ('vacancy', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='vacancy_watched', to='vacancy.vacancy', verbose_name='Вакансия')),
+            ],
+            options={
+                'verbose_name': 'Просмотренный студент вакансии',
+                'verbose_name_plural': 'Просмотренные студенты вакансий',
+                'ordering': ('-id',),
+            },
+        ),
+        migrations.CreateModel(
+            name='VacancySkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='vacancy_skill', to='vacancy.skill', verbose_name='Навык')),
+                ('vacancy', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='vacancy_skill', to='vacancy.vacancy', verbose_name='Вакансия')),
+            ],
+            options={
+                'verbose_name': 'Навык вакансии',
+                'verbose_name_plural': 'Навыки вакансий',
+                'ordering': ('-id',),
+            },
+        ),
+        migrations.CreateModel(
+            name='VacancyMatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='vacancy_match', to='student.student', verbose_name='Подходящий студент')),
+                ('vacancy', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='vacancy_match', to='vacancy.vacancy', verbose_name='Вакансия')),
+            ],
+            options={
+                'verbose_name': 'Подходящий студент вакансии',
+                'verbose_name_plural': 'Подходящие студенты вакансий',
+                'ordering': ('-id',),
+            },
+        ),
+        migrations.CreateModel(
+            name='VacancyLanguage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='vacancy_language', to='vacancy.language', verbose_name='Разговорный язык')),
+                ('level', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='vacancy_language', to='vacancy.languagelevel', verbose_name='Уровень владения')),
+                ('vacancy', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='vacancy_language', to='vacancy.vacancy', verbose_name='Вакансия')),
+            ],
+            options={
+                'verbose_name': 'Требуемый уровень владения языка',
+                'verbose_name_plural': 'Требования к владению языкам',
+                'ordering': ('vacancy', 'language'),
+            },
+        ),
+        migrations.CreateModel(
+            name='VacancyFavorited',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.ForeignKey(blank=True, default=None, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='vacancy_favorited', to='vacancy.vacancystudentstatus', verbose_name='Статус кандидата')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='vacancy_favorited', to='student.student', verbose_name='Избранный студент')),
+                ('vacancy', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='vacancy_favorited', to='vacancy.vacancy', verbose_name='Вакансия')),
+            ],
+            options={
+                'verbose_name': 'Избранный студент вакансии',
+                'verbose_name_plural': 'Избранные студенты вакансий',
+                'ordering': ('-id',),
+            },
+        ),
+        migrations.CreateModel(
+            name='VacancyEmployment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('employment', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='vacancy_employment', to='vacancy.employment', verbose_name='Формат работы')),
+                ('vacancy', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='vacancy_employment', to='vacancy.vacancy', verbose_name='Вакансия')),
+            ],
+            options={
+                'verbose_name': 'Формат работы вакансии',
+                'verbose_name_plural': 'Форматы работы вакансий',
+                'ordering': ('-id',),
+            },
+        ),
+        migrations.AddField(
+            model_name='skill',
+            name='category',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='skill', to='vacancy.skillcategory', verbose_name='Категория'),
+        ),
+        migrations.AddConstraint(
+            model_name='currency',
+            constraint=models.UniqueConstraint(fields=('name', 'symbol'), name='unique_name_symbols'),
+        ),
+        migrations.AddConstraint(
+            model_name='vacancywatched',
+            constraint=models.UniqueConstraint(fields=('vacancy', 'student'), name='unique_vacancy_watched_student'),
+        ),
+        migrations.AddConstraint(
+            model_name='vacancyskill',
+            constraint=models.UniqueConstraint(fields=('vacancy', 'skill'), name='unique_vacancy_skill'),
+        ),
+        migrations.AddConstraint(
+            model_name='vacancymatch',
+            constraint=models.UniqueConstraint(fields=('vacancy', 'student'), name='unique_vacancy_match_student'),
+        ),
+        migrations.AddConstraint(
+            model_name='vacancylanguage',
+            constraint=models.UniqueConstraint(fields=('vacancy', 'language', 'level'), name='unique_vacancy_language_level'),
+        ),
+        migrations.AddConstraint(
+            model_name='vacancyfavorited',
+            constraint=models.UniqueConstraint(fields=('vacancy', 'student'), name='unique_vacancy_favorited_student'),
+        ),
+        migrations.AddConstraint(
+            model_name='vacancyemployment',
+            constraint=models.UniqueConstraint(fields=('vacancy', 'employment'), name='unique_vacancy_employment'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(fields=['hr', 'is_archived', '-id'], name='vacancy_hr_archived_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(fields=['hr', 'is_archived', '-pub_datetime'], name='vacancy_hr_archived_pub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(condition=models.Q(('is_template', True)), fields=['hr', '-id'], name='vacancy_hr_template_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='vacancy',
+            constraint=models.UniqueConstraint(fields=('content_hash',), name='unique_vacancy'),
+        ),
+    ]
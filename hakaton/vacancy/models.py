@@ -1,12 +1,17 @@
+from hashlib import sha1
+
+from django.core.exceptions import ValidationError
 from django.db import models
 
 from hakaton.app_data import (
     CITIES_MAX_LEN, CURRENCY_MAX_LEN, CURRENCY_SYMBOL_MAX_LEN,
     EMPLOYMENT_MAX_LEN, EXP_MAX_LEN, LANGUAGE_MAX_LEN, LANGUAGE_LEVEL_MAX_LEN,
-    SCHEDULE_MAX_LEN, SKILL_MAX_LEN, VACANCY_NAME_MAX_LEN,
+    SCHEDULE_MAX_LEN, SKILL_MAX_LEN, VACANCY_CONTENT_HASH_LEN,
+    VACANCY_NAME_MAX_LEN,
     VACANCY_ADDRESS_MAX_LEN, VACANCY_STUDENT_STATUS_MAX_LEN,
-    VACANCY_TEMPLATE_INVITE, VACANCY_TEXT_MAX_LEN,
+    VACANCY_TEMPLATE_INVITE, VACANCY_TEXT_MAX_LEN, VACANCY_UNIQUE_CONSTRAINT,
 )
+from vacancy.validators import VACANCY_EXISTS_ERROR
 
 
 class City(models.Model):
@@ -291,14 +296,40 @@ class Vacancy(models.Model):
         max_length=VACANCY_TEXT_MAX_LEN,
         default=VACANCY_TEMPLATE_INVITE,
     )
+    # INFO: уникальность вакансии проверяется по хешу нормализованных
+    #       названия и описания: индекс по нему компактнее индекса
+    #       по названию и описанию длиной до VACANCY_TEXT_MAX_LEN.
+    content_hash = models.CharField(
+        verbose_name='Хеш названия и описания',
+        max_length=VACANCY_CONTENT_HASH_LEN,
+        editable=False,
+    )
 
     class Meta:
         constraints = [
             models.UniqueConstraint(
-                fields=('name', 'description',),
-                name='unique_vacancy',
+                fields=('content_hash',),
+                name=VACANCY_UNIQUE_CONSTRAINT,
             )
         ]
+        # INFO: список вакансий HR фильтруется по is_archived и is_template
+        #       и выводится по курсору в порядке -id или -pub_datetime.
+        #       Шаблонов у HR немного, для них достаточно частичного индекса.
+        indexes = [
+            models.Index(
+                fields=('hr', 'is_archived', '-id'),
+                name='vacancy_hr_archived_idx',
+            ),
+            models.Index(
+                fields=('hr', 'is_archived', '-pub_datetime'),
+                name='vacancy_hr_archived_pub_idx',
+            ),
+            models.Index(
+                fields=('hr', '-id'),
+                condition=models.Q(is_template=True),
+                name='vacancy_hr_template_idx',
+            ),
+        ]
         ordering = ('-id',)
         verbose_name = 'Вакансия'
         verbose_name_plural = 'Вакансии'
@@ -306,6 +337,38 @@ class Vacancy(models.Model):
     def __str__(self):
         return self.name
 
+    def clean(self):
+        # INFO: поле content_hash не редактируется в формах, поэтому
+        #       validate_constraints не проверяет уникальный индекс по нему
+        #       и дубликат из админки приводил бы к IntegrityError.
+        super().clean()
+        if Vacancy.objects.filter(
+            content_hash=self.get_content_hash()
+        ).exclude(pk=self.pk).exists():
+            raise ValidationError(VACANCY_EXISTS_ERROR)
+        return
+
+    def save(self, *args, **kwargs):
+        self.content_hash = self.get_content_hash()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and (
+            {'name', 'description'} & set(update_fields)
+        ):
+            kwargs['update_fields'] = {*update_fields, 'content_hash'}
+        return super().save(*args, **kwargs)
+
+    def get_content_hash(self) -> str:
+        """
+        Возвращает хеш названия и описания вакансии без учета регистра
+        и лишних пробелов. При bulk_create метод save не вызывается,
+        хеш нужно присвоить полю content_hash явно.
+        """
+        content: str = '\n'.join(
+            ' '.join((text or '').split()).lower()
+            for text in (self.name, self.description)
+        )
+        return sha1(content.encode()).hexdigest()
+
 
 class VacancyEmployment(models.Model):
     """Модель перечня форматов работы для вакансии."""
@@ -378,6 +441,42 @@ class VacancyLanguage(models.Model):
         return f'{self.language} ({self.level})'
 
 
+class VacancyMatch(models.Model):
+    """
+    Модель перечня студентов, полностью подходящих под требования
+    неархивной вакансии.
+    Поддерживается в актуальном состоянии задачами Celery
+    (см. student.matching и vacancy.tasks).
+    """
+
+    vacancy = models.ForeignKey(
+        verbose_name='Вакансия',
+        to='vacancy.Vacancy',
+        related_name='vacancy_match',
+        on_delete=models.CASCADE,
+    )
+    student = models.ForeignKey(
+        verbose_name='Подходящий студент',
+        to='student.Student',
+        related_name='vacancy_match',
+        on_delete=models.CASCADE,
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=('vacancy', 'student',),
+                name='unique_vacancy_match_student',
+            )
+        ]
+        ordering = ('-id',)
+        verbose_name = 'Подходящий студент вакансии'
+        verbose_name_plural = 'Подходящие студенты вакансий'
+
+    def __str__(self) -> str:
+        return f'{self.vacancy}: {self.student}'
+
+
 class VacancyStudentStatus(models.Model):
     """Модель перечня статусов студентов на вакансии."""
 
@@ -0,0 +1,139 @@
+"""
+Кеш справочников (городов, навыков, языков и т.д.) в памяти процесса.
+
+Справочники небольшие и меняются редко, поэтому каждый процесс хранит
+их целиком в виде словарей ID -> объект и название -> объект
+и не обращается к базе данных при проверке и выводе значений.
+
+Актуальность кеша проверяется по общему для всех процессов счетчику
+версии (см. hakaton.cache_versions) не чаще, чем раз
+в REFERENCE_CACHE_CHECK_INTERVAL секунд. Сигналы моделей справочников
+сбрасывают кеш текущего процесса сразу, а счетчик версии увеличивают
+после коммита, и остальные процессы перечитывают справочник
+при следующей проверке. Если объекта нет в кеше, версия проверяется
+сразу: объект, созданный в другом процессе, доступен без задержки,
+а несуществующие ID не приводят к перечитыванию справочника.
+"""
+from threading import Lock
+from time import monotonic
+from typing import Union
+
+from django.db.models import Model
+
+from hakaton.app_data import REFERENCE_CACHE_CHECK_INTERVAL
+from hakaton.cache_versions import bump_version, get_version
+from vacancy.models import (
+    City, Currency, Employment, Experience, Language, LanguageLevel,
+    Schedule, Skill, SkillCategory,
+)
+
+REFERENCE_MODELS: tuple[type[Model]] = (
+    City, Currency, Employment, Experience, Language, LanguageLevel,
+    Schedule, Skill, SkillCategory,
+)
+
+
+class ReferenceCache:
+    """Кеш объектов справочной модели с полем name."""
+
+    def __init__(self, model: type[Model]) -> None:
+        self._lock: Lock = Lock()
+        self._model: type[Model] = model
+        self._version_key: str = (
+            f'reference_cache_{model._meta.model_name}_version'
+        )
+        self._by_id: dict[int, Model] = {}
+        self._by_name: dict[str, Model] = {}
+        self._version: int = None
+        self._checked_at: float = 0
+
+    def _load(self) -> None:
+        """Перечитывает объекты справочника из базы данных."""
+        version: int = get_version(key=self._version_key)
+        objects: list[Model] = list(self._model.objects.all())
+        with self._lock:
+            self._by_id = {obj.id: obj for obj in objects}
+            self._by_name = {obj.name: obj for obj in objects}
+            self._version = version
+            self._checked_at = monotonic()
+        return
+
+    def _refresh(self, force: bool = False) -> None:
+        """
+        Перечитывает справочник, если кеш сброшен или версия изменилась.
+        Версия проверяется не чаще REFERENCE_CACHE_CHECK_INTERVAL секунд,
+        если проверка не запрошена принудительно (force).
+        """
+        if self._version is None:
+            self._load()
+            return
+        if (not force
+                and monotonic() - self._checked_at
+                < REFERENCE_CACHE_CHECK_INTERVAL):
+            return
+        if self._version != get_version(key=self._version_key):
+            self._load()
+            return
+        self._checked_at = monotonic()
+        return
+
+    def all(self) -> list[Model]:
+        """Возвращает все объекты справочника."""
+        self._refresh()
+        return list(self._by_id.values())
+
+    def get(self, obj_id: Union[int, str]) -> Model:
+        """
+        Возвращает объект по ID.
+        Если ID некорректный или объекта нет, возвращает None.
+        """
+        try:
+            obj_id: int = int(obj_id)
+        except (TypeError, ValueError):
+            return None
+        self._refresh()
+        obj: Model = self._by_id.get(obj_id)
+        if obj is None:
+            # INFO: объект мог быть создан в другом процессе после
+            #       последней проверки версии: проверяем версию сразу.
+            self._refresh(force=True)
+            obj: Model = self._by_id.get(obj_id)
+        return obj
+
+    def get_by_name(self, name: str) -> Model:
+        """Возвращает объект по названию или None."""
+        self._refresh()
+        obj: Model = self._by_name.get(name)
+        if obj is None:
+            self._refresh(force=True)
+            obj: Model = self._by_name.get(name)
+        return obj
+
+    def get_many(self, ids: list[Union[int, str]]) -> dict[int, Model]:
+        """
+        Возвращает словарь ID -> объект для существующих объектов.
+        Несуществующие и некорректные ID пропускаются.
+        """
+        objects: dict[int, Model] = {}
+        for obj_id in ids:
+            obj: Model = self.get(obj_id=obj_id)
+            if obj is not None:
+                objects[obj.id] = obj
+        return objects
+
+    def clear(self) -> None:
+        """Сбрасывает кеш текущего процесса."""
+        with self._lock:
+            self._version = None
+        return
+
+    def invalidate(self) -> None:
+        """Помечает кеш устаревшим во всех процессах."""
+        bump_version(key=self._version_key)
+        self.clear()
+        return
+
+
+reference_caches: dict[type[Model], ReferenceCache] = {
+    model: ReferenceCache(model=model) for model in REFERENCE_MODELS
+}
@@ -0,0 +1,138 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from api.v1.payloads import (
+    DICTIONARIES_VERSION_KEY, SKILL_CATEGORIES_VERSION_KEY,
+    build_skill_categories, rebuild_payload,
+)
+from hakaton.cache_versions import bump_version
+from hakaton.on_commit import on_commit_batch
+from vacancy.autocomplete import city_autocomplete, skill_autocomplete
+from vacancy.models import (
+    City, Skill, SkillCategory, Vacancy, VacancyLanguage, VacancySkill,
+)
+from vacancy.reference_cache import REFERENCE_MODELS, reference_caches
+from vacancy.tasks import refresh_vacancies_matches_task
+
+
+def refresh_vacancies_matches(vacancy_ids: list[int]) -> None:
+    """
+    Ставит в очередь Celery одну задачу пересчета подходящих студентов
+    вакансий, измененных в транзакции.
+    """
+    refresh_vacancies_matches_task.delay(vacancy_ids=vacancy_ids)
+    return
+
+
+def schedule_vacancy_matches_refresh(vacancy_id: int) -> None:
+    """
+    Ставит в очередь Celery пересчет подходящих студентов вакансии
+    после коммита текущей транзакции. Вакансии, измененные в одной
+    транзакции, пересчитываются одной задачей по одному разу.
+    """
+    on_commit_batch(flush=refresh_vacancies_matches, values=(vacancy_id,))
+    return
+
+
+def schedule_vacancies_matches_refresh(vacancy_ids: list[int]) -> None:
+    """
+    Ставит в очередь Celery пересчет подходящих студентов нескольких
+    вакансий после коммита текущей транзакции.
+    Используется после bulk_create, при котором сигналы post_save
+    не отправляются.
+    """
+    on_commit_batch(flush=refresh_vacancies_matches, values=vacancy_ids)
+    return
+
+
+@receiver(post_save, sender=Vacancy)
+def vacancy_saved(sender, instance, **kwargs):
+    """Пересчитывает подходящих студентов после изменения вакансии."""
+    schedule_vacancy_matches_refresh(vacancy_id=instance.id)
+    return
+
+
+@receiver(pre_save, sender=VacancyLanguage)
+@receiver(pre_save, sender=VacancySkill)
+def vacancy_requirement_saving(sender, instance, **kwargs):
+    """
+    Пересчитывает подходящих студентов прежней вакансии, если строка
+    требования переносится к другой вакансии (например, через админку).
+    """
+    if instance._state.adding:
+        return
+    previous_vacancy_id: int = sender.objects.filter(
+        pk=instance.pk,
+    ).values_list('vacancy_id', flat=True).first()
+    if (previous_vacancy_id is not None
+            and previous_vacancy_id != instance.vacancy_id):
+        schedule_vacancy_matches_refresh(vacancy_id=previous_vacancy_id)
+    return
+
+
+@receiver(post_save, sender=VacancyLanguage)
+@receiver(post_save, sender=VacancySkill)
+@receiver(post_delete, sender=VacancyLanguage)
+@receiver(post_delete, sender=VacancySkill)
+def vacancy_requirement_changed(sender, instance, **kwargs):
+    """
+    Пересчитывает подходящих студентов после изменения
+    требований вакансии к языкам и навыкам.
+    """
+    schedule_vacancy_matches_refresh(vacancy_id=instance.vacancy_id)
+    return
+
+
+@receiver(post_save, sender=City)
+@receiver(post_delete, sender=City)
+def city_changed(sender, instance, **kwargs):
+    """Перестраивает индекс автодополнения городов после коммита."""
+    transaction.on_commit(city_autocomplete.invalidate)
+    return
+
+
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+def skill_changed(sender, instance, **kwargs):
+    """Перестраивает индекс автодополнения навыков после коммита."""
+    transaction.on_commit(skill_autocomplete.invalidate)
+    return
+
+
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+@receiver(post_save, sender=SkillCategory)
+@receiver(post_delete, sender=SkillCategory)
+def skill_category_changed(sender, instance, **kwargs):
+    """
+    Формирует заново сохраненный ответ списка навыков
+    по категориям после коммита.
+    """
+    transaction.on_commit(
+        lambda: rebuild_payload(
+            version_key=SKILL_CATEGORIES_VERSION_KEY,
+            build=build_skill_categories,
+        )
+    )
+    return
+
+
+def dictionary_changed(sender, instance, **kwargs):
+    """
+    Сбрасывает кеш справочника в памяти процесса и, после коммита,
+    во всех процессах, а также сохраненный ответ /dictionaries/.
+    """
+    # INFO: кеш текущего процесса сбрасывается сразу, чтобы изменения
+    #       были видны до коммита в рамках той же транзакции.
+    reference_caches[sender].clear()
+    transaction.on_commit(reference_caches[sender].invalidate)
+    transaction.on_commit(
+        lambda: bump_version(key=DICTIONARIES_VERSION_KEY)
+    )
+    return
+
+
+for dictionary_model in REFERENCE_MODELS:
+    post_save.connect(dictionary_changed, sender=dictionary_model)
+    post_delete.connect(dictionary_changed, sender=dictionary_model)
@@ -0,0 +1,35 @@
+"""
+Список задач для Celery.
+"""
+
+from celery import shared_task
+
+from student.matching import refresh_student_matches, refresh_vacancy_matches
+from vacancy.autocomplete import city_autocomplete, skill_autocomplete
+
+
+@shared_task
+def refresh_vacancies_matches_task(vacancy_ids: list[int]) -> None:
+    """Пересчитывает подходящих студентов нескольких вакансий."""
+    for vacancy_id in vacancy_ids:
+        refresh_vacancy_matches(vacancy_id=vacancy_id)
+    return
+
+
+@shared_task
+def refresh_students_matches_task(student_ids: list[int]) -> None:
+    """Пересчитывает подходящие вакансии нескольких студентов."""
+    for student_id in student_ids:
+        refresh_student_matches(student_id=student_id)
+    return
+
+
+@shared_task
+def update_autocomplete_popularity() -> None:
+    """
+    Пересчитывает популярность городов и навыков
+    для индексов автодополнения.
+    """
+    city_autocomplete.update_popularity()
+    skill_autocomplete.update_popularity()
+    return
@@ -0,0 +1,3 @@
+from django.utils.translation import gettext
+
+VACANCY_EXISTS_ERROR: str = gettext('Такая вакансия уже существует.')